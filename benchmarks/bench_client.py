@@ -0,0 +1,122 @@
+"""
+Offline benchmark suite of the main code paths of photos.py, collection.py and
+topics_stats.py against the local mock server (see server.py), which runs in a
+separate process.
+
+Reports requests/s, pages/s (items/s for iterators), p50/p99 latency per call or
+page and the peak memory allocated while running the scenario.
+
+Usage:
+    python -m benchmarks.bench_client [--calls 200] [--latency 0.002] [--jitter 0] [--error-rate 0]
+"""
+import argparse
+import statistics
+import time
+import tracemalloc
+
+from unsplashapi import RequestPolicy, UnsplashAPI
+
+from .server import MockProcess
+
+
+def percentile(values: list, fraction: float) -> float:
+    values = sorted(values)
+    return values[min(int(len(values) * fraction), len(values) - 1)]
+
+
+def scenarios(calls: int):
+    """
+    Returns (name, function) pairs; the functions yield once per call or page.
+    """
+    pages = max(calls // 10, 1)
+
+    def get_photo_by_id(api):
+        for index in range(calls):
+            yield api.get_photo_by_id(f'photo{index}')
+
+    def get_photos_by_ids(api):
+        photos, errors = api.get_photos_by_ids([f'bulk{index}' for index in range(calls)])
+        yield photos
+
+    def list_photos_paginate(api):
+        yield from api.list_photos_paginate(page_limit=pages, items_per_page=30)
+
+    def iter_photos(api):
+        yield from api.iter_photos(max_items=pages * 30)
+
+    def collection_photos(api):
+        yield from api.get_collection_photos('1580860', page_limit=pages, per_page=30)
+
+    def search_photos(api):
+        yield from api.search_photos('ocean', number_of_pages=pages, items_per_page=30)
+
+    def get_topics(api):
+        yield from api.get_topics('nature', number_of_pages=3, items_per_page=30)
+
+    def get_stats_total(api):
+        for _ in range(calls):
+            yield api.get_stats_total()
+
+    return [('photos.get_photo_by_id', get_photo_by_id), ('photos.get_photos_by_ids', get_photos_by_ids),
+            ('photos.list_photos_paginate', list_photos_paginate), ('photos.iter_photos', iter_photos),
+            ('collection.get_collection_photos', collection_photos), ('photos.search_photos', search_photos),
+            ('topics_stats.get_topics', get_topics), ('topics_stats.get_stats_total', get_stats_total)]
+
+
+def make_api(server: MockProcess) -> UnsplashAPI:
+    api = UnsplashAPI(access_key='dummy', policy=RequestPolicy(backoff=0.01, max_backoff=0.05))
+    api.base_url = server.url
+    return api
+
+
+def run(server: MockProcess, function) -> dict:
+    # Memory pass first, it also warms up the payloads of the server.
+    server.reset()
+    api = make_api(server)
+    tracemalloc.start()
+    for _ in function(api):
+        pass
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    server.reset()
+    api = make_api(server)
+    latencies = []
+    steps = 0
+    start = last = time.perf_counter()
+    for _ in function(api):
+        now = time.perf_counter()
+        latencies.append(now - last)
+        last = now
+        steps += 1
+    elapsed = time.perf_counter() - start
+    requests = server.requests
+
+    return {'requests/s': requests / elapsed, 'steps/s': steps / elapsed, 'requests': requests,
+            'p50 ms': percentile(latencies, 0.5) * 1e3, 'p99 ms': percentile(latencies, 0.99) * 1e3,
+            'mean ms': statistics.fmean(latencies) * 1e3, 'peak MiB': peak / 2 ** 20}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--calls', type=int, default=200, help='calls of single requests; pages are calls / 10')
+    parser.add_argument('--latency', type=float, default=0.002, help='server latency in seconds')
+    parser.add_argument('--jitter', type=float, default=0)
+    parser.add_argument('--error-rate', type=float, default=0)
+    parser.add_argument('--only', help='run scenarios containing this string')
+    args = parser.parse_args()
+
+    print(f'{"scenario":34} {"requests":>8} {"req/s":>9} {"steps/s":>9} {"p50 ms":>8} {"p99 ms":>8} '
+          f'{"peak MiB":>9}')
+    with MockProcess(latency=args.latency, jitter=args.jitter, error_rate=args.error_rate,
+                     rate_limit=10 ** 9) as server:
+        for name, function in scenarios(args.calls):
+            if args.only and args.only not in name:
+                continue
+            result = run(server, function)
+            print(f'{name:34} {result["requests"]:8d} {result["requests/s"]:9.1f} {result["steps/s"]:9.1f} '
+                  f'{result["p50 ms"]:8.2f} {result["p99 ms"]:8.2f} {result["peak MiB"]:9.2f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,42 @@
+"""
+Compares the memory held per photo record by raw decoded dictionaries and by
+the compact models in unsplashapi.models. Runs offline.
+
+Usage:
+    python -m benchmarks.bench_models [number_of_records]
+"""
+import json
+import sys
+import tracemalloc
+
+from unsplashapi.models import Photo
+
+from .payloads import make_photo
+
+
+def measure(build) -> int:
+    tracemalloc.start()
+    records = build()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del records
+    return size
+
+
+def main(n: int = 10000):
+    # Every record is decoded from its own JSON document, like responses from the API.
+    documents = [json.dumps(make_photo(i)) for i in range(n)]
+
+    raw = measure(lambda: [json.loads(document) for document in documents])
+    models = measure(lambda: [Photo.from_dict(json.loads(document)) for document in documents])
+    accessed = measure(lambda: [photo for photo in (Photo.from_dict(json.loads(document)) for document in documents)
+                                if photo.urls.small and photo.user.username])
+
+    print(f'records:                          {n}')
+    print(f'raw dict:                         {raw / n:8.0f} bytes/record')
+    print(f'Photo model:                      {models / n:8.0f} bytes/record ({models / raw:.0%})')
+    print(f'Photo model, nested accessed:     {accessed / n:8.0f} bytes/record ({accessed / raw:.0%})')
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:2]))
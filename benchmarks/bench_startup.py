@@ -0,0 +1,31 @@
+"""
+Measures the time it takes to construct an UnsplashAPI client and counts the
+HTTP requests sent during construction. Runs offline.
+
+Usage:
+    python -m benchmarks.bench_startup [number_of_clients]
+"""
+import sys
+import time
+from unittest import mock
+
+import requests
+
+from unsplashapi import UnsplashAPI
+
+
+def main(n: int = 1000):
+    with mock.patch.object(requests.adapters.HTTPAdapter, 'send') as send:
+        start = time.perf_counter()
+        for _ in range(n):
+            UnsplashAPI(access_key='dummy')
+        elapsed = time.perf_counter() - start
+
+    print(f'clients constructed:    {n}')
+    print(f'mean construction time: {elapsed / n * 1e6:.1f} us')
+    print(f'network calls:          {send.call_count}')
+    assert send.call_count == 0, 'Constructing the client must not send any request'
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:2]))
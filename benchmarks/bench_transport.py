@@ -0,0 +1,112 @@
+"""
+Compares the transports of the clients under concurrent load against the local mock
+server (see server.py): the default requests adapters (10 pooled connections per host),
+a TransportConfig sized for the number of threads, no keep-alive, and httpx with
+HTTP/1.1 and HTTP/2.
+
+Reports requests/s, p50/p99 latency per call and the number of connections the
+server accepted. The mock server speaks HTTP/1.1 only, HTTP/2 is measured with
+`--url` pointing to an HTTP/2 capable endpoint (requires h2).
+
+Usage:
+    python -m benchmarks.bench_transport [--calls 2000] [--workers 32] [--latency 0.002]
+"""
+import argparse
+import asyncio
+import time
+
+import requests
+
+from unsplashapi import AsyncUnsplashAPI, RequestPolicy, TransportConfig, UnsplashAPI
+from unsplashapi.transport import h2
+
+from .bench_client import percentile
+from .server import MockProcess
+
+
+class Timer:
+    """
+    Hook collecting the total time of every HTTP call.
+    """
+
+    def __init__(self):
+        self.latencies = []
+
+    def __call__(self, event):
+        if event.total is not None:
+            self.latencies.append(event.total)
+
+
+def run_sync(url: str, ids: list, workers: int, **kwargs) -> tuple:
+    timer = Timer()
+    api = UnsplashAPI(access_key='dummy', policy=RequestPolicy(backoff=0.01), hooks=[timer], **kwargs)
+    api.base_url = url
+    start = time.perf_counter()
+    photos, errors = api.get_photos_by_ids(ids, max_workers=workers)
+    elapsed = time.perf_counter() - start
+    api.session.close()
+
+    return elapsed, timer.latencies, len(errors)
+
+
+def run_async(url: str, ids: list, workers: int, transport: TransportConfig) -> tuple:
+    timer = Timer()
+
+    async def run():
+        async with AsyncUnsplashAPI(access_key='dummy', policy=RequestPolicy(backoff=0.01), hooks=[timer],
+                                    transport=transport) as api:
+            api.base_url = url
+            start = time.perf_counter()
+            photos, errors = await api.get_photos_by_ids(ids, max_workers=workers)
+            return time.perf_counter() - start, len(errors)
+
+    elapsed, errors = asyncio.run(run())
+
+    return elapsed, timer.latencies, errors
+
+
+def scenarios(workers: int, http2: bool) -> list:
+    """
+    Returns (name, function) pairs; the functions take (url, ids) and return (elapsed, latencies, errors).
+    """
+    result = [
+        ('requests default pool', lambda url, ids: run_sync(url, ids, workers, session=requests.Session())),
+        (f'requests pool {workers}', lambda url, ids: run_sync(url, ids, workers,
+                                                               transport=TransportConfig(pool_maxsize=workers))),
+        ('requests no keep-alive', lambda url, ids: run_sync(url, ids, workers,
+                                                             transport=TransportConfig(keepalive=False))),
+        ('httpx http/1.1', lambda url, ids: run_async(url, ids, workers, TransportConfig(max_connections=workers))),
+    ]
+    if http2:
+        result.append(('httpx http/2', lambda url, ids: run_async(url, ids, workers, TransportConfig(http2=True))))
+
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--calls', type=int, default=2000, help='photos fetched per scenario')
+    parser.add_argument('--workers', type=int, default=32, help='concurrent requests')
+    parser.add_argument('--latency', type=float, default=0.002, help='server latency in seconds')
+    parser.add_argument('--url', help='endpoint to benchmark instead of the mock server, e.g. an HTTP/2 proxy')
+    args = parser.parse_args()
+
+    http2 = h2 is not None and args.url is not None
+    if not http2:
+        print('httpx http/2 skipped: requires h2 and an HTTP/2 endpoint (--url)')
+    print(f'{"transport":26} {"requests":>8} {"req/s":>9} {"p50 ms":>8} {"p99 ms":>8} {"connections":>11} '
+          f'{"errors":>6}')
+    with MockProcess(latency=args.latency, rate_limit=10 ** 9) as server:
+        for run_index, (name, function) in enumerate(scenarios(args.workers, http2)):
+            server.reset()
+            # Distinct IDs per scenario, so no response is served from a warm cache
+            ids = [f'transport{run_index}-{index}' for index in range(args.calls)]
+            elapsed, latencies, errors = function(args.url or server.url, ids)
+            connections = server.connections if args.url is None else float('nan')
+            print(f'{name:26} {len(latencies):8d} {len(latencies) / elapsed:9.1f} '
+                  f'{percentile(latencies, 0.5) * 1e3:8.2f} {percentile(latencies, 0.99) * 1e3:8.2f} '
+                  f'{connections:11} {errors:6d}')
+
+
+if __name__ == '__main__':
+    main()
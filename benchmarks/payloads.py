@@ -0,0 +1,86 @@
+"""
+Synthetic API payloads with the shape and size of real Unsplash responses.
+"""
+import random
+import string
+
+
+def _text(rng: random.Random, words: int) -> str:
+    return ' '.join(''.join(rng.choices(string.ascii_lowercase, k=rng.randint(3, 9))) for _ in range(words))
+
+
+def _id(rng: random.Random) -> str:
+    return ''.join(rng.choices(string.ascii_letters + string.digits + '-_', k=11))
+
+
+def make_user(rng: random.Random) -> dict:
+    username = ''.join(rng.choices(string.ascii_lowercase, k=10))
+    links = {name: f'https://api.unsplash.com/users/{username}/{name}' for name in
+             ('self', 'html', 'photos', 'likes', 'portfolio', 'following', 'followers')}
+    return {
+        'id': _id(rng), 'updated_at': '2022-04-15T13:02:41-04:00', 'username': username,
+        'name': _text(rng, 2), 'first_name': _text(rng, 1), 'last_name': _text(rng, 1),
+        'twitter_username': username, 'portfolio_url': f'https://{username}.com', 'bio': _text(rng, 20),
+        'location': _text(rng, 2), 'links': links,
+        'profile_image': {size: f'https://images.unsplash.com/profile-{_id(rng)}?ixlib=rb-1.2.1&w={w}&h={w}'
+                          for size, w in (('small', 32), ('medium', 64), ('large', 128))},
+        'instagram_username': username, 'total_collections': rng.randint(0, 50),
+        'total_likes': rng.randint(0, 5000), 'total_photos': rng.randint(0, 2000),
+        'accepted_tos': True, 'for_hire': False,
+        'social': {'instagram_username': username, 'portfolio_url': None, 'twitter_username': username,
+                   'paypal_email': None},
+    }
+
+
+def make_photo(index: int = 0, seed: int = None) -> dict:
+    """
+    Returns a photo payload as returned by /photos/:id (about 3-4 KB of JSON).
+    """
+    rng = random.Random(index if seed is None else seed)
+    photo_id = _id(rng)
+    base = f'https://images.unsplash.com/photo-{rng.randint(10 ** 12, 10 ** 13)}-{_id(rng)}'
+    return {
+        'id': photo_id, 'created_at': '2018-01-13T16:36:34-05:00', 'updated_at': '2022-04-15T13:02:41-04:00',
+        'promoted_at': '2018-01-14T20:42:18-05:00', 'width': rng.randint(2000, 6000),
+        'height': rng.randint(2000, 6000), 'color': '#%06x' % rng.randint(0, 0xFFFFFF),
+        'blur_hash': _id(rng) * 2, 'description': _text(rng, 12), 'alt_description': _text(rng, 8),
+        'urls': {'raw': f'{base}?ixid={_id(rng)}', 'full': f'{base}?ixid={_id(rng)}&q=85&fm=jpg',
+                 'regular': f'{base}?ixid={_id(rng)}&w=1080', 'small': f'{base}?ixid={_id(rng)}&w=400',
+                 'thumb': f'{base}?ixid={_id(rng)}&w=200'},
+        'links': {name: f'https://api.unsplash.com/photos/{photo_id}/{name}' for name in
+                  ('self', 'html', 'download', 'download_location')},
+        'categories': [], 'likes': rng.randint(0, 10000), 'liked_by_user': False,
+        'current_user_collections': [], 'sponsorship': None, 'topic_submissions': {},
+        'user': make_user(rng),
+        'exif': {'make': 'Canon', 'model': 'Canon EOS 5D Mark III', 'name': 'Canon, EOS 5D Mark III',
+                 'exposure_time': '1/250', 'aperture': '4.0', 'focal_length': '50.0', 'iso': 100},
+        'location': {'title': _text(rng, 3), 'name': _text(rng, 3), 'city': _text(rng, 1),
+                     'country': _text(rng, 1), 'position': {'latitude': rng.uniform(-90, 90),
+                                                            'longitude': rng.uniform(-180, 180)}},
+        'views': rng.randint(0, 10 ** 7), 'downloads': rng.randint(0, 10 ** 5),
+    }
+
+
+def make_collection(index: int = 0) -> dict:
+    rng = random.Random(index)
+    return {
+        'id': str(rng.randint(10 ** 5, 10 ** 7)), 'title': _text(rng, 3), 'description': _text(rng, 10),
+        'published_at': '2018-01-13T16:36:34-05:00', 'last_collected_at': '2022-04-15T13:02:41-04:00',
+        'updated_at': '2022-04-15T13:02:41-04:00', 'featured': False, 'total_photos': rng.randint(1, 500),
+        'private': False, 'share_key': _id(rng) * 3, 'tags': [{'type': 'search', 'title': _text(rng, 1)}],
+        'links': {}, 'user': make_user(rng), 'cover_photo': make_photo(seed=index + 10 ** 6),
+        'preview_photos': [],
+    }
+
+
+def make_topic(index: int = 0) -> dict:
+    rng = random.Random(index)
+    slug = _text(rng, 1)
+    return {
+        'id': _id(rng), 'slug': slug, 'title': slug.title(), 'description': _text(rng, 15),
+        'published_at': '2020-05-27T19:45:40-04:00', 'updated_at': '2022-04-15T13:02:41-04:00',
+        'starts_at': '2020-06-01T00:00:00-04:00', 'ends_at': None, 'only_submissions_after': None,
+        'featured': True, 'total_photos': rng.randint(1000, 9000), 'current_user_contributions': [],
+        'total_current_user_submissions': None, 'links': {}, 'status': 'open', 'owners': [],
+        'cover_photo': make_photo(seed=index + 2 * 10 ** 6), 'preview_photos': [],
+    }
@@ -0,0 +1,480 @@
+"""
+Local stand-in for the Unsplash API with realistic payloads (see payloads.py),
+pagination, rate limit headers, ETags and injectable latency and errors.
+
+Usage:
+    with MockUnsplash(latency=0.01) as server:
+        api = UnsplashAPI(access_key='dummy')
+        api.base_url = server.url
+        ...
+
+    python -m benchmarks.server [--port 8000] [--latency 0.05] [--error-rate 0.01]
+"""
+import argparse
+import hashlib
+import json
+import math
+import multiprocessing
+import random
+import re
+import threading
+import time
+from functools import lru_cache
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlencode, urlsplit
+from urllib.request import urlopen
+
+from .payloads import make_collection, make_photo, make_topic, make_user
+
+
+photo = lru_cache(maxsize=None)(make_photo)
+collection = lru_cache(maxsize=None)(make_collection)
+topic = lru_cache(maxsize=None)(make_topic)
+
+
+@lru_cache(maxsize=None)
+def user(username: str) -> dict:
+    data = make_user(random.Random(username))
+    data['username'] = username
+    return data
+
+
+def photo_statistics(photo_id: str) -> dict:
+    history = {'change': 1200, 'resolution': 'days', 'quantity': 30,
+               'values': [{'date': f'2022-04-{day:02d}', 'value': 40} for day in range(1, 31)]}
+    return {'id': photo_id, 'downloads': {'total': 1200, 'historical': history},
+            'views': {'total': 56000, 'historical': history}, 'likes': {'total': 310, 'historical': history}}
+
+
+STATS_TOTAL = {'photos': 3860000, 'downloads': 2890000000, 'views': 1310000000000, 'likes': 21600000,
+               'photographers': 281000, 'pixels': 57500000000000, 'downloads_per_second': 31,
+               'views_per_second': 8700, 'developers': 150000, 'applications': 3400, 'requests': 4590000000}
+STATS_MONTH = {'downloads': 93000000, 'views': 31800000000, 'likes': 690000, 'new_photos': 110000,
+               'new_photographers': 9300, 'new_pixels': 1720000000000, 'new_developers': 2800,
+               'new_applications': 110, 'new_requests': 110000000}
+
+
+class MockUnsplash:
+    """
+    Local HTTP server implementing the endpoints wrapped by the package.
+
+    Args:
+        total (int, optional):          Number of items of every list endpoint. Defaults to 10000.
+        latency (float, optional):      Seconds every response is delayed. Defaults to 0.
+        jitter (float, optional):       Additional uniformly distributed delay in seconds. Defaults to 0.
+        error_rate (float, optional):   Probability of answering with `error_status`. Defaults to 0.
+        error_status (int, optional):   Status of injected errors. Defaults to 503.
+        rate_limit (int, optional):     Requests per window before answering with 403. Defaults to 5000.
+        window (float, optional):       Length of the rate limit window in seconds. Defaults to 3600.
+        seed (int, optional):           Seed of latency jitter and injected errors. Defaults to 0.
+    """
+
+    def __init__(self, total: int = 10000, latency: float = 0, jitter: float = 0, error_rate: float = 0,
+                 error_status: int = 503, rate_limit: int = 5000, window: float = 3600, seed: int = 0,
+                 host: str = '127.0.0.1', port: int = 0) -> None:
+        self.total = total
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.rate_limit = rate_limit
+        self.window = window
+        self.random = random.Random(seed)
+        self.requests = 0
+        self.connections = 0
+        self.lock = threading.Lock()
+        self._fail = []
+        self._window_started = time.monotonic()
+        self._used = 0
+        self.server = ThreadingHTTPServer((host, port), type('Handler', (Handler,), {'mock': self}))
+        self.server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        host, port = self.server.server_address[:2]
+        return f'http://{host}:{port}/'
+
+    def fail_next(self, count: int = 1, status: int = 503) -> None:
+        """
+        Answers the next `count` requests with `status`.
+        """
+        with self.lock:
+            self._fail.extend([status] * count)
+
+    def reset(self) -> None:
+        with self.lock:
+            self.requests = 0
+            self.connections = 0
+            self._used = 0
+            self._fail = []
+            self._window_started = time.monotonic()
+
+    def start(self):
+        self._thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def admit(self, new_connection: bool = False):
+        """
+        Counts a request against the rate limit. Returns (status or None, remaining, delay).
+        """
+        with self.lock:
+            self.requests += 1
+            self.connections += new_connection
+            now = time.monotonic()
+            if now - self._window_started >= self.window:
+                self._window_started, self._used = now, 0
+            delay = self.latency + (self.random.uniform(0, self.jitter) if self.jitter else 0)
+            if self._used >= self.rate_limit:
+                return 403, 0, delay
+            self._used += 1
+            remaining = self.rate_limit - self._used
+            if self._fail:
+                return self._fail.pop(0), remaining, delay
+            if self.error_rate and self.random.random() < self.error_rate:
+                return self.error_status, remaining, delay
+
+        return None, remaining, delay
+
+
+def _page(query: dict, total: int):
+    per_page = max(1, min(int(query.get('per_page', 10)), 30))
+    page = max(1, int(query.get('page', 1)))
+    start = (page - 1) * per_page
+
+    return page, per_page, range(start, min(start + per_page, total))
+
+
+class Handler(BaseHTTPRequestHandler):
+    """
+    Routes the requests of MockUnsplash. `mock` is set on the subclass created per server.
+    """
+    mock = None
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+    routes = []
+    # Whether a request was served on the connection of this handler
+    served = False
+
+    def log_message(self, *args) -> None:
+        pass
+
+    def do_GET(self) -> None:
+        self.handle_request()
+
+    def do_POST(self) -> None:
+        self.handle_request()
+
+    def do_PUT(self) -> None:
+        self.handle_request()
+
+    def do_DELETE(self) -> None:
+        self.handle_request()
+
+    def handle_request(self) -> None:
+        length = int(self.headers.get('Content-Length') or 0)
+        if length:
+            self.rfile.read(length)
+        if self.path.startswith('/__mock__/'):
+            return self.control()
+        status, remaining, delay = self.mock.admit(new_connection=not self.served)
+        self.served = True
+        if delay:
+            time.sleep(delay)
+        headers = {'X-Ratelimit-Limit': str(self.mock.rate_limit), 'X-Ratelimit-Remaining': str(remaining)}
+        if status is not None:
+            body = 'Rate Limit Exceeded' if status == 403 else json.dumps({'errors': ['Injected error']})
+            return self.respond(status, body.encode(), headers)
+
+        url = urlsplit(self.path)
+        query = {name: values[-1] for name, values in parse_qs(url.query).items()}
+        for method, pattern, route in self.routes:
+            match = re.fullmatch(pattern, url.path)
+            if match and method == self.command:
+                result = route(self, query, *match.groups())
+                break
+        else:
+            result = {'errors': ['Not found']}, 404
+
+        data, status = result if isinstance(result, tuple) else (result, 200)
+        if isinstance(data, PagedResult):
+            headers.update(data.headers(url.path, query))
+            data = data.items
+        body = json.dumps(data).encode() if data is not None else b''
+        if status == 200 and self.command == 'GET':
+            etag = '"' + hashlib.md5(body).hexdigest() + '"'
+            headers['ETag'] = etag
+            if self.headers.get('If-None-Match') == etag:
+                return self.respond(304, b'', headers)
+        self.respond(status, body, headers)
+
+    def control(self) -> None:
+        """
+        Control endpoints, which are not counted: /__mock__/stats and /__mock__/reset.
+        """
+        if self.path == '/__mock__/reset':
+            self.mock.reset()
+        self.respond(200, json.dumps({'requests': self.mock.requests, 'connections': self.mock.connections}).encode(),
+                     {})
+
+    def respond(self, status: int, body: bytes, headers: dict) -> None:
+        self.send_response(status)
+        if body:
+            self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    # Routes
+
+    def list_of(self, query: dict, factory, total: int = None) -> 'PagedResult':
+        total = self.mock.total if total is None else total
+        page, per_page, indices = _page(query, total)
+        return PagedResult([factory(index) for index in indices], total, page, per_page)
+
+    def search(self, query: dict, factory) -> dict:
+        total = self.mock.total
+        page, per_page, indices = _page(query, total)
+        offset = int(hashlib.md5(query.get('query', '').encode()).hexdigest()[:6], 16)
+        return {'total': total, 'total_pages': math.ceil(total / per_page),
+                'results': [factory(offset + index) for index in indices]}
+
+    def status(self, query):
+        return {'status': 'ok'}
+
+    def photos(self, query):
+        return self.list_of(query, photo)
+
+    def random_photo(self, query):
+        if 'count' in query:
+            return [photo(self.mock.random.randrange(self.mock.total)) for _ in range(int(query['count']))]
+        return photo(self.mock.random.randrange(self.mock.total))
+
+    def get_photo(self, query, photo_id):
+        return dict(photo(_index(photo_id)), id=photo_id)
+
+    def statistics(self, query, photo_id):
+        return photo_statistics(photo_id)
+
+    def download(self, query, photo_id):
+        return {'url': photo(_index(photo_id))['urls']['full']}
+
+    def update_photo(self, query, photo_id):
+        return dict(photo(_index(photo_id)), id=photo_id)
+
+    def like(self, query, photo_id):
+        return {'photo': dict(photo(_index(photo_id)), id=photo_id), 'user': user('me')}
+
+    def collections(self, query):
+        return self.list_of(query, collection)
+
+    def get_collection(self, query, collection_id):
+        return dict(collection(_index(collection_id)), id=collection_id)
+
+    def collection_photos(self, query, collection_id):
+        return self.list_of(query, lambda index: photo(_index(collection_id) + index),
+                            total=min(self.mock.total, 500))
+
+    def related(self, query, collection_id):
+        return [collection(_index(collection_id) + index) for index in range(1, 4)]
+
+    def write_collection(self, query, collection_id=None):
+        return dict(collection(_index(collection_id or 'new')), title=query.get('title', 'new')), 201
+
+    def delete_collection(self, query, collection_id):
+        return None, 204
+
+    def search_photos(self, query):
+        return self.search(query, photo)
+
+    def search_collections(self, query):
+        return self.search(query, collection)
+
+    def search_users(self, query):
+        return self.search(query, lambda index: user(f'user{index}'))
+
+    def topics(self, query):
+        return self.list_of(query, topic, total=min(self.mock.total, 100))
+
+    def get_topic(self, query, topic_id):
+        return dict(topic(_index(topic_id)), slug=topic_id)
+
+    def topic_photos(self, query, topic_id):
+        return self.list_of(query, lambda index: photo(_index(topic_id) + index))
+
+    def stats_total(self, query):
+        return STATS_TOTAL
+
+    def stats_month(self, query):
+        return STATS_MONTH
+
+    def me(self, query):
+        return user('me')
+
+    def get_user(self, query, username):
+        return user(username)
+
+    def portfolio(self, query, username):
+        return {'url': user(username)['portfolio_url']}
+
+    def user_photos(self, query, username):
+        return self.list_of(query, lambda index: photo(_index(username) + index), total=200)
+
+    def user_collections(self, query, username):
+        return self.list_of(query, lambda index: collection(_index(username) + index), total=20)
+
+    def user_statistics(self, query, username):
+        return dict(photo_statistics(username), username=username)
+
+
+class PagedResult:
+    """
+    Items of a list endpoint with the pagination headers (X-Total, X-Per-Page, Link).
+    """
+
+    def __init__(self, items: list, total: int, page: int, per_page: int) -> None:
+        self.items = items
+        self.total = total
+        self.page = page
+        self.per_page = per_page
+
+    def headers(self, path: str, query: dict) -> dict:
+        last = max(1, math.ceil(self.total / self.per_page))
+        relations = {'first': 1, 'prev': self.page - 1, 'next': self.page + 1, 'last': last}
+        links = [f'<https://api.unsplash.com{path}?{urlencode(dict(query, page=page))}>; rel="{name}"'
+                 for name, page in relations.items() if 1 <= page <= last and page != self.page]
+
+        return {'X-Total': str(self.total), 'X-Per-Page': str(self.per_page), 'Link': ', '.join(links)}
+
+
+def _index(identifier: str) -> int:
+    return int(hashlib.md5(str(identifier).encode()).hexdigest()[:6], 16)
+
+
+ID = '([^/]+)'
+Handler.routes = [
+    ('GET', '/', Handler.status),
+    ('GET', '/photos', Handler.photos),
+    ('GET', '/photos/random', Handler.random_photo),
+    ('GET', f'/photos/{ID}', Handler.get_photo),
+    ('GET', f'/photos/{ID}/statistics', Handler.statistics),
+    ('GET', f'/photos/{ID}/download', Handler.download),
+    ('PUT', f'/photos/{ID}', Handler.update_photo),
+    ('POST', f'/photos/{ID}/like', Handler.like),
+    ('DELETE', f'/photos/{ID}/like', Handler.like),
+    ('GET', '/collections', Handler.collections),
+    ('POST', '/collections', Handler.write_collection),
+    ('GET', f'/collections/{ID}', Handler.get_collection),
+    ('PUT', f'/collections/{ID}', Handler.write_collection),
+    ('DELETE', f'/collections/{ID}', Handler.delete_collection),
+    ('GET', f'/collections/{ID}/photos', Handler.collection_photos),
+    ('GET', f'/collections/{ID}/related', Handler.related),
+    ('POST', f'/collections/{ID}/add', Handler.write_collection),
+    ('DELETE', f'/collections/{ID}/remove', Handler.write_collection),
+    ('GET', '/search/photos', Handler.search_photos),
+    ('GET', '/search/collections', Handler.search_collections),
+    ('GET', '/search/users', Handler.search_users),
+    ('GET', '/topics', Handler.topics),
+    ('GET', f'/topics/{ID}', Handler.get_topic),
+    ('GET', f'/topics/{ID}/photos', Handler.topic_photos),
+    ('GET', '/stats/total', Handler.stats_total),
+    ('GET', '/stats/month', Handler.stats_month),
+    ('GET', '/me', Handler.me),
+    ('GET', f'/users/{ID}', Handler.get_user),
+    ('GET', f'/users/{ID}/portfolio', Handler.portfolio),
+    ('GET', f'/users/{ID}/photos', Handler.user_photos),
+    ('GET', f'/users/{ID}/likes', Handler.user_photos),
+    ('GET', f'/users/{ID}/collections', Handler.user_collections),
+    ('GET', f'/users/{ID}/statistics', Handler.user_statistics),
+]
+
+
+def _serve(kwargs: dict, ports) -> None:
+    server = MockUnsplash(**kwargs)
+    ports.put(server.server.server_address[1])
+    server.server.serve_forever()
+
+
+class MockProcess:
+    """
+    Runs MockUnsplash in a separate process, so the server neither competes with the
+    client for the GIL nor shows up in its memory measurements. Has the interface
+    of MockUnsplash used by the benchmarks (url, requests, reset, context manager).
+    """
+
+    def __init__(self, **kwargs) -> None:
+        self.kwargs = kwargs
+        self.process = None
+        self.port = None
+
+    @property
+    def url(self) -> str:
+        return f'http://127.0.0.1:{self.port}/'
+
+    def _control(self, name: str) -> dict:
+        with urlopen(f'{self.url}__mock__/{name}') as response:
+            return json.load(response)
+
+    @property
+    def requests(self) -> int:
+        return self._control('stats')['requests']
+
+    @property
+    def connections(self) -> int:
+        return self._control('stats')['connections']
+
+    def reset(self) -> None:
+        self._control('reset')
+
+    def start(self):
+        ports = multiprocessing.Queue()
+        self.process = multiprocessing.Process(target=_serve, args=(self.kwargs, ports), daemon=True)
+        self.process.start()
+        self.port = ports.get(timeout=30)
+        return self
+
+    def stop(self) -> None:
+        self.process.terminate()
+        self.process.join()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--total', type=int, default=10000)
+    parser.add_argument('--latency', type=float, default=0)
+    parser.add_argument('--jitter', type=float, default=0)
+    parser.add_argument('--error-rate', type=float, default=0)
+    parser.add_argument('--rate-limit', type=int, default=5000)
+    args = parser.parse_args()
+
+    server = MockUnsplash(total=args.total, latency=args.latency, jitter=args.jitter, error_rate=args.error_rate,
+                          rate_limit=args.rate_limit, port=args.port)
+    print(f'Serving on {server.url}')
+    try:
+        server.server.serve_forever()
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == '__main__':
+    main()
@@ -15,6 +15,8 @@ setup(
     long_description=LONG_DESCRIPTION,
     packages=find_packages(),
     install_requires=['requests'],
+    extras_require={'async': ['httpx'], 'http2': ['httpx[http2]'], 'zstd': ['zstandard'],
+                    'parquet': ['pyarrow']},
     keywords=['python', 'api', 'unsplash api', 'unsplash'],
     python_requires='>=3',
     classifiers=[
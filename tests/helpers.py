@@ -0,0 +1,28 @@
+"""
+Helpers shared by the offline tests.
+"""
+import json as json_module
+from unittest import mock
+
+import requests
+
+from unsplashapi import UnsplashAPI
+
+
+def make_response(status_code=200, json=None, headers=None):
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = (json_module.dumps(json) if json is not None else '').encode()
+    response.headers.update(headers or {})
+    return response
+
+
+def stubbed_api(test, request, **kwargs):
+    """
+    Returns an UnsplashAPI whose HTTP calls are answered by `request(method, url, params=None, **kwargs)`
+    until the end of `test`.
+    """
+    patcher = mock.patch.object(requests.Session, 'request', side_effect=request)
+    patcher.start()
+    test.addCleanup(patcher.stop)
+    return UnsplashAPI(access_key='dummy', **kwargs)
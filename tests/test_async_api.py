@@ -0,0 +1,72 @@
+import asyncio
+import unittest
+
+import httpx
+
+from unsplashapi import AsyncUnsplashAPI
+
+
+def make_api(handler):
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return AsyncUnsplashAPI(access_key='dummy', client=client)
+
+
+class TestAsyncUnsplashAPI(unittest.TestCase):
+    """
+    Offline tests for the asynchronous client against a mocked transport.
+    """
+
+    def test_get_photo_by_id(self):
+        def handler(request):
+            self.assertEqual('/photos/abc', request.url.path)
+            self.assertEqual('dummy', request.url.params['client_id'])
+            return httpx.Response(200, json={'id': 'abc'})
+
+        async def run():
+            async with make_api(handler) as api:
+                return await api.get_photo_by_id('abc')
+
+        self.assertEqual({'id': 'abc'}, asyncio.run(run()))
+
+    def test_search_photos_is_async_generator(self):
+        def handler(request):
+            return httpx.Response(200, json={'total_pages': 5, 'results': [{'id': request.url.params['page']}]})
+
+        async def run():
+            async with make_api(handler) as api:
+                return [page async for page in api.search_photos(query='ocean', number_of_pages=3)]
+
+        self.assertEqual(3, len(asyncio.run(run())))
+
+    def test_error_status_raises(self):
+        async def run():
+            async with make_api(lambda request: httpx.Response(404)) as api:
+                await api.get_stats_total()
+
+        with self.assertRaises(Exception):
+            asyncio.run(run())
+
+    def test_concurrent_requests(self):
+        async def handler(request):
+            await asyncio.sleep(0.05)
+            return httpx.Response(200, json={'id': request.url.path.split('/')[-1]})
+
+        async def run():
+            async with make_api(handler) as api:
+                return await asyncio.gather(*(api.get_photo_by_id(str(i)) for i in range(100)))
+
+        results = asyncio.run(run())
+        self.assertEqual([str(i) for i in range(100)], [photo['id'] for photo in results])
+
+    def test_iter_user_photos(self):
+        def handler(request):
+            self.assertEqual('30', request.url.params['per_page'])
+            self.assertEqual('popular', request.url.params['order_by'])
+            page = int(request.url.params['page'])
+            return httpx.Response(200, json=[{'id': f'{page}-{index}'} for index in range(30 if page < 3 else 0)])
+
+        async def run():
+            async with make_api(handler) as api:
+                return [photo['id'] async for photo in api.iter_user_photos('someone', order_by='popular')]
+
+        self.assertEqual(60, len(set(asyncio.run(run()))))
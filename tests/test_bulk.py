@@ -0,0 +1,195 @@
+import asyncio
+import threading
+import time
+import unittest
+from unittest import mock
+
+import httpx
+import requests
+
+from unsplashapi import AsyncUnsplashAPI, MemoryCache, UnsplashAPI
+from unsplashapi.bulk import membership_diff, run_bulk
+from unsplashapi.exceptions import RateLimitExceeded, UnsplashHTTPError
+
+from .helpers import make_response
+
+
+class TestBulk(unittest.TestCase):
+    """
+    Offline tests for bulk requests.
+    """
+
+    def test_run_bulk_bounded_and_complete(self):
+        lock = threading.Lock()
+        state = dict(active=0, peak=0)
+
+        def func(item):
+            with lock:
+                state['active'] += 1
+                state['peak'] = max(state['peak'], state['active'])
+            time.sleep(0.005)
+            with lock:
+                state['active'] -= 1
+            if item == 7:
+                raise ValueError(item)
+            return item * 2
+
+        results = {item: (result, error) for item, result, error in run_bulk(func, range(50), max_workers=4)}
+        self.assertEqual(50, len(results))
+        self.assertLessEqual(state['peak'], 4)
+        self.assertEqual((20, None), results[10])
+        self.assertIsInstance(results[7][1], ValueError)
+
+    def test_get_photos_by_ids(self):
+        def request(method, url, params=None, **kwargs):
+            photo_id = url.rsplit('/', 1)[-1]
+            if photo_id == 'missing':
+                return make_response(404)
+            return make_response(json={'id': photo_id})
+
+        api = UnsplashAPI(access_key='dummy', cache=MemoryCache())
+        with mock.patch.object(requests.Session, 'request', side_effect=request) as session_request:
+            api.get_photo_by_id('a')
+            photos, errors = api.get_photos_by_ids(['a', 'b', 'c', 'b', 'missing', 'c'])
+        self.assertEqual({'a', 'b', 'c'}, set(photos))
+        self.assertIsInstance(errors['missing'], UnsplashHTTPError)
+        # 'a' is served from the cache, duplicates are fetched once
+        self.assertEqual(4, session_request.call_count)
+
+    def test_no_requests_without_budget(self):
+        response = make_response(json={'id': 'a'}, headers={'X-Ratelimit-Remaining': '0'})
+        api = UnsplashAPI(access_key='dummy', cache=MemoryCache())
+        with mock.patch.object(requests.Session, 'request', return_value=response) as session_request:
+            api.get_photo_by_id('a')
+            photos, errors = api.get_photos_by_ids(['a', 'b', 'c'])
+        self.assertEqual(['a'], list(photos))
+        self.assertIsInstance(errors['b'], RateLimitExceeded)
+        self.assertEqual(1, session_request.call_count)
+
+    def test_async_get_photos_by_ids(self):
+        def handler(request):
+            return httpx.Response(200, json={'id': request.url.path.rsplit('/', 1)[-1]})
+
+        async def run():
+            client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            async with AsyncUnsplashAPI(access_key='dummy', client=client) as api:
+                return await api.get_photos_by_ids([str(i % 10) for i in range(100)])
+
+        photos, errors = asyncio.run(run())
+        self.assertEqual(10, len(photos))
+        self.assertEqual({}, errors)
+
+
+class CollectionStub:
+    """
+    Answers the collection endpoints from an in-memory set of photo IDs.
+    """
+
+    def __init__(self, photo_ids, failing=()):
+        self.photo_ids = list(photo_ids)
+        self.failing = set(failing)
+        self.calls = []
+        self.title = 'Ocean'
+
+    def __call__(self, method, url, params=None, **kwargs):
+        action = url.rsplit('/', 1)[-1]
+        self.calls.append((method, action))
+        if action == 'photos':
+            start = (params['page'] - 1) * params['per_page']
+            page = self.photo_ids[start:start + params['per_page']]
+            return make_response(json=[{'id': photo_id, 'likes': 1} for photo_id in page])
+        if action not in ('add', 'remove'):
+            self.title = params.get('title', self.title)
+            return make_response(json={'id': action, 'title': self.title})
+        if params['photo_id'] in self.failing:
+            return make_response(403)
+        if action == 'add':
+            self.photo_ids.append(params['photo_id'])
+        else:
+            self.photo_ids.remove(params['photo_id'])
+        return make_response(201, json={'photo': {'id': params['photo_id']}})
+
+
+class TestSyncCollection(unittest.TestCase):
+    """
+    Offline tests for synchronizing the photos of a collection.
+    """
+
+    def test_membership_diff(self):
+        self.assertEqual((['d', 'e'], ['a']), membership_diff(['a', 'b', 'c', 'b'], ['b', 'c', 'd', 'd', 'e']))
+        self.assertEqual(([], []), membership_diff(['a'], ['a']))
+
+    def test_sync_only_sends_changes(self):
+        current = [f'p{index}' for index in range(60)]
+        desired = current[5:] + ['new1', 'new2']
+        stub = CollectionStub(current)
+        api = UnsplashAPI(access_key='dummy', prefetch_pages=1)
+        with mock.patch.object(requests.Session, 'request', side_effect=stub):
+            result = api.sync_collection('c1', desired)
+        self.assertTrue(result.ok)
+        self.assertEqual(['new1', 'new2'], sorted(result.added))
+        self.assertEqual(current[:5], sorted(result.removed))
+        self.assertEqual(55, result.unchanged)
+        self.assertEqual(sorted(desired), sorted(stub.photo_ids))
+        # 2 pages of 30 photos, the empty page ending the listing and one request per change
+        self.assertEqual(3 + 7, len(stub.calls))
+
+    def test_sync_bypasses_and_invalidates_cache(self):
+        stub = CollectionStub(['a', 'b'])
+        api = UnsplashAPI(access_key='dummy', cache=MemoryCache())
+        with mock.patch.object(requests.Session, 'request', side_effect=stub):
+            self.assertEqual(['a', 'b'], [photo['id'] for photo in api.iter_collection_photos('c1')])
+            stub.photo_ids.append('c')
+            result = api.sync_collection('c1', ['a', 'd'])
+            self.assertEqual((['d'], ['b', 'c']), (result.added, sorted(result.removed)))
+            self.assertEqual(['a', 'd'], [photo['id'] for photo in api.iter_collection_photos('c1')])
+
+    def test_mutations_invalidate_cache(self):
+        stub = CollectionStub(['a'], failing=['x'])
+        api = UnsplashAPI(access_key='dummy', cache=MemoryCache())
+
+        def photo_ids():
+            return [photo['id'] for photo in api.iter_collection_photos('c1')]
+
+        with mock.patch.object(requests.Session, 'request', side_effect=stub):
+            self.assertEqual('Ocean', api.get_collection_by_id('c1')['title'])
+            self.assertEqual(['a'], photo_ids())
+            api.add_photo_to_collection('c1', 'b')
+            self.assertEqual(['a', 'b'], photo_ids())
+            api.remove_photo_from_collection('c1', 'a')
+            self.assertEqual(['b'], photo_ids())
+            api.update_collection('c1', title='Sea')
+            self.assertEqual('Sea', api.get_collection_by_id('c1')['title'])
+            # A failed mutation drops the cached responses too, its effect is unknown
+            photo_ids()
+            with self.assertRaises(UnsplashHTTPError):
+                api.add_photo_to_collection('c1', 'x')
+            self.assertEqual(0, len(api.cache))
+
+    def test_sync_reports_partial_failures(self):
+        stub = CollectionStub(['a', 'b'], failing=['b', 'c'])
+        api = UnsplashAPI(access_key='dummy')
+        with mock.patch.object(requests.Session, 'request', side_effect=stub):
+            result = api.sync_collection('c1', ['a', 'c', 'd'])
+        self.assertFalse(result.ok)
+        self.assertEqual(['d'], result.added)
+        self.assertEqual({'b', 'c'}, set(result.errors))
+        self.assertIsInstance(result.errors['c'], UnsplashHTTPError)
+
+    def test_async_sync_collection(self):
+        stub = CollectionStub(['a', 'b', 'c'])
+
+        def handler(request):
+            params = dict(request.url.params)
+            params.update(page=int(params.get('page', 1)), per_page=int(params.get('per_page', 30)))
+            response = stub(request.method, str(request.url.copy_with(query=None)), params)
+            return httpx.Response(response.status_code, content=response.content)
+
+        async def run():
+            client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            async with AsyncUnsplashAPI(access_key='dummy', client=client) as api:
+                return await api.sync_collection('c1', ['b', 'c', 'd'])
+
+        result = asyncio.run(run())
+        self.assertEqual((['d'], ['a'], 2), (result.added, result.removed, result.unchanged))
+        self.assertEqual(['b', 'c', 'd'], sorted(stub.photo_ids))
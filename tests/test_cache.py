@@ -0,0 +1,136 @@
+import os
+import tempfile
+import threading
+import time
+import unittest
+from unittest import mock
+
+import requests
+
+from unsplashapi import UnsplashAPI
+from unsplashapi.cache import CacheEntry, MemoryCache, SQLiteCache
+
+from .helpers import make_response
+
+
+class TestMemoryCache(unittest.TestCase):
+    """
+    Offline tests for the in-memory response cache.
+    """
+
+    def test_hit_skips_request(self):
+        api = UnsplashAPI(access_key='dummy', cache=MemoryCache())
+        with mock.patch.object(requests.Session, 'request', return_value=make_response(json={'id': 'abc'})) as request:
+            first = api.get_photo_by_id('abc')
+            second = api.get_photo_by_id('abc')
+        self.assertEqual(first, second)
+        self.assertEqual(1, request.call_count)
+        self.assertEqual(dict(hits=1, misses=1, revalidations=0, size=1), api.cache.stats())
+
+    def test_key_ignores_access_key(self):
+        self.assertEqual(MemoryCache.make_key('/photos', dict(client_id='a', page=1, per_page=10)),
+                         MemoryCache.make_key('/photos', dict(per_page=10, page=1, client_id='b')))
+
+    def test_random_photo_not_cached(self):
+        api = UnsplashAPI(access_key='dummy', cache=MemoryCache())
+        with mock.patch.object(requests.Session, 'request', return_value=make_response(json={})) as request:
+            api.get_random_photo()
+            api.get_random_photo()
+        self.assertEqual(2, request.call_count)
+
+    def test_ttl_per_endpoint(self):
+        cache = MemoryCache(ttl=10, ttls={'/stats/*': 3600, '/users/*': 0})
+        self.assertEqual(3600, cache.ttl_for('/stats/total'))
+        self.assertEqual(0, cache.ttl_for('/users/simonstaehli'))
+        self.assertEqual(10, cache.ttl_for('/collections/1'))
+        self.assertEqual(0, cache.ttl_for('/photos/abc/download'))
+
+    def test_lru_eviction(self):
+        cache = MemoryCache(maxsize=2)
+        cache.set('a', CacheEntry(data=1))
+        cache.set('b', CacheEntry(data=2))
+        cache.get('a')
+        cache.set('c', CacheEntry(data=3))
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual(1, cache.get('a').data)
+        self.assertEqual(2, len(cache))
+
+    def test_revalidation_with_etag(self):
+        cache = MemoryCache(ttl=0.01)
+        api = UnsplashAPI(access_key='dummy', cache=cache)
+        responses = [make_response(json={'id': 'abc'}, headers={'ETag': '"v1"'}), make_response(304)]
+        with mock.patch.object(requests.Session, 'request', side_effect=responses) as request:
+            first = api.get_photo_by_id('abc')
+            time.sleep(0.02)
+            second = api.get_photo_by_id('abc')
+        self.assertIs(first, second)
+        self.assertEqual({'If-None-Match': '"v1"'}, request.call_args.kwargs['headers'])
+        self.assertEqual(1, cache.revalidations)
+
+
+class TestSQLiteCache(unittest.TestCase):
+    """
+    Offline tests for the persistent SQLite response cache.
+    """
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'cache.sqlite')
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_shared_between_clients(self):
+        with mock.patch.object(requests.Session, 'request',
+                               return_value=make_response(json={'id': 'abc'}, headers={'ETag': '"v1"'})) as request:
+            first = UnsplashAPI(access_key='dummy', cache=SQLiteCache(self.path)).get_photo_by_id('abc')
+            second = UnsplashAPI(access_key='dummy', cache=SQLiteCache(self.path)).get_photo_by_id('abc')
+        self.assertEqual({'id': 'abc'}, first)
+        self.assertEqual(first, second)
+        self.assertEqual(1, request.call_count)
+        self.assertEqual('"v1"', SQLiteCache(self.path).get('/photos/abc?').etag)
+
+    def test_size_eviction(self):
+        cache = SQLiteCache(self.path, max_bytes=250)
+        for i in range(5):
+            cache.set(str(i), CacheEntry(body=b'x' * 100, expires=time.time() + i))
+        self.assertEqual(2, len(cache))
+        self.assertIsNone(cache.get('0'))
+        self.assertIsNotNone(cache.get('4'))
+        self.assertEqual(200, cache.size)
+        # Replacing an entry counts its new size only
+        cache.set('4', CacheEntry(body=b'x' * 50, expires=time.time() + 4))
+        cache.delete('3')
+        self.assertEqual((1, 50), (len(cache), cache.size))
+        cache.clear()
+        self.assertEqual(0, cache.size)
+
+    def test_headers_persist(self):
+        headers = {'X-Total': '95', 'Link': '<https://api.unsplash.com/photos?page=10>; rel="last"'}
+        SQLiteCache(self.path).set('/photos?page=1', CacheEntry(data=[], headers=headers, expires=time.time() + 60))
+        self.assertEqual(headers, SQLiteCache(self.path).get('/photos?page=1').headers)
+
+    def test_invalidate_endpoint(self):
+        for cache in (MemoryCache(), SQLiteCache(self.path)):
+            for key in ('/collections/1?', '/collections/1/photos?page=1', '/collections/1/photos?page=2',
+                        '/collections/12/photos?page=1'):
+                cache.set(key, CacheEntry(data=key, expires=time.time() + 60))
+            cache.invalidate('/collections/1/photos')
+            self.assertEqual({'/collections/1?', '/collections/12/photos?page=1'},
+                             {key for key in ('/collections/1?', '/collections/1/photos?page=1',
+                                              '/collections/12/photos?page=1') if cache.get(key) is not None})
+
+    def test_concurrent_writers(self):
+        cache = SQLiteCache(self.path)
+
+        def write(thread):
+            for i in range(50):
+                cache.set(f'{thread}-{i}', CacheEntry(data={'i': i}, expires=time.time() + 60))
+
+        threads = [threading.Thread(target=write, args=(thread,)) for thread in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(200, len(cache))
+        self.assertEqual({'i': 7}, cache.get('3-7').data)
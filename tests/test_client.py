@@ -0,0 +1,176 @@
+import time
+import unittest
+from unittest import mock
+
+import requests
+
+from unsplashapi import UnsplashAPI
+from unsplashapi.base import UnsplashBase
+from unsplashapi.exceptions import RateLimitExceeded, UnsplashConnectionError, UnsplashHTTPError
+from unsplashapi.keypool import AccessKeyPool
+from unsplashapi.policy import RequestPolicy
+from unsplashapi.ratelimit import RateLimiter
+
+from .helpers import make_response
+
+
+class TestClientConstruction(unittest.TestCase):
+    """
+    Offline tests for constructing the client. No access key or network is needed.
+    """
+
+    def test_init_makes_no_request(self):
+        with mock.patch.object(requests.adapters.HTTPAdapter, 'send') as send:
+            api = UnsplashAPI(access_key='dummy')
+        self.assertIsInstance(api, UnsplashAPI)
+        send.assert_not_called()
+
+    def test_base_init_runs_once(self):
+        with mock.patch.object(UnsplashBase, '__init__', autospec=True,
+                               side_effect=lambda self, **kwargs: None) as init:
+            UnsplashAPI(access_key='dummy')
+        self.assertEqual(1, init.call_count)
+
+    def test_single_session(self):
+        session = requests.Session()
+        api = UnsplashAPI(access_key='dummy', session=session)
+        self.assertIs(session, api.session)
+
+    def test_check_status_runs_once(self):
+        response = mock.Mock(status_code=200)
+        with mock.patch.object(requests.Session, 'get', return_value=response) as get:
+            api = UnsplashAPI(access_key='dummy', check_status=True)
+            self.assertEqual(200, api._check_status())
+        self.assertEqual(1, get.call_count)
+
+
+class TestRateLimit(unittest.TestCase):
+    """
+    Offline tests for recording and pacing with the rate limit headers.
+    """
+
+    def test_headers_recorded(self):
+        response = make_response(json={'id': 'abc'},
+                                 headers={'X-Ratelimit-Limit': '50', 'X-Ratelimit-Remaining': '42'})
+        api = UnsplashAPI(access_key='dummy')
+        self.assertIsNone(api.rate_limit_remaining)
+        with mock.patch.object(requests.Session, 'request', return_value=response) as request:
+            api.get_photo_by_id('abc')
+            self.assertEqual(42, api.rate_limit_remaining)
+            self.assertEqual(50, api.rate_limit)
+        self.assertEqual(1, request.call_count)
+
+    def test_url_has_no_double_slash(self):
+        with mock.patch.object(requests.Session, 'request', return_value=make_response(json={})) as request:
+            UnsplashAPI(access_key='dummy').get_stats_total()
+        self.assertEqual('https://api.unsplash.com/stats/total', request.call_args[0][1])
+
+    def test_token_bucket_paces(self):
+        limiter = RateLimiter(burst=2, period=1.0)
+        limiter.update({'X-Ratelimit-Limit': '10', 'X-Ratelimit-Remaining': '10'})
+        delays = [limiter.reserve() for _ in range(4)]
+        self.assertEqual([0.0, 0.0], delays[:2])
+        self.assertAlmostEqual(0.1, delays[2], places=2)
+        self.assertAlmostEqual(0.2, delays[3], places=2)
+
+    def test_no_pacing_without_limit(self):
+        self.assertEqual(0.0, RateLimiter(burst=0).reserve())
+
+
+class TestAccessKeyPool(unittest.TestCase):
+    """
+    Offline tests for spreading requests over multiple access keys.
+    """
+
+    def test_uses_key_with_most_headroom(self):
+        pool = AccessKeyPool(['a', 'b', 'c'])
+        pool.limiters['a'].update({'X-Ratelimit-Remaining': '5'})
+        pool.limiters['b'].update({'X-Ratelimit-Remaining': '30'})
+        pool.limiters['c'].update({'X-Ratelimit-Remaining': '10'})
+        self.assertEqual('b', pool.acquire())
+        self.assertEqual(45, pool.remaining)
+
+    def test_failover_on_exhausted_key(self):
+        def request(method, url, params=None, **kwargs):
+            if params['client_id'] == 'a':
+                return make_response(403, headers={'X-Ratelimit-Remaining': '0'})
+            return make_response(json={'id': 'abc'}, headers={'X-Ratelimit-Remaining': '49'})
+
+        api = UnsplashAPI(access_key=['a', 'b'])
+        self.assertEqual('a', api.access_key)
+        with mock.patch.object(requests.Session, 'request', side_effect=request) as session_request:
+            self.assertEqual({'id': 'abc'}, api.get_photo_by_id('abc'))
+            self.assertEqual({'id': 'abc'}, api.get_photo_by_id('abc'))
+        used_keys = [call.kwargs['params']['client_id'] for call in session_request.call_args_list]
+        self.assertEqual(['a', 'b', 'b'], used_keys)
+        self.assertTrue(api.key_pool.is_exhausted('a'))
+
+    def test_exhausted_key_fails_over_without_retries(self):
+        def request(method, url, params=None, **kwargs):
+            if params['client_id'] == 'a':
+                return make_response(429, headers={'X-Ratelimit-Remaining': '0', 'Retry-After': '1'})
+            return make_response(json={'id': 'abc'}, headers={'X-Ratelimit-Remaining': '49'})
+
+        api = UnsplashAPI(access_key=['a', 'b'])
+        start = time.monotonic()
+        with mock.patch.object(requests.Session, 'request', side_effect=request) as session_request:
+            self.assertEqual({'id': 'abc'}, api.get_photo_by_id('abc'))
+        self.assertLess(time.monotonic() - start, 0.5)
+        self.assertEqual(['a', 'b'], [call.kwargs['params']['client_id'] for call in session_request.call_args_list])
+
+    def test_all_keys_exhausted(self):
+        response = make_response(403, headers={'X-Ratelimit-Remaining': '0'})
+        api = UnsplashAPI(access_key=['a', 'b'])
+        with mock.patch.object(requests.Session, 'request', return_value=response) as session_request:
+            with self.assertRaises(Exception):
+                api.get_photo_by_id('abc')
+        self.assertEqual(2, session_request.call_count)
+
+
+class TestRequestPolicy(unittest.TestCase):
+    """
+    Offline tests for timeouts, retries and typed errors.
+    """
+
+    def make_api(self, **kwargs):
+        return UnsplashAPI(access_key='dummy', policy=RequestPolicy(backoff=0.001, **kwargs))
+
+    def test_retries_server_errors(self):
+        responses = [make_response(503), make_response(502), make_response(json={'id': 'abc'})]
+        with mock.patch.object(requests.Session, 'request', side_effect=responses) as request:
+            self.assertEqual({'id': 'abc'}, self.make_api().get_photo_by_id('abc'))
+        self.assertEqual(3, request.call_count)
+        self.assertEqual((3.05, 30.0), request.call_args.kwargs['timeout'])
+
+    def test_gives_up_with_typed_error(self):
+        response = make_response(500, headers={'X-Ratelimit-Remaining': '12'})
+        with mock.patch.object(requests.Session, 'request', return_value=response) as request:
+            with self.assertRaises(UnsplashHTTPError) as context:
+                self.make_api(retries=2).get_photo_by_id('abc')
+        self.assertEqual(3, request.call_count)
+        self.assertEqual(500, context.exception.status_code)
+        self.assertEqual(12, context.exception.rate_limit_remaining)
+
+    def test_post_is_not_retried(self):
+        with mock.patch.object(requests.Session, 'request', return_value=make_response(503)) as request:
+            with self.assertRaises(UnsplashHTTPError):
+                self.make_api().like_photo('abc')
+        self.assertEqual(1, request.call_count)
+
+    def test_honors_retry_after(self):
+        policy = RequestPolicy()
+        self.assertEqual(2.0, policy.retry_delay('GET', 0, time.monotonic(), retry_after='2'))
+        self.assertIsNone(RequestPolicy(deadline=1.0).retry_delay('GET', 0, time.monotonic(), retry_after='5'))
+        self.assertEqual(30.0, policy.retry_delay('GET', 0, time.monotonic(), retry_after='3600'))
+
+    def test_connection_errors(self):
+        with mock.patch.object(requests.Session, 'request', side_effect=requests.ConnectionError('down')) as request:
+            with self.assertRaises(UnsplashConnectionError):
+                self.make_api(retries=1).get_photo_by_id('abc')
+        self.assertEqual(2, request.call_count)
+
+    def test_rate_limit_exceeded(self):
+        response = make_response(403, headers={'X-Ratelimit-Remaining': '0'})
+        with mock.patch.object(requests.Session, 'request', return_value=response):
+            with self.assertRaises(RateLimitExceeded):
+                self.make_api().get_photo_by_id('abc')
@@ -0,0 +1,140 @@
+import os
+import tempfile
+import unittest
+from datetime import datetime, timedelta, timezone
+from unittest import mock
+
+import requests
+
+from unsplashapi import MemoryCache, UnsplashAPI
+from unsplashapi.crawl import Checkpoint, crawl_latest
+
+from .helpers import make_response
+
+
+def make_feed(count, start=0):
+    """
+    Returns `count` photos ordered newest first, the newest with number start + count - 1.
+    """
+    epoch = datetime(2022, 1, 1, tzinfo=timezone(timedelta(hours=-5)))
+    return [{'id': f'photo-{number}', 'created_at': (epoch + timedelta(minutes=number)).isoformat()}
+            for number in reversed(range(start, start + count))]
+
+
+class Feed:
+
+    def __init__(self, photos, per_page=3):
+        self.photos = photos
+        self.per_page = per_page
+        self.requested = []
+
+    def __call__(self, page):
+        self.requested.append(page)
+        return self.photos[(page - 1) * self.per_page:page * self.per_page]
+
+
+class TestCrawlLatest(unittest.TestCase):
+    """
+    Offline tests for the incremental watermark crawler.
+    """
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'latest.json')
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def ids(self, photos):
+        return [photo['id'] for photo in photos]
+
+    def test_first_crawl_and_poll(self):
+        feed = Feed(make_feed(7))
+        self.assertEqual(self.ids(make_feed(7)), self.ids(crawl_latest(feed, Checkpoint(self.path))))
+        self.assertEqual([1, 2, 3, 4], feed.requested)
+        self.assertEqual('photo-6', Checkpoint(self.path).watermark['id'])
+
+        feed = Feed(make_feed(2, start=7) + make_feed(7))
+        self.assertEqual(['photo-8', 'photo-7'], self.ids(crawl_latest(feed, Checkpoint(self.path))))
+        self.assertEqual([1], feed.requested)
+        self.assertEqual('photo-8', Checkpoint(self.path).watermark['id'])
+
+        feed = Feed(make_feed(9))
+        self.assertEqual([], list(crawl_latest(feed, Checkpoint(self.path))))
+        self.assertEqual([1], feed.requested)
+
+    def test_resume_after_page_limit(self):
+        feed = Feed(make_feed(10))
+        first = list(crawl_latest(feed, Checkpoint(self.path), page_limit=2))
+        self.assertEqual(self.ids(make_feed(10)[:6]), self.ids(first))
+        self.assertIsNone(Checkpoint(self.path).watermark)
+        self.assertEqual(2, Checkpoint(self.path).state['crawl']['page'])
+
+        # Two uploads in between shift the older photos onto later pages.
+        feed = Feed(make_feed(2, start=10) + make_feed(10))
+        rest = list(crawl_latest(feed, Checkpoint(self.path)))
+        self.assertEqual(self.ids(make_feed(10)[6:]), self.ids(rest))
+        self.assertEqual([3, 4, 5], feed.requested)
+        self.assertEqual('photo-9', Checkpoint(self.path).watermark['id'])
+        self.assertNotIn('crawl', Checkpoint(self.path).state)
+
+        # The next poll picks up the uploads from the interrupted crawl.
+        self.assertEqual(['photo-11', 'photo-10'], self.ids(crawl_latest(feed, Checkpoint(self.path))))
+
+    def test_resume_after_error(self):
+        photos = make_feed(9)
+
+        def fetch_page(page):
+            if page == 2:
+                raise requests.ConnectionError()
+            return Feed(photos)(page)
+
+        crawl = crawl_latest(fetch_page, Checkpoint(self.path))
+        with self.assertRaises(requests.ConnectionError):
+            for _ in crawl:
+                pass
+        self.assertEqual(1, Checkpoint(self.path).state['crawl']['page'])
+
+        feed = Feed(photos)
+        self.assertEqual(self.ids(photos[3:]), self.ids(crawl_latest(feed, Checkpoint(self.path))))
+        self.assertEqual([2, 3, 4], feed.requested)
+
+    def test_same_created_at(self):
+        photos = make_feed(4)
+        photos[2]['created_at'] = photos[1]['created_at']
+        self.assertEqual(self.ids(photos), self.ids(crawl_latest(Feed(photos, per_page=10), Checkpoint(self.path))))
+
+        # The shared timestamp spans two pages of an interrupted crawl
+        photos = make_feed(6, start=10)
+        for photo in photos[2:5]:
+            photo['created_at'] = photos[2]['created_at']
+        os.remove(self.path)
+        first = crawl_latest(Feed(photos), Checkpoint(self.path), page_limit=1)
+        self.assertEqual(self.ids(photos[:3]), self.ids(first))
+        feed = Feed(make_feed(1, start=20) + photos)
+        self.assertEqual(self.ids(photos[3:]), self.ids(crawl_latest(feed, Checkpoint(self.path))))
+
+        # A new upload in the same second as the watermark is not lost
+        upload = dict(make_feed(1, start=30)[0], created_at=photos[0]['created_at'])
+        feed = Feed(feed.photos[:1] + [upload] + feed.photos[1:])
+        self.assertEqual(['photo-20', 'photo-30'], self.ids(crawl_latest(feed, Checkpoint(self.path))))
+
+    def test_client(self):
+        photos = make_feed(3)
+        api = UnsplashAPI(access_key='dummy')
+        responses = [make_response(json=photos), make_response(json=[]), make_response(json=photos)]
+        with mock.patch.object(requests.Session, 'request', side_effect=responses) as request:
+            self.assertEqual(self.ids(photos), self.ids(api.crawl_latest_photos(self.path, items_per_page=3)))
+            self.assertEqual([], list(api.crawl_latest_photos(self.path, items_per_page=3, fields=['id'])))
+        self.assertEqual(3, request.call_count)
+        self.assertEqual({'client_id': 'dummy', 'page': 1, 'per_page': 3, 'order_by': 'latest'},
+                         request.call_args.kwargs['params'])
+
+    def test_client_bypasses_cache(self):
+        api = UnsplashAPI(access_key='dummy', cache=MemoryCache())
+        responses = [make_response(json=make_feed(1)), make_response(json=[]), make_response(json=make_feed(2))]
+        with mock.patch.object(requests.Session, 'request', side_effect=responses) as request:
+            self.assertEqual(['photo-0'], self.ids(api.crawl_latest_photos(self.path)))
+            # The poll gets the new upload instead of the cached first page
+            self.assertEqual(['photo-1'], self.ids(api.crawl_latest_photos(self.path)))
+        self.assertEqual('no-cache', request.call_args.kwargs['headers']['Cache-Control'])
@@ -0,0 +1,134 @@
+import itertools
+import os
+import tempfile
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import mock
+
+import requests
+
+from unsplashapi import RequestPolicy, UnsplashAPI
+
+IMAGE = bytes(range(256)) * 1024
+ETAG = '"v1"'
+
+
+class ImageHandler(BaseHTTPRequestHandler):
+    """
+    Serves IMAGE for every path and supports single Range requests with If-Range.
+    """
+    requests = []
+
+    def do_GET(self):
+        self.requests.append(self.headers.get('Range'))
+        start = 0
+        if self.headers.get('Range') and self.headers.get('If-Range') == ETAG:
+            start = int(self.headers['Range'].split('=')[1].rstrip('-'))
+            if start >= len(IMAGE):
+                self.send_response(416)
+                self.send_header('Content-Range', f'bytes */{len(IMAGE)}')
+                self.send_header('Content-Length', '0')
+                self.end_headers()
+                return
+            self.send_response(206)
+            self.send_header('Content-Range', f'bytes {start}-{len(IMAGE) - 1}/{len(IMAGE)}')
+        else:
+            self.send_response(200)
+        self.send_header('ETag', ETAG)
+        self.send_header('Content-Length', str(len(IMAGE) - start))
+        self.end_headers()
+        self.wfile.write(IMAGE[start:])
+
+    def log_message(self, *args):
+        pass
+
+
+class TestDownload(unittest.TestCase):
+    """
+    Offline tests for the image downloader against a local HTTP server.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(('127.0.0.1', 0), ImageHandler)
+        cls.url = f'http://127.0.0.1:{cls.server.server_address[1]}/image.jpg'
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+
+    def setUp(self):
+        ImageHandler.requests = []
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.api = UnsplashAPI(access_key='dummy', policy=RequestPolicy(backoff=0.001, max_backoff=0.001))
+        patcher = mock.patch.object(UnsplashAPI, 'track_photo_download', return_value={'url': self.url})
+        self.track = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_download_photos(self):
+        results = list(self.api.download_photos(['a', 'b', 'a', {'id': 'c'}], self.directory.name))
+        self.assertEqual({'a', 'b', 'c'}, {photo_id for photo_id, _, _ in results})
+        self.assertEqual(3, self.track.call_count)
+        for photo_id, result, error in results:
+            self.assertIsNone(error)
+            self.assertEqual(len(IMAGE), result.bytes)
+            self.assertGreater(result.throughput, 0)
+            with open(os.path.join(self.directory.name, f'{photo_id}.jpg'), 'rb') as file:
+                self.assertEqual(IMAGE, file.read())
+
+    def write_part(self, data, validator=ETAG):
+        with open(os.path.join(self.directory.name, 'a.jpg.part'), 'wb') as file:
+            file.write(data)
+        with open(os.path.join(self.directory.name, 'a.jpg.part.validator'), 'w') as file:
+            file.write(validator)
+
+    def assertDownloaded(self, result):
+        with open(result.path, 'rb') as file:
+            self.assertEqual(IMAGE, file.read())
+        self.assertEqual(['a.jpg'], os.listdir(self.directory.name))
+
+    def test_resume_partial_file(self):
+        self.write_part(IMAGE[:1000])
+        result = self.api.download_photo('a', self.directory.name)
+        self.assertTrue(result.resumed)
+        self.assertEqual(len(IMAGE) - 1000, result.bytes)
+        self.assertEqual(['bytes=1000-'], ImageHandler.requests)
+        self.assertDownloaded(result)
+
+    def test_stale_partial_file_restarted(self):
+        # A partial file of another version is answered with the whole file
+        self.write_part(b'x' * 1000, validator='"v0"')
+        result = self.api.download_photo('a', self.directory.name)
+        self.assertEqual((False, len(IMAGE)), (result.resumed, result.bytes))
+        self.assertDownloaded(result)
+
+        # A partial file longer than the file is discarded after the 416
+        self.write_part(IMAGE + b'x')
+        os.remove(result.path)
+        result = self.api.download_photo('a', self.directory.name)
+        self.assertEqual([f'bytes={len(IMAGE) + 1}-', None], ImageHandler.requests[1:])
+        self.assertDownloaded(result)
+
+    def test_truncated_body_resumed(self):
+        iter_content = requests.Response.iter_content
+        calls = []
+
+        def truncated(response, chunk_size=1, decode_unicode=False):
+            # The first body ends early without an error, as a connection closed cleanly mid-body
+            calls.append(chunk_size)
+            chunks = iter_content(response, chunk_size=chunk_size)
+            return itertools.islice(chunks, 2) if len(calls) == 1 else chunks
+
+        with mock.patch.object(requests.Response, 'iter_content', truncated):
+            result = self.api.download_photo('a', self.directory.name, chunk_size=1024)
+        self.assertEqual([None, 'bytes=2048-'], ImageHandler.requests)
+        self.assertTrue(result.resumed)
+        self.assertDownloaded(result)
+
+    def test_existing_file_skipped(self):
+        open(os.path.join(self.directory.name, 'a.jpg'), 'wb').close()
+        self.assertTrue(self.api.download_photo('a', self.directory.name).skipped)
+        self.track.assert_not_called()
@@ -0,0 +1,116 @@
+import csv
+import gzip
+import json
+import os
+import tempfile
+import unittest
+
+from unsplashapi.export import CSVWriter, NDJSONWriter, export, flatten
+
+from benchmarks.payloads import make_photo
+
+
+def pages(count, per_page=10):
+    for page in range(count):
+        yield [make_photo(page * per_page + index) for index in range(per_page)]
+
+
+class TestExport(unittest.TestCase):
+    """
+    Offline tests for the streaming exporters.
+    """
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def path(self, name):
+        return os.path.join(self.directory.name, name)
+
+    def test_flatten(self):
+        self.assertEqual({'id': 1, 'urls.small': 's', 'tags': '[{"title": "a"}]', 'exif': None},
+                         flatten({'id': 1, 'urls': {'small': 's'}, 'tags': [{'title': 'a'}], 'exif': None}))
+
+    def test_ndjson_gzip_from_pages(self):
+        path = self.path('photos.ndjson.gz')
+        self.assertEqual(30, export(pages(3), path, batch_size=7))
+        with gzip.open(path, 'rt', encoding='utf-8') as file:
+            records = [json.loads(line) for line in file]
+        self.assertEqual([make_photo(index) for index in range(30)], records)
+
+    def test_batches_written_while_streaming(self):
+        path = self.path('photos.ndjson')
+        with NDJSONWriter(path, batch_size=10) as writer:
+            for index, photo in enumerate(photo for page in pages(3) for photo in page):
+                writer.write(photo)
+                with open(path, encoding='utf-8') as file:
+                    self.assertEqual(index + 1 - (index + 1) % 10, len(file.readlines()))
+            self.assertLessEqual(len(writer._batch), 10)
+
+    def test_search_pages_and_csv(self):
+        path = self.path('photos.csv')
+        search_pages = [{'total': 4, 'total_pages': 2, 'results': [make_photo(0), make_photo(1)]},
+                        {'total': 4, 'total_pages': 2, 'results': [make_photo(2), {'id': 'partial'}]}]
+        with CSVWriter(path, batch_size=3) as writer:
+            self.assertEqual(4, writer.write_all(search_pages))
+        with open(path, encoding='utf-8', newline='') as file:
+            rows = list(csv.DictReader(file))
+        self.assertEqual([make_photo(i)['id'] for i in range(3)] + ['partial'], [row['id'] for row in rows])
+        self.assertEqual(make_photo(1)['urls']['small'], rows[1]['urls.small'])
+        self.assertEqual('', rows[3]['urls.small'])
+
+    def test_csv_columns(self):
+        path = self.path('photos.csv.gz')
+        export(pages(1), path, columns=['id', 'urls.small', 'user.username'])
+        with gzip.open(path, 'rt', encoding='utf-8', newline='') as file:
+            rows = list(csv.reader(file))
+        self.assertEqual(['id', 'urls.small', 'user.username'], rows[0])
+        self.assertEqual([make_photo(0)['id'], make_photo(0)['urls']['small'], make_photo(0)['user']['username']],
+                         rows[1])
+
+    def test_zstd(self):
+        try:
+            import zstandard
+        except ImportError:
+            self.skipTest('zstandard is not installed')
+        path = self.path('photos.jsonl.zst')
+        export(pages(2), path)
+        with zstandard.open(path, 'r', encoding='utf-8') as file:
+            self.assertEqual(20, len(file.readlines()))
+
+    def test_parquet(self):
+        try:
+            import pyarrow.parquet
+        except ImportError:
+            self.skipTest('pyarrow is not installed')
+        path = self.path('photos.parquet')
+        self.assertEqual(25, export(pages(5, per_page=5), path, batch_size=10))
+        table = pyarrow.parquet.read_table(path, columns=['id', 'likes', 'urls.small'])
+        self.assertEqual(25, table.num_rows)
+        self.assertEqual(3, pyarrow.parquet.ParquetFile(path).num_row_groups)
+        self.assertEqual(make_photo(7)['likes'], table.column('likes')[7].as_py())
+
+    def test_parquet_types_unified_across_batches(self):
+        try:
+            import pyarrow.parquet
+        except ImportError:
+            self.skipTest('pyarrow is not installed')
+        records = ([{'id': 'a', 'city': None, 'ratio': 1, 'tag': 1}] * 2
+                   + [{'id': 'b', 'city': 'Basel', 'ratio': 1.5, 'tag': 'sea', 'new': True}])
+        path = self.path('photos.parquet')
+        self.assertEqual(3, export(records, path, batch_size=2))
+        table = pyarrow.parquet.read_table(path)
+        self.assertEqual({'id': 'string', 'city': 'string', 'ratio': 'double', 'tag': 'string', 'new': 'bool'},
+                         {field.name: str(field.type) for field in table.schema})
+        self.assertEqual({'id': 'b', 'city': 'Basel', 'ratio': 1.5, 'tag': 'sea', 'new': True}, table.to_pylist()[2])
+        self.assertEqual('1', table.column('tag')[0].as_py())
+        self.assertEqual(2, pyarrow.parquet.ParquetFile(path).num_row_groups)
+
+    def test_unknown_format(self):
+        with self.assertRaises(ValueError):
+            export([], self.path('photos.xml'))
+        # Parquet compresses its columns, a .gz suffix would announce a gzip stream
+        with self.assertRaises(ValueError):
+            export([], self.path('photos.parquet.gz'))
@@ -0,0 +1,121 @@
+import asyncio
+import threading
+import time
+import unittest
+
+import httpx
+
+from unsplashapi import AsyncUnsplashAPI
+from unsplashapi.exceptions import UnsplashHTTPError
+from unsplashapi.fanout import SeenSet, expand_searches
+
+from .helpers import make_response, stubbed_api
+
+RESULTS = {'ocean': list(range(0, 45)), 'beach': list(range(40, 70)), 'sea': list(range(100, 103))}
+
+
+def search_body(params):
+    ids = RESULTS[params['query']]
+    per_page, page = int(params['per_page']), int(params['page'])
+    results = [{'id': str(i), 'color': params.get('color')} for i in ids[(page - 1) * per_page:page * per_page]]
+    return {'total': len(ids), 'total_pages': -(-len(ids) // per_page), 'results': results}
+
+
+class TestFanOut(unittest.TestCase):
+    """
+    Offline tests for concurrent multi-query search.
+    """
+
+    def make_api(self, delay=0.0):
+        requested = []
+        lock = threading.Lock()
+
+        def request(method, url, params=None, **kwargs):
+            with lock:
+                requested.append(params)
+            time.sleep(delay)
+            if params['query'] not in RESULTS:
+                return make_response(status_code=400, json={'errors': ['unknown query']})
+            return make_response(json=search_body(params))
+
+        return stubbed_api(self, request), requested
+
+    def test_seen_set_is_bounded(self):
+        seen = SeenSet(maxsize=3)
+        self.assertEqual([True, True, False, True, True], [seen.add(key) for key in 'abacd'])
+        self.assertEqual(3, len(seen))
+        self.assertNotIn('b', seen)
+        self.assertIn('a', seen)
+
+    def test_expand_searches(self):
+        searches = expand_searches(['ocean', {'query': 'sea', 'weight': 2}], [{'color': 'blue'}, {'color': 'teal'}])
+        self.assertEqual([{'query': 'ocean', 'color': 'blue'}, {'query': 'ocean', 'color': 'teal'},
+                          {'query': 'sea', 'weight': 2, 'color': 'blue'},
+                          {'query': 'sea', 'weight': 2, 'color': 'teal'}], searches)
+
+    def test_merges_without_duplicates(self):
+        api, requested = self.make_api()
+        hits = list(api.multi_search_photos(['ocean', 'beach', 'sea'], items_per_page=10))
+        ids = [photo['id'] for _, photo, _ in hits]
+        self.assertEqual(len(ids), len(set(ids)))
+        self.assertEqual(set(map(str, RESULTS['ocean'] + RESULTS['beach'] + RESULTS['sea'])), set(ids))
+        # The first ranks of all searches come first, ordered by score
+        self.assertEqual(['0', '40', '100'], ids[:3])
+        scores = [score for _, _, score in hits]
+        self.assertEqual(sorted(scores[:23], reverse=True), scores[:23])
+        # Pages are planned from total_pages: 5 + 3 + 1, no duplicate or empty pages
+        pages = [(params['query'], params['page']) for params in requested]
+        self.assertEqual(9, len(pages))
+        self.assertEqual(len(pages), len(set(pages)))
+
+    def test_weights_and_filters(self):
+        api, requested = self.make_api()
+        hits = list(api.multi_search_photos([{'query': 'sea', 'weight': 3}, 'ocean'], filters=[{'color': 'blue'}],
+                                            max_items=5, fields=['color']))
+        self.assertEqual(['100', '101', '102', '0', '1'], [photo['id'] for _, photo, _ in hits])
+        self.assertEqual({'query': 'sea', 'weight': 3, 'color': 'blue'}, hits[0][0])
+        self.assertEqual({'id': '100', 'color': 'blue'}, hits[0][1])
+        self.assertTrue(all('weight' not in params and params['color'] == 'blue' for params in requested))
+
+    def test_max_items_keeps_unproduced_hits_unseen(self):
+        api, _ = self.make_api()
+        seen = SeenSet()
+        hits = list(api.multi_search_photos(['ocean', 'beach'], max_items=2, seen=seen))
+        self.assertEqual(['0', '40'], [photo['id'] for _, photo, _ in hits])
+        self.assertEqual(2, len(seen))
+        self.assertNotIn('1', seen)
+
+    def test_failed_search(self):
+        api, _ = self.make_api()
+        with self.assertRaises(UnsplashHTTPError):
+            list(api.multi_search_photos(['ocean', 'unknown']))
+        # With an errors list, the other searches go on
+        errors = []
+        hits = list(api.multi_search_photos(['sea', 'unknown'], errors=errors))
+        self.assertEqual(['100', '101', '102'], [photo['id'] for _, photo, _ in hits])
+        (search, error), = errors
+        self.assertEqual({'query': 'unknown'}, search)
+        self.assertIsInstance(error, UnsplashHTTPError)
+
+    def test_searches_run_concurrently(self):
+        api, requested = self.make_api(delay=0.1)
+        start = time.perf_counter()
+        hits = list(api.multi_search_photos(['ocean', 'beach', 'sea'], filters=[{'color': 'blue'}, {'color': 'teal'}],
+                                            items_per_page=30))
+        # 2 rounds of pages instead of 8 requests one after another
+        self.assertLess(time.perf_counter() - start, 0.6)
+        self.assertEqual(8, len(requested))
+        self.assertEqual(73, len(hits))
+
+    def test_async(self):
+        def handler(request):
+            return httpx.Response(200, json=search_body(dict(request.url.params)))
+
+        async def run():
+            client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            async with AsyncUnsplashAPI(access_key='dummy', client=client) as api:
+                return [photo['id'] async for _, photo, _ in api.multi_search_photos(['ocean', 'beach'])]
+
+        ids = asyncio.run(run())
+        self.assertEqual(70, len(ids))
+        self.assertEqual(['0', '40'], ids[:2])
@@ -0,0 +1,139 @@
+import asyncio
+import unittest
+
+from unsplashapi import AsyncUnsplashAPI, RequestPolicy, UnsplashAPI
+from unsplashapi.exceptions import UnsplashConnectionError
+from unsplashapi.metrics import Histogram, Metrics, OpenTelemetryHook, RequestEvent, endpoint_template
+
+from benchmarks.server import MockUnsplash
+
+
+class Instrument:
+
+    def __init__(self):
+        self.values = []
+
+    def add(self, value, attributes):
+        self.values.append((value, attributes))
+
+    record = add
+
+
+class Meter:
+
+    def __init__(self):
+        self.instruments = {}
+
+    def create_counter(self, name, **kwargs):
+        return self.instruments.setdefault(name, Instrument())
+
+    create_histogram = create_counter
+
+
+class TestMetrics(unittest.TestCase):
+    """
+    Offline tests for the instrumentation hooks and the metrics aggregation.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = MockUnsplash(total=60, rate_limit=1000).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.stop()
+
+    def setUp(self):
+        self.server.reset()
+        self.events = []
+        self.metrics = Metrics()
+        self.api = UnsplashAPI(access_key='dummy', hooks=[self.events.append, self.metrics],
+                               policy=RequestPolicy(backoff=0.001, max_backoff=0.001))
+        self.api.base_url = self.server.url
+
+    def test_endpoint_template(self):
+        self.assertEqual('/photos/{id}/statistics', endpoint_template('/photos/abc/statistics'))
+        self.assertEqual('/photos/random', endpoint_template('/photos/random'))
+        self.assertEqual('/users/{username}/likes', endpoint_template('/users/someone/likes'))
+        self.assertEqual('/search/photos', endpoint_template('/search/photos'))
+        self.assertEqual('/collections', endpoint_template('/collections'))
+
+    def test_event_per_call(self):
+        photo = self.api.get_photo_by_id('abc')
+        self.assertEqual('abc', photo['id'])
+        event, = self.events
+        self.assertEqual(('GET', '/photos/{id}', 200, 0), (event.method, event.endpoint, event.status, event.attempt))
+        self.assertGreater(event.bytes, 1000)
+        self.assertEqual((1000, 999), (event.rate_limit, event.rate_limit_remaining))
+        self.assertGreater(event.total, 0)
+        # The first call opens the connection, the next one reuses it
+        self.assertLess(0, event.connect, event.ttfb)
+        self.assertLessEqual(event.ttfb, event.total)
+        self.assertGreaterEqual(event.decode, 0)
+        self.api.get_photo_by_id('def')
+        self.assertIsNone(self.events[-1].connect)
+        self.assertLessEqual(self.events[-1].ttfb, self.events[-1].total)
+
+    def test_retries_and_errors(self):
+        self.server.fail_next(1)
+        self.api.get_stats_total()
+        self.assertEqual([503, 200], [event.status for event in self.events])
+        self.assertEqual([0, 1], [event.attempt for event in self.events])
+        self.assertIsNone(self.events[0].decode)
+
+        api = UnsplashAPI(access_key='dummy', hooks=[self.events.append], policy=RequestPolicy(retries=0))
+        api.base_url = 'http://127.0.0.1:1/'
+        with self.assertRaises(UnsplashConnectionError):
+            api.get_stats_total()
+        self.assertIsNone(self.events[-1].status)
+        self.assertIsInstance(self.events[-1].error, Exception)
+
+    def test_aggregation_and_prometheus(self):
+        self.server.fail_next(1)
+        for photo_id in ('a', 'b', 'c'):
+            self.api.get_photo_by_id(photo_id)
+        list(self.api.iter_photos(items_per_page=30))
+
+        summary = self.metrics.summary()
+        self.assertEqual(dict(requests=4, errors=1, retries=1), {name: summary['GET /photos/{id}'][name]
+                                                                for name in ('requests', 'errors', 'retries')})
+        self.assertLessEqual(summary['GET /photos/{id}']['p50'], summary['GET /photos/{id}']['p99'])
+        self.assertEqual(2, summary['GET /photos']['requests'])
+
+        text = self.metrics.prometheus()
+        self.assertIn('unsplash_requests_total{method="GET",endpoint="/photos/{id}",status="200"} 3', text)
+        self.assertIn('unsplash_requests_total{method="GET",endpoint="/photos/{id}",status="503"} 1', text)
+        self.assertIn('unsplash_request_duration_seconds_bucket{method="GET",endpoint="/photos/{id}",le="+Inf"} 4',
+                      text)
+        self.assertIn('unsplash_request_duration_seconds_count{method="GET",endpoint="/photos/{id}"} 4', text)
+        self.assertIn('# TYPE unsplash_rate_limit_remaining gauge', text)
+
+    def test_histogram_quantile(self):
+        histogram = Histogram((1.0, 2.0, 3.0))
+        for value in (0.5, 1.5, 1.5, 2.5):
+            histogram.observe(value)
+        self.assertEqual(1.5, histogram.quantile(0.5))
+        self.assertEqual([1, 2, 1, 0], histogram.counts)
+        self.assertIsNone(Histogram().quantile(0.5))
+
+    def test_opentelemetry(self):
+        meter = Meter()
+        hook = OpenTelemetryHook(meter)
+        hook(RequestEvent('GET', '/photos', status=200, total=0.1, bytes=10))
+        self.assertEqual([(1, {'http.method': 'GET', 'unsplash.endpoint': '/photos', 'http.status_code': 200,
+                               'unsplash.attempt': 0})], meter.instruments['unsplash.requests'].values)
+        self.assertEqual(0.1, meter.instruments['unsplash.request.duration'].values[0][0])
+        self.assertEqual(10, meter.instruments['unsplash.response.size'].values[0][0])
+
+    def test_async_client(self):
+        async def main():
+            async with AsyncUnsplashAPI(access_key='dummy', hooks=[self.events.append]) as api:
+                api.base_url = self.server.url
+                return await api.get_collection_by_id('123')
+
+        self.assertEqual('123', asyncio.run(main())['id'])
+        event, = self.events
+        self.assertEqual(('GET', '/collections/{id}', 200), (event.method, event.endpoint, event.status))
+        self.assertIsNotNone(event.connect)
+        self.assertLessEqual(event.ttfb, event.total)
+        self.assertIsNotNone(event.decode)
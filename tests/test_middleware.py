@@ -0,0 +1,135 @@
+import asyncio
+import unittest
+from unittest import mock
+
+import httpx
+import requests
+
+from unsplashapi import AsyncUnsplashAPI, MemoryCache, RequestPolicy, UnsplashAPI
+from unsplashapi.middleware import CachedResponse, CacheMiddleware, Middleware, PacingMiddleware, default_middleware
+
+from .helpers import make_response
+
+
+class Record(Middleware):
+
+    def __init__(self, name, calls):
+        self.name = name
+        self.calls = calls
+
+    def handle(self, client, request, call_next):
+        self.calls.append(f'{self.name}:{request.endpoint}')
+        return call_next(request)
+
+    async def ahandle(self, client, request, call_next):
+        self.calls.append(f'{self.name}:{request.endpoint}')
+        return await call_next(request)
+
+
+class Stub(Middleware):
+    """
+    Answers every request without calling the rest of the chain.
+    """
+
+    def handle(self, client, request, call_next):
+        return make_response(json={'id': 'stub'})
+
+    async def ahandle(self, client, request, call_next):
+        return httpx.Response(200, json={'id': 'stub'})
+
+
+class TestMiddleware(unittest.TestCase):
+    """
+    Offline tests for the middleware chain of the clients.
+    """
+
+    def test_custom_middleware_runs_in_order(self):
+        calls = []
+        api = UnsplashAPI(access_key='dummy')
+        api.middleware[:0] = [Record('outer', calls), Record('inner', calls)]
+        with mock.patch.object(requests.Session, 'request', return_value=make_response(json={'id': 'a'})):
+            self.assertEqual({'id': 'a'}, api.get_photo_by_id('a'))
+        self.assertEqual(['outer:/photos/a', 'inner:/photos/a'], calls)
+
+    def test_short_circuit(self):
+        api = UnsplashAPI(access_key='dummy', middleware=[Stub()])
+        with mock.patch.object(requests.Session, 'request') as request:
+            self.assertEqual({'id': 'stub'}, api.get_photo_by_id('a'))
+        request.assert_not_called()
+
+    def test_middleware_after_cache_skipped_on_hit(self):
+        calls = []
+        api = UnsplashAPI(access_key='dummy', cache=MemoryCache())
+        index = next(index for index, step in enumerate(api.middleware) if isinstance(step, CacheMiddleware))
+        api.middleware.insert(index + 1, Record('network', calls))
+        with mock.patch.object(requests.Session, 'request', return_value=make_response(json={'id': 'a'})):
+            api.get_photo_by_id('a')
+            api.get_photo_by_id('a')
+        self.assertEqual(['network:/photos/a'], calls)
+
+    def test_rate_limit_request_bypasses_cache(self):
+        api = UnsplashAPI(access_key='dummy', cache=MemoryCache())
+        response = make_response(json={}, headers={'X-Ratelimit-Remaining': '42'})
+        with mock.patch.object(requests.Session, 'request', return_value=response) as request:
+            api.get_current_rate_limit()
+            self.assertEqual('42', api.get_current_rate_limit())
+        self.assertEqual(2, request.call_count)
+
+    def test_cached_response_decodes_entry(self):
+        api = UnsplashAPI(access_key='dummy', cache=MemoryCache())
+        with mock.patch.object(requests.Session, 'request', return_value=make_response(json={'id': 'a'})):
+            api.get_photo_by_id('a')
+            self.assertIsInstance(api._request('GET', '/photos/a'), CachedResponse)
+
+    def test_default_chains_are_independent(self):
+        self.assertIsNot(default_middleware()[0], default_middleware()[0])
+        self.assertIsNot(UnsplashAPI(access_key='dummy').middleware, UnsplashAPI(access_key='dummy').middleware)
+
+    def test_async_custom_middleware(self):
+        calls = []
+
+        async def run():
+            transport = httpx.MockTransport(lambda request: httpx.Response(200, json={'id': 'a'}))
+            async with AsyncUnsplashAPI(access_key='dummy', client=httpx.AsyncClient(transport=transport)) as api:
+                api.middleware.insert(0, Record('outer', calls))
+                self.assertEqual({'id': 'a'}, await api.get_photo_by_id('a'))
+                api.middleware = [Stub()]
+                self.assertEqual({'id': 'stub'}, await api.get_photo_by_id('b'))
+
+        asyncio.run(run())
+        self.assertEqual(['outer:/photos/a'], calls)
+
+    def test_reduced_chains_use_client_defaults(self):
+        policy = RequestPolicy(connect_timeout=1.0, read_timeout=2.0)
+        for middleware in ([], [PacingMiddleware()]):
+            api = UnsplashAPI(access_key='dummy', policy=policy, middleware=middleware)
+            with mock.patch.object(requests.Session, 'request',
+                                   return_value=make_response(json={'id': 'a'},
+                                                              headers={'X-Ratelimit-Remaining': '7'})) as request:
+                self.assertEqual({'id': 'a'}, api.get_photo_by_id('a'))
+            self.assertEqual('dummy', request.call_args.kwargs['params']['client_id'])
+            self.assertEqual((1.0, 2.0), request.call_args.kwargs['timeout'])
+        self.assertEqual(7, api.rate_limit_remaining)
+
+    def test_async_reduced_chains_use_client_defaults(self):
+        requests_sent = []
+
+        def handler(request):
+            requests_sent.append(request)
+            return httpx.Response(200, json={'id': 'a'}, headers={'X-Ratelimit-Remaining': '7'})
+
+        async def run(middleware):
+            client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            async with AsyncUnsplashAPI(access_key='dummy', client=client, middleware=middleware,
+                                        policy=RequestPolicy(connect_timeout=1.0, read_timeout=2.0)) as api:
+                return await api.get_photo_by_id('a'), api.rate_limiter.current_remaining()
+
+        self.assertEqual(({'id': 'a'}, None), asyncio.run(run([])))
+        self.assertEqual(({'id': 'a'}, 7), asyncio.run(run([PacingMiddleware()])))
+        for request in requests_sent:
+            self.assertEqual('dummy', request.url.params['client_id'])
+            self.assertEqual({'connect': 1.0, 'read': 2.0, 'write': 2.0, 'pool': 2.0}, request.extensions['timeout'])
+
+
+if __name__ == '__main__':
+    unittest.main()
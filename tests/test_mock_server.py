@@ -0,0 +1,105 @@
+import asyncio
+import time
+import unittest
+
+from unsplashapi import AsyncUnsplashAPI, MemoryCache, RequestPolicy, UnsplashAPI
+from unsplashapi.exceptions import RateLimitExceeded, UnsplashHTTPError
+
+from benchmarks.server import MockUnsplash
+
+
+class TestMockServer(unittest.TestCase):
+    """
+    Offline tests of the client against the local mock server.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = MockUnsplash(total=95, rate_limit=1000).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.stop()
+
+    def setUp(self):
+        self.server.reset()
+        self.server.rate_limit = 1000
+        self.api = UnsplashAPI(access_key='dummy', policy=RequestPolicy(backoff=0.001, max_backoff=0.001))
+        self.api.base_url = self.server.url
+
+    def test_endpoints(self):
+        self.assertEqual('abc', self.api.get_photo_by_id('abc')['id'])
+        self.assertEqual('someone', self.api.get_user_profile('someone')['username'])
+        self.assertIn('photos', self.api.get_stats_total())
+        self.assertEqual(3, len(self.api.get_related_collections('123')))
+        self.assertIsNone(self.api.delete_collection('123'))
+        with self.assertRaises(UnsplashHTTPError):
+            self.api._get('/unknown')
+
+    def test_pagination_and_rate_limit_headers(self):
+        self.api.prefetch_pages = 1
+        photos = list(self.api.iter_photos(items_per_page=30))
+        self.assertEqual(95, len(photos))
+        self.assertEqual(95, len({photo['id'] for photo in photos}))
+        # 4 pages of up to 30 photos, planned from X-Total of the first page
+        self.assertEqual(4, self.server.requests)
+        self.assertEqual('95', self.api.get_headers()['X-Total'])
+        self.assertEqual(1000, self.api.rate_limit)
+        self.assertEqual(996, self.api.rate_limit_remaining)
+
+        page = list(self.api.search_photos('ocean', items_per_page=30))[0]
+        self.assertEqual((95, 4, 30), (page['total'], page['total_pages'], len(page['results'])))
+
+    def test_user_pagination(self):
+        self.api.prefetch_pages = 1
+        photos = list(self.api.iter_user_photos('someone', order_by='oldest', stats=True))
+        self.assertEqual(200, len(photos))
+        self.assertEqual(200, len({photo['id'] for photo in photos}))
+        # 7 pages of up to 30 photos, no empty page ending the iteration
+        self.assertEqual(7, self.server.requests)
+
+        self.assertEqual([30, 30], [len(page) for page in self.api.list_user_liked_photos_paginate('someone',
+                                                                                                  page_limit=2)])
+        self.assertEqual(10, len(self.api.list_user_liked_collections('someone')))
+        self.assertEqual([photo['id'] for photo in photos[26:28]],
+                         [photo['id'] for photo in self.api.list_user_photos('someone', 14, 2, order_by='oldest')])
+        self.assertEqual(5, len(list(self.api.iter_user_liked_collections('someone', max_items=5))))
+
+    def test_get_headers(self):
+        # Both clients return the headers of the last response, a request is only sent without one
+        def run():
+            return [self.api.get_headers(), self.api.get_headers(),
+                    self.api.get_photo_by_id('abc') and self.api.get_headers()]
+
+        async def run_async():
+            async with AsyncUnsplashAPI(access_key='dummy') as api:
+                api.base_url = self.server.url
+                return [await api.get_headers(), await api.get_headers(),
+                        await api.get_photo_by_id('abc') and await api.get_headers()]
+
+        for calls in (run, lambda: asyncio.run(run_async())):
+            self.server.reset()
+            first, again, last = calls()
+            self.assertEqual(2, self.server.requests)
+            self.assertIs(first, again)
+            self.assertEqual(('999', '998'), (first['X-Ratelimit-Remaining'], last['X-Ratelimit-Remaining']))
+
+    def test_injected_errors_are_retried(self):
+        self.server.fail_next(2)
+        self.assertIn('downloads', self.api.get_stats_month())
+        self.assertEqual(3, self.server.requests)
+
+    def test_rate_limit_exhausted(self):
+        self.server.rate_limit = 2
+        self.api.get_stats_total()
+        self.api.get_stats_month()
+        with self.assertRaises(RateLimitExceeded):
+            self.api.get_stats_total()
+
+    def test_revalidation(self):
+        api = UnsplashAPI(access_key='dummy', cache=MemoryCache(ttl=-1, ttls={'/photos/*': 0.001}))
+        api.base_url = self.server.url
+        first = api.get_photo_by_id('abc')
+        time.sleep(0.01)
+        self.assertEqual(first, api.get_photo_by_id('abc'))
+        self.assertEqual(1, api.cache.stats()['revalidations'])
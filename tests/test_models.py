@@ -0,0 +1,61 @@
+import pickle
+import unittest
+
+from unsplashapi.models import Collection, Photo, Stats, Urls, User, parse_items, parse_pages
+
+from benchmarks.payloads import make_collection, make_photo
+
+
+class TestModels(unittest.TestCase):
+    """
+    Offline tests for the result models.
+    """
+
+    def test_from_dict_keeps_documented_fields(self):
+        data = make_photo(1)
+        photo = Photo.from_dict(data)
+        self.assertEqual(data['id'], photo.id)
+        self.assertEqual(data['width'], photo.width)
+        self.assertFalse(hasattr(photo, '__dict__'))
+        self.assertFalse(hasattr(photo, 'sponsorship'))
+
+    def test_nested_parsed_lazily(self):
+        data = make_photo(2)
+        photo = Photo.from_dict(data)
+        self.assertIs(data['user'], photo._user)
+
+        user = photo.user
+        self.assertIsInstance(user, User)
+        self.assertIs(user, photo.user)
+        self.assertEqual(data['user']['username'], user.username)
+        self.assertEqual(data['user']['profile_image']['small'], user.profile_image.small)
+        self.assertIsInstance(photo.urls, Urls)
+        self.assertEqual(data['urls']['thumb'], photo.urls.thumb)
+
+    def test_missing_nested_is_none(self):
+        photo = Photo.from_dict({'id': 'abc'})
+        self.assertIsNone(photo.exif)
+        self.assertIsNone(photo.width)
+        self.assertEqual("Photo(id='abc')", repr(photo))
+
+    def test_to_dict_and_equality(self):
+        collection = Collection.from_dict(make_collection(3))
+        collection.cover_photo.user
+        data = collection.to_dict()
+        self.assertEqual(collection.cover_photo.urls.raw, data['cover_photo']['urls']['raw'])
+        self.assertEqual(collection, Collection.from_dict(data))
+        self.assertEqual(collection, pickle.loads(pickle.dumps(collection)))
+
+    def test_constructor(self):
+        stats = Stats(photos=10, downloads=20)
+        self.assertEqual(10, stats.photos)
+        self.assertIsNone(stats.views)
+
+    def test_pages_and_items(self):
+        pages = [[make_photo(i) for i in range(3)], {'total': 2, 'results': [make_photo(i) for i in range(3, 5)]}]
+        parsed = list(parse_pages(iter(pages), Photo))
+        self.assertEqual([3, 2], [len(page) for page in parsed])
+        self.assertEqual(make_photo(4)['id'], parsed[1][1].id)
+
+        items = list(parse_items(pages[0], Photo))
+        self.assertEqual([photo.id for photo in parsed[0]], [photo.id for photo in items])
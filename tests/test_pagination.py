@@ -0,0 +1,171 @@
+import asyncio
+import threading
+import time
+import unittest
+from unittest import mock
+
+import requests
+
+from unsplashapi import MemoryCache, UnsplashAPI
+from unsplashapi.pagination import apaginate, last_page, paginate
+
+from .helpers import make_response, stubbed_api
+
+
+class TestPaginate(unittest.TestCase):
+    """
+    Offline tests for the prefetching pagination engine.
+    """
+
+    def test_yields_in_order(self):
+        def fetch_page(page):
+            time.sleep(0.01 * (5 - page % 5))
+            return page
+
+        self.assertEqual(list(range(20)), list(paginate(fetch_page, range(20), prefetch=5)))
+
+    def test_fetches_concurrently(self):
+        start = time.perf_counter()
+        list(paginate(lambda page: time.sleep(0.05), range(8), prefetch=8))
+        self.assertLess(time.perf_counter() - start, 0.3)
+
+    def test_bounded_window(self):
+        lock = threading.Lock()
+        state = dict(active=0, peak=0)
+
+        def fetch_page(page):
+            with lock:
+                state['active'] += 1
+                state['peak'] = max(state['peak'], state['active'])
+            time.sleep(0.01)
+            with lock:
+                state['active'] -= 1
+            return page
+
+        list(paginate(fetch_page, range(30), prefetch=3))
+        self.assertLessEqual(state['peak'], 3)
+
+    def test_close_cancels_outstanding(self):
+        fetched = []
+
+        def fetch_page(page):
+            time.sleep(0.02)
+            fetched.append(page)
+            return page
+
+        pages = paginate(fetch_page, range(100), prefetch=2)
+        self.assertEqual(0, next(pages))
+        pages.close()
+        time.sleep(0.1)
+        self.assertLessEqual(len(fetched), 4)
+
+    def test_error_propagates(self):
+        def fetch_page(page):
+            if page == 2:
+                raise ValueError(page)
+            return page
+
+        with self.assertRaises(ValueError):
+            list(paginate(fetch_page, range(5), prefetch=3))
+
+    def test_apaginate_yields_in_order(self):
+        async def fetch_page(page):
+            await asyncio.sleep(0.01 * (5 - page % 5))
+            return page
+
+        async def run():
+            return [page async for page in apaginate(fetch_page, range(20), prefetch=5)]
+
+        self.assertEqual(list(range(20)), asyncio.run(run()))
+
+
+class TestIterItems(unittest.TestCase):
+    """
+    Offline tests for the item-level iterators.
+    """
+
+    def make_api(self, total=100, search=False, headers=False, prefetch_pages=1, cache=None):
+        requested = []
+
+        def request(method, url, params=None, **kwargs):
+            requested.append(params['page'])
+            start = (params['page'] - 1) * params['per_page']
+            items = [{'id': i} for i in range(start, min(start + params['per_page'], total))]
+            totals = {'X-Total': str(total), 'X-Per-Page': str(params['per_page'])}
+            return make_response(json={'total': total, 'results': items} if search else items,
+                                 headers=totals if headers else None)
+
+        return stubbed_api(self, request, prefetch_pages=prefetch_pages, cache=cache), requested
+
+    def test_max_items_across_pages(self):
+        api, requested = self.make_api()
+        photos = list(api.iter_photos(max_items=43, items_per_page=10))
+        self.assertEqual(list(range(43)), [photo['id'] for photo in photos])
+        self.assertEqual([1, 2, 3, 4, 5], requested)
+
+    def test_small_max_items_shrinks_page(self):
+        api, requested = self.make_api(search=True)
+        photos = list(api.iter_search_photos('ocean', max_items=3))
+        self.assertEqual(3, len(photos))
+        self.assertEqual([1], requested)
+
+    def test_search_total_plans_pages(self):
+        api, requested = self.make_api(total=45, search=True)
+        photos = list(api.iter_search_photos('ocean'))
+        self.assertEqual(45, len(photos))
+        self.assertEqual([1, 2], requested)
+
+    def test_topics_endpoints(self):
+        api = UnsplashAPI(access_key='dummy')
+        with mock.patch.object(requests.Session, 'request', return_value=make_response(json=[{'id': 'a'}])) as request:
+            self.assertEqual([[{'id': 'a'}]], list(api.get_topic_photos('nature', order_by='oldest',
+                                                                        orientation='portrait')))
+            list(api.get_topics('nature,travel', order_by='featured'))
+        (_, url), kwargs = request.call_args_list[0]
+        self.assertEqual('https://api.unsplash.com/topics/nature/photos', url)
+        self.assertEqual({'client_id': 'dummy', 'page': 1, 'per_page': 10, 'order_by': 'oldest',
+                          'orientation': 'portrait'}, kwargs['params'])
+        (_, url), kwargs = request.call_args_list[1]
+        self.assertEqual(('https://api.unsplash.com/topics', 'featured'), (url, kwargs['params']['order_by']))
+
+    def test_collection_photos(self):
+        # Without totals, the short third page ends the iteration
+        api, requested = self.make_api(total=12)
+        self.assertEqual(12, len(list(api.iter_collection_photos(1, per_page=5))))
+        self.assertEqual([1, 2, 3], requested)
+
+    def test_stops_at_empty_page_without_totals(self):
+        # Without a last page, pages are not prefetched beyond the end
+        api, requested = self.make_api(total=20, prefetch_pages=4)
+        self.assertEqual(20, len(list(api.iter_photos(items_per_page=10))))
+        self.assertEqual([1, 2, 3], requested)
+
+    def test_header_totals_plan_exact_pages(self):
+        api, requested = self.make_api(total=100, headers=True, prefetch_pages=8)
+        self.assertEqual(100, len(list(api.iter_photos(items_per_page=10))))
+        self.assertEqual(list(range(1, 11)), sorted(requested))
+
+    def test_cached_first_page_plans_exact_pages(self):
+        api, requested = self.make_api(total=30, headers=True, prefetch_pages=4, cache=MemoryCache())
+        list(api.list_photos_paginate(page_limit=1, items_per_page=10))
+        requested.clear()
+        pages = list(api.list_photos_paginate(items_per_page=10))
+        self.assertEqual([10, 10, 10], [len(page) for page in pages])
+        self.assertEqual([2, 3], sorted(requested))
+
+    def test_paginate_starts_at_first_page(self):
+        api, requested = self.make_api(total=100, headers=True)
+        pages = list(api.list_photos_paginate(page_limit=3, items_per_page=10))
+        self.assertEqual([0, 10, 20], [page[0]['id'] for page in pages])
+        self.assertEqual([1, 2, 3], requested)
+
+    def test_last_page(self):
+        link = ('<https://api.unsplash.com/photos?page=1>; rel="first", '
+                '<https://api.unsplash.com/photos?page=2&per_page=10>; rel="next", '
+                '<https://api.unsplash.com/photos?page=7&per_page=10>; rel="last"')
+        self.assertEqual(7, last_page({'Link': link}, []))
+        self.assertEqual(1, last_page({'Link': '<https://api.unsplash.com/photos?page=1>; rel="first"'}, []))
+        self.assertEqual(4, last_page({'X-Total': '95', 'X-Per-Page': '30'}, []))
+        self.assertEqual(3, last_page({}, {'total': 95, 'total_pages': 3, 'results': []}, per_page=10))
+        self.assertEqual(10, last_page({}, {'total': 95, 'results': []}, per_page=10))
+        self.assertIsNone(last_page({}, []))
@@ -0,0 +1,78 @@
+import asyncio
+import pickle
+import unittest
+from unittest import mock
+
+import httpx
+import requests
+
+from unsplashapi import AsyncUnsplashAPI, MemoryCache, UnsplashAPI
+from unsplashapi.projection import compile_fields, project
+
+from benchmarks.payloads import make_photo
+from .helpers import make_response
+
+
+FIELDS = ['id', 'urls.small', 'width', 'height', 'color', 'likes']
+
+
+class TestProjection(unittest.TestCase):
+    """
+    Offline tests for cutting responses down to a field projection.
+    """
+
+    def test_project_record(self):
+        photo = make_photo(1)
+        projected = project(photo, FIELDS)
+        self.assertEqual({'id', 'urls', 'width', 'height', 'color', 'likes'}, set(projected))
+        self.assertEqual({'small': photo['urls']['small']}, projected['urls'])
+        self.assertLess(len(pickle.dumps(projected)), len(pickle.dumps(photo)) / 5)
+
+    def test_missing_fields_and_lists(self):
+        data = [{'id': 1, 'tags': [{'title': 'a', 'type': 'x'}, {'title': 'b'}]}, {'id': 2, 'tags': None}, 3]
+        self.assertEqual([{'id': 1, 'tags': [{'title': 'a'}, {'title': 'b'}]}, {'id': 2, 'tags': None}, 3],
+                         project(data, ['id', 'tags.title', 'missing.path']))
+
+    def test_whole_subtree(self):
+        photo = make_photo(2)
+        self.assertEqual(photo['urls'], project(photo, ['urls', 'urls.small'])['urls'])
+        self.assertEqual(photo['urls'], project(photo, ['urls.small', 'urls'])['urls'])
+
+    def test_search_results(self):
+        page = {'total': 100, 'total_pages': 10, 'results': [make_photo(3), make_photo(4)]}
+        projected = project(page, ['id'])
+        self.assertEqual(100, projected['total'])
+        self.assertEqual([{'id': make_photo(3)['id']}, {'id': make_photo(4)['id']}], projected['results'])
+
+    def test_no_projection(self):
+        photo = make_photo(5)
+        self.assertIs(photo, project(photo, None))
+        self.assertIsNone(compile_fields(None))
+        self.assertEqual({'id': None}, compile_fields('id'))
+
+    def test_client_methods(self):
+        photos = [make_photo(i) for i in range(3)]
+        api = UnsplashAPI(access_key='dummy', prefetch_pages=1)
+        with mock.patch.object(requests.Session, 'request', return_value=make_response(json=photos)):
+            items = list(api.iter_photos(max_items=3, fields=['id', 'urls.small']))
+            pages = list(api.list_photos_paginate(page_limit=1, fields=['id']))
+        self.assertEqual([{'id': photo['id'], 'urls': {'small': photo['urls']['small']}} for photo in photos], items)
+        self.assertEqual([[{'id': photo['id']} for photo in photos]], pages)
+
+    def test_cache_keeps_whole_body(self):
+        photo = make_photo(6)
+        api = UnsplashAPI(access_key='dummy', cache=MemoryCache())
+        with mock.patch.object(requests.Session, 'request', return_value=make_response(json=photo)) as request:
+            self.assertEqual({'id': photo['id']}, api.get_photo_by_id(photo['id'], fields=['id']))
+            self.assertEqual(photo, api.get_photo_by_id(photo['id']))
+        self.assertEqual(1, request.call_count)
+
+    def test_async_client(self):
+        photo = make_photo(7)
+
+        async def main():
+            transport = httpx.MockTransport(lambda request: httpx.Response(200, json=photo))
+            async with AsyncUnsplashAPI(access_key='dummy', client=httpx.AsyncClient(transport=transport)) as api:
+                return await api.get_photo_by_id(photo['id'], fields=['id', 'user.username'])
+
+        self.assertEqual({'id': photo['id'], 'user': {'username': photo['user']['username']}}, asyncio.run(main()))
@@ -0,0 +1,125 @@
+import asyncio
+import os
+import tempfile
+import unittest
+
+import httpx
+
+from unsplashapi import AsyncUnsplashAPI, BloomFilter
+from unsplashapi.seen import bloom_size
+
+from .helpers import make_response, stubbed_api
+
+
+class TestBloomFilter(unittest.TestCase):
+    """
+    Offline tests for the persistent seen-ID filter.
+    """
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, 'seen.bloom')
+
+    def test_size(self):
+        bits, hashes = bloom_size(10_000_000, 0.01)
+        self.assertLess(bits // 8, 12 * 1024 * 1024)
+        self.assertEqual(7, hashes)
+        with self.assertRaises(ValueError):
+            bloom_size(100, 1.5)
+
+    def test_add_and_persist(self):
+        with BloomFilter(self.path, capacity=1000) as seen:
+            self.assertTrue(seen.add('abc'))
+            self.assertFalse(seen.add('abc'))
+            self.assertIn('abc', seen)
+            self.assertEqual(1, len(seen))
+        self.assertEqual(8 + 24 + bloom_size(1000, 0.01)[0] // 8, os.path.getsize(self.path))
+
+        # Reopened with other parameters, the file keeps its own
+        with BloomFilter(self.path, capacity=5) as seen:
+            self.assertIn('abc', seen)
+            self.assertNotIn('xyz', seen)
+            self.assertEqual((1, bloom_size(1000, 0.01)[0]), (len(seen), seen.bits))
+
+    def test_false_positive_rate(self):
+        with BloomFilter(self.path, capacity=20_000, error_rate=0.01) as seen:
+            for i in range(20_000):
+                seen.add(f'photo-{i}')
+            self.assertTrue(all(f'photo-{i}' in seen for i in range(20_000)))
+            false_positives = sum(f'other-{i}' in seen for i in range(20_000))
+        self.assertLess(false_positives / 20_000, 0.02)
+
+    def test_rejects_other_files(self):
+        with open(self.path, 'wb') as file:
+            file.write(b'not a filter' * 10)
+        with self.assertRaises(ValueError):
+            BloomFilter(self.path)
+
+
+class TestSkipSeen(unittest.TestCase):
+    """
+    Offline tests for paginators skipping photos seen in earlier runs.
+    """
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, 'seen.bloom')
+
+        def request(method, url, params=None, **kwargs):
+            start = (params['page'] - 1) * params['per_page']
+            items = [{'id': str(i), 'likes': i} for i in range(start, min(start + params['per_page'], 25))]
+            body = {'total': 25, 'results': items} if url.endswith('/search/photos') else items
+            return make_response(json=body, headers={'X-Total': '25'})
+
+        self.api = stubbed_api(self, request)
+
+    def test_second_run_skips_known_photos(self):
+        with BloomFilter(self.path, capacity=1000) as seen:
+            pages = list(self.api.list_photos_paginate(page_limit=2, items_per_page=10, seen=seen))
+            self.assertEqual([10, 10], [len(page) for page in pages])
+        with BloomFilter(self.path) as seen:
+            pages = list(self.api.list_photos_paginate(items_per_page=10, seen=seen, fields=['likes']))
+        # Pages are still planned from the unfiltered responses
+        self.assertEqual([[], [], [{'id': str(i), 'likes': i} for i in range(20, 25)]], pages)
+
+    def test_marks_pages_once_consumed(self):
+        with BloomFilter(self.path, capacity=1000) as seen:
+            pages = self.api.list_photos_paginate(items_per_page=10, seen=seen)
+            next(pages)
+            next(pages)
+            pages.close()
+            # Only the first page was processed, the second comes again in the next run
+            self.assertEqual((True, False), ('9' in seen, '10' in seen))
+            self.assertEqual(10, len(seen))
+
+            hits = self.api.multi_search_photos(['ocean'], items_per_page=10, seen=seen)
+            self.assertEqual(['10', '11'], [next(hits)[1]['id'] for _ in range(2)])
+            hits.close()
+            self.assertEqual((True, False), ('10' in seen, '11' in seen))
+
+    def test_search_and_collection_photos(self):
+        with BloomFilter(self.path, capacity=1000) as seen:
+            for photo_id in ('0', '1', '2'):
+                seen.add(photo_id)
+            page, = self.api.search_photos('ocean', items_per_page=10, seen=seen)
+            self.assertEqual((25, 7), (page['total'], len(page['results'])))
+            photos = [photo for page in self.api.get_collection_photos('123', per_page=10, seen=seen) for photo in page]
+            self.assertEqual([str(i) for i in range(10, 25)], [photo['id'] for photo in photos])
+
+    def test_async(self):
+        def handler(request):
+            page = int(request.url.params['page'])
+            return httpx.Response(200, json=[{'id': str(i)} for i in range(10 * (page - 1), 10 * page)],
+                                  headers={'X-Total': '30'})
+
+        async def run(seen):
+            client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            async with AsyncUnsplashAPI(access_key='dummy', client=client) as api:
+                return [len(page) async for page in api.list_photos_paginate(seen=seen)]
+
+        with BloomFilter(self.path, capacity=1000) as seen:
+            seen.add('15')
+            self.assertEqual([10, 9, 10], asyncio.run(run(seen)))
+            self.assertEqual([0, 0, 0], asyncio.run(run(seen)))
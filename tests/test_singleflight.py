@@ -0,0 +1,81 @@
+import asyncio
+import threading
+import time
+import unittest
+from unittest import mock
+
+import httpx
+import requests
+
+from unsplashapi import AsyncUnsplashAPI, UnsplashAPI
+from unsplashapi.exceptions import UnsplashHTTPError
+from unsplashapi.singleflight import SingleFlight
+
+from .helpers import make_response
+
+
+class TestSingleFlight(unittest.TestCase):
+    """
+    Offline tests for coalescing concurrent identical requests.
+    """
+
+    def run_threads(self, target, count=20):
+        barrier = threading.Barrier(count)
+        results = []
+
+        def run():
+            barrier.wait()
+            try:
+                results.append(target())
+            except Exception as error:
+                results.append(error)
+
+        threads = [threading.Thread(target=run) for _ in range(count)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return results
+
+    def test_concurrent_calls_share_request(self):
+        def request(*args, **kwargs):
+            time.sleep(0.1)
+            return make_response(json={'id': 'abc'})
+
+        api = UnsplashAPI(access_key='dummy')
+        with mock.patch.object(requests.Session, 'request', side_effect=request) as session_request:
+            results = self.run_threads(lambda: api.get_photo_by_id('abc'))
+        self.assertEqual(1, session_request.call_count)
+        self.assertEqual([{'id': 'abc'}] * 20, results)
+
+    def test_error_shared(self):
+        def request(*args, **kwargs):
+            time.sleep(0.1)
+            return make_response(404)
+
+        api = UnsplashAPI(access_key='dummy')
+        with mock.patch.object(requests.Session, 'request', side_effect=request) as session_request:
+            results = self.run_threads(lambda: api.get_user_profile('someone'), count=5)
+        self.assertEqual(1, session_request.call_count)
+        self.assertTrue(all(isinstance(result, UnsplashHTTPError) for result in results))
+
+    def test_random_photo_not_coalesced(self):
+        self.assertFalse(SingleFlight().applies('/photos/random'))
+        self.assertTrue(SingleFlight().applies('/photos/abc'))
+
+    def test_async_concurrent_calls_share_request(self):
+        calls = []
+
+        async def handler(request):
+            calls.append(request.url.path)
+            await asyncio.sleep(0.05)
+            return httpx.Response(200, json=[{'id': 'topic'}])
+
+        async def run():
+            client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            async with AsyncUnsplashAPI(access_key='dummy', client=client) as api:
+                return await asyncio.gather(*(api.get_single_topic('nature') for _ in range(50)))
+
+        results = asyncio.run(run())
+        self.assertEqual(1, len(calls))
+        self.assertEqual(50, len(results))
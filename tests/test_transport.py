@@ -0,0 +1,89 @@
+import asyncio
+import socket
+import unittest
+
+import httpx
+import requests
+
+from unsplashapi import AsyncUnsplashAPI, TransportConfig, UnsplashAPI
+from unsplashapi.transport import TransportAdapter, h2
+
+from benchmarks.server import MockUnsplash
+
+
+class TestTransportConfig(unittest.TestCase):
+    """
+    Offline tests for the transport settings of the clients.
+    """
+
+    def test_default_session_pool(self):
+        api = UnsplashAPI(access_key='dummy')
+        adapter = api.session.get_adapter('https://api.unsplash.com/')
+        self.assertIsInstance(adapter, TransportAdapter)
+        self.assertEqual(32, adapter.poolmanager.connection_pool_kw['maxsize'])
+
+    def test_socket_options(self):
+        config = TransportConfig(tcp_keepalive=30)
+        api = UnsplashAPI(access_key='dummy', transport=config)
+        options = api.session.get_adapter('https://api.unsplash.com/').poolmanager.connection_pool_kw['socket_options']
+        self.assertIn((socket.IPPROTO_TCP, socket.TCP_NODELAY, 1), options)
+        self.assertIn((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1), options)
+
+    def test_mount_on_given_session(self):
+        session = requests.Session()
+        api = UnsplashAPI(access_key='dummy', session=session, transport=TransportConfig(pool_maxsize=64,
+                                                                                         keepalive=False))
+        self.assertIs(session, api.session)
+        self.assertEqual(64, session.get_adapter('https://api.unsplash.com/').poolmanager.connection_pool_kw['maxsize'])
+        self.assertEqual('close', session.headers['Connection'])
+
+    def test_given_session_unchanged_without_transport(self):
+        session = requests.Session()
+        UnsplashAPI(access_key='dummy', session=session)
+        self.assertNotIsInstance(session.get_adapter('https://api.unsplash.com/'), TransportAdapter)
+
+    def test_async_transport_not_dropped_with_given_client(self):
+        async def run():
+            async with httpx.AsyncClient() as client:
+                with self.assertRaises(ValueError):
+                    AsyncUnsplashAPI(access_key='dummy', client=client, transport=TransportConfig(max_connections=8))
+
+        asyncio.run(run())
+
+    def test_http2_requires_async_client(self):
+        with self.assertRaises(ValueError):
+            UnsplashAPI(access_key='dummy', transport=TransportConfig(http2=True))
+
+    @unittest.skipIf(h2 is not None, 'h2 is installed')
+    def test_http2_requires_h2(self):
+        with self.assertRaises(ImportError):
+            AsyncUnsplashAPI(access_key='dummy', transport=TransportConfig(http2=True))
+
+    def test_connections_reused(self):
+        with MockUnsplash() as server:
+            api = UnsplashAPI(access_key='dummy')
+            api.base_url = server.url
+            for index in range(5):
+                api.get_photo_by_id(f'photo{index}')
+            self.assertEqual(1, server.connections)
+
+            api = UnsplashAPI(access_key='dummy', transport=TransportConfig(keepalive=False))
+            api.base_url = server.url
+            for index in range(5):
+                api.get_photo_by_id(f'photo{index}')
+            self.assertEqual(6, server.connections)
+
+    def test_async_connections_reused(self):
+        async def run(server):
+            async with AsyncUnsplashAPI(access_key='dummy', transport=TransportConfig(max_connections=2)) as api:
+                api.base_url = server.url
+                photos, errors = await api.get_photos_by_ids([f'photo{index}' for index in range(10)])
+                return len(photos)
+
+        with MockUnsplash() as server:
+            self.assertEqual(10, asyncio.run(run(server)))
+            self.assertLessEqual(server.connections, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1 +1,11 @@
-from .api import UnsplashAPI
\ No newline at end of file
+from .api import UnsplashAPI
+from .aio import AsyncUnsplashAPI
+from .cache import MemoryCache, SQLiteCache
+from .exceptions import (DeadlineExceeded, RateLimitExceeded, UnsplashConnectionError, UnsplashError,
+                         UnsplashHTTPError)
+from .keypool import AccessKeyPool
+from .metrics import Metrics
+from .policy import RequestPolicy
+from .ratelimit import RateLimiter
+from .seen import BloomFilter
+from .transport import TransportConfig
@@ -0,0 +1,32 @@
+from .collection import AsyncUnsplashCollections
+from .photos import AsyncUnsplashPhotos, AsyncUnsplashSearch
+from .user import AsyncUnsplashUsers
+from .topics_stats import AsyncUnsplashStats, AsyncUnsplashTopics
+
+
+class AsyncUnsplashAPI(AsyncUnsplashCollections, AsyncUnsplashPhotos,
+                       AsyncUnsplashUsers, AsyncUnsplashSearch, AsyncUnsplashTopics, AsyncUnsplashStats):
+    """
+    This class combines all asynchronous subclasses in one interface.
+    """
+
+    def __init__(self, access_key, **kwargs):
+        """
+        Asynchronous version of UnsplashAPI with the same method surface. Methods are
+        coroutines, paginated methods are async generators. All requests share one
+        keep-alive connection pool, so many requests can be in flight at once.
+
+        Args:
+            access_key (str):       Access key for application from offifical API.
+            **kwargs:               Client options, see AsyncUnsplashBase:
+                                    client:             httpx.AsyncClient shared by all endpoints.
+                                    max_connections:    Size of the connection pool if a new client is created.
+                                    prefetch_pages:     Number of pages fetched ahead concurrently.
+
+        Usage:
+            async with AsyncUnsplashAPI(access_key='<your key>') as api:
+                photo = await api.get_photo_by_id(photo_id='ieic5Tq8YMk')
+                async for page in api.search_photos(query='ocean', number_of_pages=3):
+                    ...
+        """
+        super().__init__(access_key=access_key, **kwargs)
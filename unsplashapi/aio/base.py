@@ -0,0 +1,231 @@
+try:
+    import httpx
+except ImportError:  # pragma: no cover - optional dependency
+    httpx = None
+
+from ..base import NO_CACHE, UnsplashBase
+from ..cache import BaseCache
+from ..exceptions import UnsplashConnectionError
+from ..keypool import AccessKeyPool
+from ..middleware import Request, default_middleware
+from ..pagination import DEFAULT_PER_PAGE, aiter_items, apaginate_planned, askip_seen, last_page, pages_needed
+from ..policy import RequestPolicy
+from ..projection import compile_fields, project
+from ..ratelimit import RateLimiter
+from ..singleflight import AsyncSingleFlight
+from ..transport import TransportConfig
+
+
+class AsyncUnsplashBase:
+    """
+    Asynchronous counterpart of UnsplashBase. All requests of a client are sent
+    through one httpx.AsyncClient, which keeps a shared keep-alive connection pool.
+    Requires the optional dependency httpx (pip install unsplashapi[async]).
+    """
+
+    base_url = UnsplashBase.base_url
+    fixed_profile = UnsplashBase.fixed_profile
+    _decode = staticmethod(UnsplashBase._decode)
+
+    def __init__(self, access_key, client=None, max_connections: int = 100, prefetch_pages: int = 4,
+                 rate_limiter: RateLimiter = None, cache: BaseCache = None, policy: RequestPolicy = None,
+                 coalesce: bool = True, hooks: list = None, middleware: list = None,
+                 transport: TransportConfig = None) -> None:
+        """
+        Args:
+            access_key (str):                   Access key of the API. A list of keys or an AccessKeyPool
+                                                spreads the requests over multiple keys.
+            client (httpx.AsyncClient):         Client (connection pool) to use for all requests.
+                                                Defaults to a new client configured by `transport`.
+            max_connections (int, optional):    Size of the connection pool if a new client is created
+                                                without `transport`. Defaults to 100.
+            prefetch_pages (int, optional):     Number of pages paginated methods fetch ahead concurrently.
+                                                Defaults to 4.
+            rate_limiter (RateLimiter):         Records the rate limit headers of every response and 
+                                                optionally paces requests. Defaults to recording only.
+            cache (BaseCache, optional):        Cache for the responses of read endpoints. Defaults to None.
+            policy (RequestPolicy, optional):   Timeouts and retries of the requests. Defaults to RequestPolicy().
+            coalesce (bool, optional):          Concurrent identical GET requests share one HTTP call.
+                                                Defaults to True.
+            hooks (list, optional):             Callables receiving a RequestEvent after every HTTP call.
+                                                Defaults to None.
+            middleware (list, optional):        Middleware chain every request passes through, outermost first.
+                                                Defaults to middleware.default_middleware().
+            transport (TransportConfig):        Pool size, keep-alive, TCP settings and HTTP/2 of a new client.
+                                                Defaults to TransportConfig(max_connections=max_connections).
+
+        Raises:
+            ValueError: If both `client` and `transport` are passed, as the transport of an
+                        httpx.AsyncClient cannot be changed after its construction.
+        """
+        super().__init__()
+        if client is not None and transport is not None:
+            raise ValueError('transport only configures a new client, pass either client or transport')
+        if client is None:
+            if transport is None:
+                transport = TransportConfig(max_connections=max_connections)
+            client = transport.async_client()
+        if isinstance(access_key, str):
+            self.key_pool = None
+        else:
+            self.key_pool = access_key if isinstance(access_key, AccessKeyPool) else AccessKeyPool(access_key)
+            access_key = self.key_pool.access_keys[0]
+        self.access_key = access_key
+        self.client = client
+        self.prefetch_pages = prefetch_pages
+        self.rate_limiter = rate_limiter if rate_limiter is not None else RateLimiter(pace=False)
+        self.cache = cache
+        self.policy = policy if policy is not None else RequestPolicy()
+        self.single_flight = AsyncSingleFlight() if coalesce else None
+        self.hooks = list(hooks) if hooks else []
+        self.middleware = list(middleware) if middleware is not None else default_middleware()
+        self._last_headers = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+
+    async def aclose(self):
+        """
+        Closes the underlying connection pool.
+        """
+        await self.client.aclose()
+
+    def _url(self, endpoint: str) -> str:
+        return self.base_url.rstrip('/') + endpoint
+
+    async def _request(self, method: str, endpoint: str, headers: dict = None, **params):
+        """
+        Sends a request through the middleware chain of the client and returns the response.
+        """
+        return await self._dispatch(self._new_request(method, endpoint, params, headers))
+
+    async def _dispatch(self, request: Request):
+        """
+        Passes `request` through the middleware chain (`ahandle`) down to the transport.
+        """
+        chain = self.middleware
+
+        async def call(index, request):
+            if index == len(chain):
+                return await self._transport(request)
+            return await chain[index].ahandle(self, request, lambda request: call(index + 1, request))
+
+        return await call(0, request)
+
+    async def _transport(self, request: Request):
+        """
+        Sends a single attempt of `request` with the httpx client.
+
+        Raises:
+            UnsplashConnectionError: If no response was received.
+        """
+        connect_timeout, read_timeout = request.timeout
+        try:
+            return await self.client.request(request.method, self._url(request.endpoint),
+                                             params=dict(client_id=request.access_key, **request.params),
+                                             headers=request.headers,
+                                             timeout=httpx.Timeout(read_timeout, connect=connect_timeout),
+                                             extensions=request.extensions)
+        except httpx.TransportError as error:
+            raise UnsplashConnectionError(str(error)) from error
+
+    async def _get(self, endpoint: str, fields=None, **params):
+        """
+        Sends a GET request and returns the decoded JSON body, cut down to `fields` if given.
+
+        Raises:
+            UnsplashHTTPError: If the response status is not 2xx.
+        """
+        return project(self._decode(await self._request('GET', endpoint, **params)), fields)
+
+    _new_request = UnsplashBase._new_request
+    _is_cached = UnsplashBase._is_cached
+    _check_budget = UnsplashBase._check_budget
+    _invalidate = UnsplashBase._invalidate
+
+    async def _first_page(self, endpoint: str, fields=None, **params) -> tuple:
+        """
+        Fetches page 1 of an endpoint, like UnsplashBase._first_page.
+        """
+        response = await self._request('GET', endpoint, page=1, **params)
+        data = self._decode(response)
+
+        return project(data, fields), last_page(response.headers, data, params.get('per_page', DEFAULT_PER_PAGE))
+
+    def _paginate(self, endpoint: str, page_limit: int = None, fields=None, seen=None, **params):
+        """
+        Iterates over the pages of an endpoint like UnsplashBase._paginate, prefetching the
+        planned pages as asyncio tasks.
+
+        Returns:
+            Async generator yielding the contents of each page in order.
+        """
+        if seen is not None and fields is not None:
+            fields = [*([fields] if isinstance(fields, str) else fields), 'id']
+        fields = compile_fields(fields)
+
+        async def fetch_page(page):
+            return await self._get(endpoint, fields=fields, page=page, **params)
+
+        pages = apaginate_planned(lambda: self._first_page(endpoint, fields=fields, **params), fetch_page,
+                                  params.get('per_page', DEFAULT_PER_PAGE), page_limit, prefetch=self.prefetch_pages)
+
+        return pages if seen is None else askip_seen(pages, seen)
+
+    def _iter_items(self, endpoint: str, max_items: int = None, per_page: int = 30, page_limit: int = None,
+                    fields=None, **params):
+        """
+        Iterates over the single items of a paginated endpoint, like UnsplashBase._iter_items.
+
+        Returns:
+            Async generator yielding single items.
+        """
+        if max_items is not None:
+            per_page = max(min(per_page, max_items), 1)
+        pages = self._paginate(endpoint, pages_needed(max_items, per_page, page_limit), fields=fields,
+                               per_page=per_page, **params)
+
+        return aiter_items(pages, max_items)
+
+    @property
+    def rate_limit(self):
+        """
+        Rate limit per window as reported by the last response. Costs no request.
+        """
+        if self.key_pool is not None:
+            return self.key_pool.limit
+
+        return self.rate_limiter.limit
+
+    @property
+    def rate_limit_remaining(self):
+        """
+        Remaining requests as reported by the last response. Costs no request.
+        """
+        if self.key_pool is not None:
+            return self.key_pool.remaining
+
+        return self.rate_limiter.current_remaining()
+
+    async def get_current_rate_limit(self):
+        """
+        Returns the current rate Limit
+
+        Returns:
+            Remaining Requests.
+        """
+        response = await self._request('GET', f'/users/{self.fixed_profile}', headers=NO_CACHE)
+
+        return response.headers.get('X-Ratelimit-Remaining')
+
+    async def get_headers(self):
+        """
+        Returns the headers of the last response. Sends a request if none was made yet.
+        """
+        if self._last_headers is None:
+            await self._request('GET', f'/users/{self.fixed_profile}', headers=NO_CACHE)
+
+        return self._last_headers
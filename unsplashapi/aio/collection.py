@@ -0,0 +1,160 @@
+from ..bulk import SyncResult, arun_bulk, membership_diff
+from ..base import NO_CACHE
+from ..collection import UnsplashCollections
+from .base import AsyncUnsplashBase
+
+
+class AsyncUnsplashCollections(AsyncUnsplashBase):
+    """
+    Asynchronous version of UnsplashCollections.
+    API-Doc: https://unsplash.com/documentation#list-collections
+    """
+
+    def __init__(self, access_key: str, **kwargs):
+        super().__init__(access_key=access_key, **kwargs)
+
+    _invalidate_collection = UnsplashCollections._invalidate_collection
+
+    def list_collections_paginate(self, page_limit: int = 10, items_per_page: int = 10, fields: list = None):
+        """
+        Get a mulitple pages from collections.
+        see here: https://unsplash.com/documentation#list-collections
+
+        Yields:
+            Page contents (async generator).
+        """
+        return self._paginate('/collections', page_limit, per_page=items_per_page, fields=fields)
+
+    def iter_collections(self, max_items: int = None, items_per_page: int = 30, fields: list = None):
+        """
+        Iterates over single collections, see UnsplashCollections.iter_collections.
+
+        Yields:
+            Single collections (async generator).
+        """
+        return self._iter_items('/collections', max_items=max_items, per_page=items_per_page, fields=fields)
+
+    async def list_collection(self, page: int = 1, items_per_page: int = 10, fields: list = None):
+        """
+        Get a single page of collections.
+        see here: https://unsplash.com/documentation#list-collections
+        """
+        return await self._get('/collections', page=page, per_page=items_per_page, fields=fields)
+
+    async def get_collection_by_id(self, collection_id, fields: list = None):
+        """
+        Retrieve a collection by its ID.
+        see here: https://unsplash.com/documentation#get-a-collection
+        """
+        return await self._get(f'/collections/{collection_id}', fields=fields)
+
+    def get_collection_photos(self, collection_id, page_limit: int = 10, per_page: int = 10,
+                              fields: list = None, seen=None, **kwargs):
+        """
+        Get pages of the photos of a collection.
+        see here: https://unsplash.com/documentation#get-a-collections-photos
+
+        Yields:
+            Page contents (async generator).
+        """
+        return self._paginate(f'/collections/{collection_id}/photos', page_limit, per_page=per_page,
+                              fields=fields, seen=seen, **kwargs)
+
+    def iter_collection_photos(self, collection_id, max_items: int = None, per_page: int = 30,
+                               fields: list = None, **kwargs):
+        """
+        Iterates over single photos of a collection, see UnsplashCollections.iter_collection_photos.
+
+        Yields:
+            Single photos (async generator).
+        """
+        return self._iter_items(f'/collections/{collection_id}/photos', max_items=max_items, per_page=per_page,
+                                fields=fields, **kwargs)
+
+    async def get_related_collections(self, collections_id, fields: list = None):
+        """
+        Retrieve a list of collections related to this one.
+        see here: https://unsplash.com/documentation#list-a-collections-related-collections
+        """
+        return await self._get(f'/collections/{collections_id}/related', fields=fields)
+
+    async def create_new_collection(self, title: str, **kwargs):
+        """
+        Create a new collection. This requires the write_collections scope.
+        see here: https://unsplash.com/documentation#create-a-new-collection
+
+        Raises:
+            UnsplashHTTPError: If the response status is not 2xx.
+        """
+        return self._decode(await self._request('POST', '/collections', title=title, **kwargs))
+
+    async def update_collection(self, collections_id, **kwargs):
+        """
+        Update an existing collection belonging to the logged-in user. This requires the write_collections scope.
+        see here: https://unsplash.com/documentation#update-an-existing-collection
+        """
+        try:
+            return self._decode(await self._request('PUT', f'/collections/{collections_id}', **kwargs))
+        finally:
+            self._invalidate_collection(collections_id)
+
+    async def delete_collection(self, collections_id):
+        """
+        Delete a collection belonging to the logged-in user. This requires the write_collections scope.
+        see here: https://unsplash.com/documentation#delete-a-collection
+        """
+        try:
+            return self._decode(await self._request('DELETE', f'/collections/{collections_id}'))
+        finally:
+            self._invalidate_collection(collections_id)
+
+    async def add_photo_to_collection(self, collections_id, photo_id):
+        """
+        Add a photo to one of the logged-in user’s collections. Requires the write_collections scope.
+        see here; https://unsplash.com/documentation#add-a-photo-to-a-collection
+        """
+        try:
+            return self._decode(await self._request('POST', f'/collections/{collections_id}/add', photo_id=photo_id))
+        finally:
+            self._invalidate_collection(collections_id)
+
+    async def remove_photo_from_collection(self, collections_id, photo_id):
+        """
+        Remove a photo from one of the logged-in user’s collections. Requires the write_collections scope.
+        see here: https://unsplash.com/documentation#remove-a-photo-from-a-collection
+        """
+        try:
+            return self._decode(await self._request('DELETE', f'/collections/{collections_id}/remove',
+                                                    photo_id=photo_id))
+        finally:
+            self._invalidate_collection(collections_id)
+
+    async def sync_collection(self, collection_id, desired_photo_ids, max_workers: int = 8) -> SyncResult:
+        """
+        Makes the photos of a collection equal to `desired_photo_ids`, see UnsplashCollections.sync_collection.
+
+        Returns:
+            SyncResult:     Added and removed photos and the errors of failed mutations.
+        """
+        current = [photo['id'] async for photo in self.iter_collection_photos(collection_id, fields=['id'],
+                                                                              headers=NO_CACHE)]
+        to_add, to_remove = membership_diff(current, desired_photo_ids)
+        result = SyncResult(collection_id, unchanged=len(set(current)) - len(to_remove))
+
+        async def mutate(change):
+            action, photo_id = change
+            self._check_budget(f'/collections/{collection_id}/{action}')
+            if action == 'add':
+                return await self.add_photo_to_collection(collection_id, photo_id)
+            return await self.remove_photo_from_collection(collection_id, photo_id)
+
+        changes = [('remove', photo_id) for photo_id in to_remove] + [('add', photo_id) for photo_id in to_add]
+        async for (action, photo_id), _, error in arun_bulk(mutate, changes, max_workers=max_workers):
+            if error is not None:
+                result.errors[photo_id] = error
+            else:
+                (result.added if action == 'add' else result.removed).append(photo_id)
+        if result.added or result.removed:
+            self._invalidate_collection(collection_id)
+
+        return result
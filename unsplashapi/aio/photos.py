@@ -0,0 +1,224 @@
+from ..bulk import arun_bulk
+from ..fanout import SeenSet, afan_out, expand_searches
+from ..projection import compile_fields
+from .base import AsyncUnsplashBase
+
+
+class AsyncUnsplashPhotos(AsyncUnsplashBase):
+    """
+    Asynchronous version of UnsplashPhotos.
+    API-Doc: https://unsplash.com/documentation#list-photos
+    """
+
+    def __init__(self, access_key: str, **kwargs):
+        super().__init__(access_key=access_key, **kwargs)
+
+    def list_photos_paginate(self, page_limit: int = 10, items_per_page: int = 10, fields: list = None, seen=None,
+                             **kwargs):
+        """
+        Get a mulitple pages from the Editorial feed.
+        see here: https://unsplash.com/documentation#list-photos
+
+        Args:
+            page_limit (int, optional):     Defines Iteration Limit, when iterating over multiple pages. 
+                                            Defaults to 10.
+            items_per_page (int, optional): Defines how many items per page if multiple pages should be extracted
+                                            Defaults to 10.
+            **kwargs:
+                    order_by: str = 'latest'
+
+        Yields:
+            Page contents (async generator).
+        """
+        return self._paginate('/photos', page_limit, per_page=items_per_page, fields=fields, seen=seen, **kwargs)
+
+    def iter_photos(self, max_items: int = None, items_per_page: int = 30, fields: list = None, **kwargs):
+        """
+        Iterates over single photos of the Editorial feed, see UnsplashPhotos.iter_photos.
+
+        Yields:
+            Single photos (async generator).
+        """
+        return self._iter_items('/photos', max_items=max_items, per_page=items_per_page, fields=fields, **kwargs)
+
+    async def list_photos(self, items_per_page: int = 10, fields: list = None, **kwargs):
+        """
+        Get a single page from the Editorial feed.
+        see here: https://unsplash.com/documentation#list-photos
+        """
+        return await self._get('/photos', page=1, per_page=items_per_page, fields=fields, **kwargs)
+
+    async def get_photo_by_id(self, photo_id, fields: list = None):
+        """
+        Retrieve a single photo.
+        see here: https://unsplash.com/documentation#get-a-photo
+        """
+        return await self._get(f'/photos/{photo_id}', fields=fields)
+
+    def iter_photos_by_ids(self, photo_ids, max_workers: int = 32, fields: list = None):
+        """
+        Retrieves many photos concurrently, see UnsplashPhotos.iter_photos_by_ids.
+
+        Yields:
+            (photo_id, photo, error) in completion order (async generator).
+        """
+        async def fetch(photo_id):
+            self._check_budget(f'/photos/{photo_id}')
+            return await self.get_photo_by_id(photo_id, fields=fields)
+
+        return arun_bulk(fetch, dict.fromkeys(photo_ids), max_workers=max_workers)
+
+    async def get_photos_by_ids(self, photo_ids, max_workers: int = 32, fields: list = None):
+        """
+        Retrieves many photos concurrently, see UnsplashPhotos.get_photos_by_ids.
+
+        Returns:
+            (photos, errors):   Dictionaries mapping the photo IDs to the photo or to the raised exception.
+        """
+        photos, errors = {}, {}
+        async for photo_id, photo, error in self.iter_photos_by_ids(photo_ids, max_workers=max_workers, fields=fields):
+            if error is not None:
+                errors[photo_id] = error
+            else:
+                photos[photo_id] = photo
+
+        return photos, errors
+
+    async def get_random_photo(self, fields: list = None, **kwargs):
+        """
+        Returns a random photo.
+        see here: https://unsplash.com/documentation#get-a-random-photo
+        """
+        return await self._get('/photos/random', fields=fields, **kwargs)
+
+    async def get_photo_statistics(self, photo_id, fields: list = None):
+        """
+        Retrieves statistics of a single photo.
+        see here: https://unsplash.com/documentation#get-a-photos-statistics
+        """
+        return await self._get(f'/photos/{photo_id}/statistics', fields=fields)
+
+    async def track_photo_download(self, photo_id):
+        """
+        Tracks donwload of a photo.
+        see here: https://unsplash.com/documentation#track-a-photo-download
+        """
+        return await self._get(f'/photos/{photo_id}/download')
+
+    async def update_photo(self, photo_id, **kwargs):
+        """
+        Updating a user photo. Requires Write Access for user profile (API-Settings)
+        see here: https://unsplash.com/documentation#update-a-photo
+        """
+        return self._decode(await self._request('PUT', f'/photos/{photo_id}', **kwargs))
+
+    async def like_photo(self, photo_id):
+        """
+        Likes a photo. Needs write access within API-settings.
+        see here: https://unsplash.com/documentation#like-a-photo
+        """
+        return self._decode(await self._request('POST', f'/photos/{photo_id}/like'))
+
+    async def unlike_photo(self, photo_id):
+        """
+        Unlikes a photo. Needs write access in API settings.
+        see here: https://unsplash.com/documentation#unlike-a-photo
+        """
+        return self._decode(await self._request('DELETE', f'/photos/{photo_id}/like'))
+
+
+class AsyncUnsplashSearch(AsyncUnsplashBase):
+    """
+    Asynchronous version of UnsplashSearch.
+    Docs: https://unsplash.com/documentation#search
+    """
+
+    def __init__(self, access_key: str, **kwargs) -> None:
+        super().__init__(access_key=access_key, **kwargs)
+
+    def search_photos(self, query: str, number_of_pages: int = 1, items_per_page: int = 10,
+                      fields: list = None, seen=None, **kwargs):
+        """
+        Get pages of photo results for a query.
+        see here: https://unsplash.com/documentation#search
+
+        Yields:
+            Page contents (async generator).
+        """
+        return self._paginate('/search/photos', number_of_pages, query=query, per_page=items_per_page,
+                              fields=fields, seen=seen, **kwargs)
+
+    def iter_search_photos(self, query: str, max_items: int = None, items_per_page: int = 30,
+                           fields: list = None, **kwargs):
+        """
+        Iterates over single photo results of a query, see UnsplashSearch.iter_search_photos.
+
+        Yields:
+            Single photos (async generator).
+        """
+        return self._iter_items('/search/photos', max_items=max_items, per_page=items_per_page, query=query,
+                                fields=fields, **kwargs)
+
+    def multi_search_photos(self, queries, filters: list = None, max_items: int = None, pages_per_search: int = None,
+                            items_per_page: int = 30, fields: list = None, max_workers: int = 8,
+                            seen_size: int = 100_000, seen=None, errors: list = None):
+        """
+        Runs many photo searches concurrently and merges their results without duplicates,
+        see UnsplashSearch.multi_search_photos.
+
+        Yields:
+            (search, photo, score) (async generator).
+        """
+        if fields is not None:
+            fields = [*([fields] if isinstance(fields, str) else fields), 'id']
+        fields = compile_fields(fields)
+
+        async def fetch_page(params, page):
+            if page == 1:
+                return await self._first_page('/search/photos', fields=fields, per_page=items_per_page, **params)
+            return await self._get('/search/photos', fields=fields, page=page, per_page=items_per_page, **params), None
+
+        return afan_out(fetch_page, expand_searches(queries, filters), items_per_page, page_limit=pages_per_search,
+                        max_items=max_items, seen=SeenSet(seen_size) if seen is None else seen,
+                        max_workers=max_workers, errors=errors)
+
+    def search_collections(self, query: str, number_of_pages: int = 1, items_per_page: int = 10, fields: list = None):
+        """
+        Get pages of collection results for a query.
+        see here:  https://unsplash.com/documentation#search-collections
+
+        Yields:
+            Page contents (async generator).
+        """
+        return self._paginate('/search/collections', number_of_pages, query=query, per_page=items_per_page,
+                              fields=fields)
+
+    def iter_search_collections(self, query: str, max_items: int = None, items_per_page: int = 30, fields: list = None):
+        """
+        Iterates over single collection results of a query, see UnsplashSearch.iter_search_collections.
+
+        Yields:
+            Single collections (async generator).
+        """
+        return self._iter_items('/search/collections', max_items=max_items, per_page=items_per_page,
+                                query=query, fields=fields)
+
+    def search_users(self, query: str, number_of_pages: int = 1, items_per_page: int = 10, fields: list = None):
+        """
+        Get pages of user results for a query.
+        see here:  https://unsplash.com/documentation#search-users
+
+        Yields:
+            Page contents (async generator).
+        """
+        return self._paginate('/search/users', number_of_pages, query=query, per_page=items_per_page, fields=fields)
+
+    def iter_search_users(self, query: str, max_items: int = None, items_per_page: int = 30, fields: list = None):
+        """
+        Iterates over single user results of a query, see UnsplashSearch.iter_search_users.
+
+        Yields:
+            Single users (async generator).
+        """
+        return self._iter_items('/search/users', max_items=max_items, per_page=items_per_page, query=query,
+                                fields=fields)
@@ -0,0 +1,63 @@
+from .base import AsyncUnsplashBase
+
+
+class AsyncUnsplashTopics(AsyncUnsplashBase):
+    """
+    Asynchronous version of UnsplashTopics.
+    Doc: https://unsplash.com/documentation#topics
+    """
+
+    def __init__(self, access_key: str, **kwargs) -> None:
+        super().__init__(access_key=access_key, **kwargs)
+
+    def get_topics(self, ids: str, number_of_pages: int = 1, items_per_page: int = 10, order_by: str = 'position'):
+        """
+        Get pages from the list of all topics.
+        see: https://unsplash.com/documentation#topics
+
+        Yields:
+            Page contents (async generator).
+        """
+        return self._paginate('/topics', number_of_pages, ids=ids, per_page=items_per_page, order_by=order_by)
+
+    async def get_single_topic(self, ids: str) -> dict:
+        """
+        Get a single topic.
+        see: https://unsplash.com/documentation#get-a-topic
+        """
+        return await self._get('/topics', ids=ids)
+
+    def get_topic_photos(self, ids: str, number_of_pages: int = 1, items_per_page: int = 10, order_by: str = 'latest',
+                         **kwargs):
+        """
+        Retrieve a topic’s photos.
+        see: https://unsplash.com/documentation#get-a-topics-photos
+
+        Yields:
+            Page contents (async generator).
+        """
+        return self._paginate(f'/topics/{ids}/photos', number_of_pages, per_page=items_per_page, order_by=order_by,
+                              **kwargs)
+
+
+class AsyncUnsplashStats(AsyncUnsplashBase):
+    """
+    Asynchronous version of UnsplashStats. Docs: https://unsplash.com/documentation#stats
+    """
+
+    def __init__(self, access_key: str, **kwargs) -> None:
+        super().__init__(access_key=access_key, **kwargs)
+
+    async def get_stats_total(self) -> dict:
+        """
+        Get a list of counts for all of Unsplash.
+        see here: https://unsplash.com/documentation#totals
+        """
+        return await self._get('/stats/total')
+
+    async def get_stats_month(self) -> dict:
+        """
+        Get the overall Unsplash stats for the past 30 days.
+        see here: https://unsplash.com/documentation#month
+        """
+        return await self._get('/stats/month')
@@ -0,0 +1,129 @@
+from .base import AsyncUnsplashBase
+
+
+class AsyncUnsplashUsers(AsyncUnsplashBase):
+    """
+    Asynchronous version of UnsplashUsers.
+    see here: https://unsplash.com/documentation#users
+    """
+
+    def __init__(self, access_key: str, **kwargs):
+        super().__init__(access_key=access_key, **kwargs)
+
+    async def get_current_user(self, fields: list = None) -> dict:
+        """
+        Retrieve the profile of the logged-in user.
+        """
+        return await self._get('/me', fields=fields)
+
+    async def get_user_profile(self, username: str, fields: list = None) -> dict:
+        """
+        Retrieve public details on a given user.
+        see here: https://unsplash.com/documentation#get-a-users-public-profile
+        """
+        return await self._get(f'/users/{username}', fields=fields)
+
+    async def get_user_portfolio_link(self, username: str, fields: list = None) -> dict:
+        """
+        Retrieve a single user’s portfolio link.
+        see here: https://unsplash.com/documentation#get-a-users-portfolio-link
+        """
+        return await self._get(f'/users/{username}/portfolio', fields=fields)
+
+    async def list_user_photos(self, username: str, page: int = 1, items_per_page: int = 10, fields: list = None,
+                               **kwargs) -> list:
+        """
+        Get a page of the photos uploaded by a user, see UnsplashUsers.list_user_photos.
+        see here: https://unsplash.com/documentation#list-a-users-photos
+        """
+        return await self._get(f'/users/{username}/photos', page=page, per_page=items_per_page, fields=fields,
+                               **kwargs)
+
+    async def list_user_liked_photos(self, username: str, page: int = 1, items_per_page: int = 10,
+                                     fields: list = None, **kwargs) -> list:
+        """
+        Get a page of the photos liked by a user, see UnsplashUsers.list_user_liked_photos.
+        see here: https://unsplash.com/documentation#list-a-users-liked-photos
+        """
+        return await self._get(f'/users/{username}/likes', page=page, per_page=items_per_page, fields=fields,
+                               **kwargs)
+
+    async def list_user_liked_collections(self, username: str, page: int = 1, items_per_page: int = 10,
+                                          fields: list = None) -> list:
+        """
+        Get a page of the collections created by the user.
+        see here; https://unsplash.com/documentation#list-a-users-collections
+        """
+        return await self._get(f'/users/{username}/collections', page=page, per_page=items_per_page, fields=fields)
+
+    def list_user_photos_paginate(self, username: str, page_limit: int = 10, items_per_page: int = 30,
+                                  fields: list = None, **kwargs):
+        """
+        Get multiple pages of the photos uploaded by a user, see UnsplashUsers.list_user_photos_paginate.
+
+        Yields:
+            Page contents (async generator).
+        """
+        return self._paginate(f'/users/{username}/photos', page_limit, per_page=items_per_page, fields=fields,
+                              **kwargs)
+
+    def iter_user_photos(self, username: str, max_items: int = None, items_per_page: int = 30, fields: list = None,
+                         **kwargs):
+        """
+        Iterates over the single photos uploaded by a user, see UnsplashUsers.iter_user_photos.
+
+        Yields:
+            Single photos (async generator).
+        """
+        return self._iter_items(f'/users/{username}/photos', max_items=max_items, per_page=items_per_page,
+                                fields=fields, **kwargs)
+
+    def list_user_liked_photos_paginate(self, username: str, page_limit: int = 10, items_per_page: int = 30,
+                                        fields: list = None, **kwargs):
+        """
+        Get multiple pages of the photos liked by a user, see UnsplashUsers.list_user_liked_photos_paginate.
+
+        Yields:
+            Page contents (async generator).
+        """
+        return self._paginate(f'/users/{username}/likes', page_limit, per_page=items_per_page, fields=fields,
+                              **kwargs)
+
+    def iter_user_liked_photos(self, username: str, max_items: int = None, items_per_page: int = 30,
+                               fields: list = None, **kwargs):
+        """
+        Iterates over the single photos liked by a user, see UnsplashUsers.iter_user_liked_photos.
+
+        Yields:
+            Single photos (async generator).
+        """
+        return self._iter_items(f'/users/{username}/likes', max_items=max_items, per_page=items_per_page,
+                                fields=fields, **kwargs)
+
+    def list_user_liked_collections_paginate(self, username: str, page_limit: int = 10, items_per_page: int = 30,
+                                             fields: list = None):
+        """
+        Get multiple pages of the collections created by a user.
+
+        Yields:
+            Page contents (async generator).
+        """
+        return self._paginate(f'/users/{username}/collections', page_limit, per_page=items_per_page, fields=fields)
+
+    def iter_user_liked_collections(self, username: str, max_items: int = None, items_per_page: int = 30,
+                                    fields: list = None):
+        """
+        Iterates over the single collections created by a user.
+
+        Yields:
+            Single collections (async generator).
+        """
+        return self._iter_items(f'/users/{username}/collections', max_items=max_items, per_page=items_per_page,
+                                fields=fields)
+
+    async def get_user_statistics(self, username: str, fields: list = None) -> dict:
+        """
+        Retrieve the download, view and like statistics of a user.
+        see here: https://unsplash.com/documentation#get-a-users-statistics
+        """
+        return await self._get(f'/users/{username}/statistics', fields=fields)
@@ -10,7 +10,7 @@ class UnsplashAPI(UnsplashCollections, UnsplashPhotos,
     This class combines all subclasses in one interface.
     """
 
-    def __init__(self, access_key):
+    def __init__(self, access_key, **kwargs):
         """
         Inofficial Wrapper class for the Unsplash API. 
 
@@ -24,16 +24,17 @@ class UnsplashAPI(UnsplashCollections, UnsplashPhotos,
 
         Args:
             access_key (str):   Access key for application from offifical API.
+            **kwargs:           Client options, see UnsplashBase:
+                                session:            requests.Session shared by all endpoints.
+                                check_status:       Checks if the API is reachable on construction. Defaults to False, 
+                                                    so constructing the client makes no network call.
+                                prefetch_pages:     Number of pages the paginated methods fetch ahead in parallel.
 
         Usage:
             api = UnsplashAPI(access_key='<your key>')
             api.get_current_rate_limit()
             >>> '49'
         """
-        UnsplashCollections.__init__(self, access_key=access_key)
-        UnsplashPhotos.__init__(self, access_key=access_key)
-        UnsplashUsers.__init__(self, access_key=access_key)
-        UnsplashSearch.__init__(self, access_key=access_key)
-        UnsplashTopics.__init__(self, access_key=access_key)
-        UnsplashStats.__init__(self, access_key=access_key)
-        self.access_key = access_key
+        # One cooperative call runs every subclass __init__ (and UnsplashBase) exactly once,
+        # so all endpoints share a single session / connection pool.
+        super().__init__(access_key=access_key, **kwargs)
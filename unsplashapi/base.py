@@ -1,44 +1,328 @@
+import time
+
 import requests
 
+from .cache import BaseCache
+from .exceptions import RateLimitExceeded, UnsplashConnectionError, UnsplashHTTPError
+from .keypool import AccessKeyPool
+from .middleware import Request, default_middleware
+from .pagination import DEFAULT_PER_PAGE, iter_items, last_page, pages_needed, paginate_planned, skip_seen
+from .policy import RequestPolicy
+from .projection import compile_fields, project
+from .ratelimit import RateLimiter
+from .singleflight import SingleFlight
+from .transport import TransportConfig
+
+
+# Requests reading the rate limit headers always go to the API
+NO_CACHE = {'Cache-Control': 'no-cache'}
+
 
 class UnsplashBase:
 
     base_url = 'https://api.unsplash.com/'
     fixed_profile = 'simonstaehli'
 
-    def __init__(self, access_key: str) -> None:
+    def __init__(self, access_key, session: requests.Session = None, check_status: bool = False,
+                 prefetch_pages: int = 4, rate_limiter: RateLimiter = None,
+                 cache: BaseCache = None, policy: RequestPolicy = None, coalesce: bool = True,
+                 hooks: list = None, middleware: list = None, transport: TransportConfig = None) -> None:
+        """
+        Args:
+            access_key (str):                   Access key of the API. A list of keys or an AccessKeyPool
+                                                spreads the requests over multiple keys.
+            session (requests.Session):         Session (connection pool) to use for all requests.
+                                                Defaults to a new session configured by `transport`.
+            check_status (bool, optional):      Checks the API status on construction. 
+                                                Defaults to False, so constructing a client makes no request.
+            prefetch_pages (int, optional):     Number of pages paginated methods fetch ahead in parallel.
+                                                Defaults to 4. Use 1 to fetch page by page.
+            rate_limiter (RateLimiter):         Records the rate limit headers of every response. 
+                                                Defaults to a RateLimiter which does not pace requests,
+                                                pass RateLimiter() to spread requests over the rate limit window.
+            cache (BaseCache, optional):        Cache for the responses of read endpoints, e.g. MemoryCache().
+                                                Defaults to None (no caching).
+            policy (RequestPolicy, optional):   Timeouts and retries of the requests. 
+                                                Defaults to RequestPolicy().
+            coalesce (bool, optional):          Concurrent identical GET requests share one HTTP call.
+                                                Defaults to True.
+            hooks (list, optional):             Callables receiving a RequestEvent after every HTTP call,
+                                                e.g. metrics.Metrics(). Defaults to None.
+            middleware (list, optional):        Middleware chain every request passes through, outermost first
+                                                (see middleware.py). Defaults to middleware.default_middleware().
+            transport (TransportConfig):        Pool sizes, keep-alive and TCP settings of the session.
+                                                Defaults to TransportConfig() (32 pooled connections per host).
+        """
         super().__init__()
+        if isinstance(access_key, str):
+            self.key_pool = None
+        else:
+            self.key_pool = access_key if isinstance(access_key, AccessKeyPool) else AccessKeyPool(access_key)
+            access_key = self.key_pool.access_keys[0]
         self.access_key = access_key
-        self.session = requests.Session()
-        self._check_status()
+        if session is None:
+            session = (transport if transport is not None else TransportConfig()).session()
+        elif transport is not None:
+            transport.mount(session)
+        self.session = session
+        self.prefetch_pages = prefetch_pages
+        self.rate_limiter = rate_limiter if rate_limiter is not None else RateLimiter(pace=False)
+        self.cache = cache
+        self.policy = policy if policy is not None else RequestPolicy()
+        self.single_flight = SingleFlight() if coalesce else None
+        self.hooks = list(hooks) if hooks else []
+        self.middleware = list(middleware) if middleware is not None else default_middleware()
+        self._last_headers = None
+        self._status_code = None
+        if check_status:
+            self._check_status()
         
     def _check_status(self):
         """
-        Checks if the API is reachable.
+        Checks if the API is reachable. The request is only sent once per client,
+        later calls return the cached status code.
 
         Returns:
             API Status Code:    200 if everything is OK. 
         """
-        response = self.session.get(self.base_url)
-        assert response.status_code == 200, f'API not reachable Code: {response.status_code}'
+        if self._status_code is None:
+            response = self.session.get(self.base_url)
+            assert response.status_code == 200, f'API not reachable Code: {response.status_code}'
+            self._status_code = response.status_code
+
+        return self._status_code
+
+    def _request(self, method: str, endpoint: str, headers: dict = None, **params) -> requests.Response:
+        """
+        Sends a request to an endpoint through the middleware chain of the client
+        (see middleware.py) and returns the response.
+
+        Args:
+            method (str):       HTTP method
+            endpoint (str):     Path of the endpoint, e.g. '/photos'
+            headers (dict):     Additional request headers
+            **params:           Query parameters
+
+        Returns:
+            requests.Response, or a middleware.CachedResponse if answered from the cache.
+
+        Raises:
+            UnsplashConnectionError: If no response was received, also after retrying.
+        """
+        return self._dispatch(self._new_request(method, endpoint, params, headers))
+
+    def _new_request(self, method: str, endpoint: str, params: dict, headers: dict = None) -> Request:
+        """
+        Returns a Request with the access key, rate limiter and timeouts of the client, so the
+        transport works with any middleware chain. KeyPoolMiddleware and RetryMiddleware replace them.
+        """
+        request = Request(method, endpoint, params, headers)
+        request.access_key, request.rate_limiter = self.access_key, self.rate_limiter
+        request.timeout = self.policy.timeout(time.monotonic())
+
+        return request
 
-        return response.status_code
+    def _dispatch(self, request: Request):
+        """
+        Passes `request` through the middleware chain down to the transport.
+        """
+        chain = self.middleware
+
+        def call(index, request):
+            if index == len(chain):
+                return self._transport(request)
+            return chain[index].handle(self, request, lambda request: call(index + 1, request))
+
+        return call(0, request)
+
+    def _transport(self, request: Request) -> requests.Response:
+        """
+        Sends a single attempt of `request` with the session.
+
+        Raises:
+            UnsplashConnectionError: If no response was received.
+        """
+        try:
+            return self.session.request(request.method, self.base_url.rstrip('/') + request.endpoint,
+                                        params=dict(client_id=request.access_key, **request.params),
+                                        headers=request.headers, timeout=request.timeout)
+        except (requests.ConnectionError, requests.Timeout) as error:
+            raise UnsplashConnectionError(str(error)) from error
+
+    def _get(self, endpoint: str, fields=None, **params):
+        """
+        Sends a GET request to an endpoint and returns the decoded JSON body.
+
+        Args:
+            endpoint (str):             Path of the endpoint, e.g. '/photos'
+            fields (list, optional):    Dotted paths the body is cut down to (see projection.project).
+                                        Defaults to None (whole body).
+            **params:                   Query parameters
+
+        Raises:
+            UnsplashHTTPError: If the response status is not 2xx.
+        """
+        return project(self._decode(self._request('GET', endpoint, **params)), fields)
+
+    def _is_cached(self, endpoint: str, **params) -> bool:
+        """
+        Returns True if a fresh response for the request is in the cache.
+        """
+        if self.cache is None or self.cache.ttl_for(endpoint) <= 0:
+            return False
+        entry = self.cache.get(self.cache.make_key(endpoint, params))
+
+        return entry is not None and entry.fresh
+
+    def _invalidate(self, *endpoints: str) -> None:
+        """
+        Removes the cached responses of `endpoints` (all query parameters), e.g. after a mutation.
+        """
+        if self.cache is not None:
+            for endpoint in endpoints:
+                self.cache.invalidate(endpoint)
+
+    def _check_budget(self, endpoint: str, **params) -> None:
+        """
+        Fails fast, without a request, if the rate limit is used up and the request 
+        can not be answered from the cache.
+
+        Raises:
+            RateLimitExceeded: If no requests are remaining.
+        """
+        if self.rate_limit_remaining == 0 and not self._is_cached(endpoint, **params):
+            raise RateLimitExceeded(429, 0)
+
+    @staticmethod
+    def _decode(response):
+        """
+        Returns the decoded JSON body of a response, None for an empty body.
+        The body is only decoded once per response.
+
+        Raises:
+            RateLimitExceeded:  If the rate limit of the access key is used up.
+            UnsplashHTTPError:  If the response status is not 2xx.
+        """
+        if not 200 <= response.status_code < 300:
+            remaining = response.headers.get('X-Ratelimit-Remaining')
+            remaining = int(remaining) if remaining is not None else None
+            if response.status_code == 429 or (response.status_code == 403 and remaining == 0):
+                raise RateLimitExceeded(response.status_code, remaining, response)
+            raise UnsplashHTTPError(response.status_code, remaining, response)
+        if hasattr(response, '_decoded'):
+            return response._decoded
+        if response.status_code == 204 or not response.content:
+            return None
+        # Memoized, the response may be shared by several callers (see SingleFlight)
+        response._decoded = response.json()
+
+        return response._decoded
+
+    def _first_page(self, endpoint: str, fields=None, **params) -> tuple:
+        """
+        Fetches page 1 of an endpoint.
+
+        Returns:
+            (contents, last page): The last page as reported by the response, None if unknown.
+        """
+        response = self._request('GET', endpoint, page=1, **params)
+        data = self._decode(response)
+
+        return project(data, fields), last_page(response.headers, data, params.get('per_page', DEFAULT_PER_PAGE))
+
+    def _paginate(self, endpoint: str, page_limit: int = None, fields=None, seen=None, **params):
+        """
+        Iterates over the pages of an endpoint, starting at page 1. The remaining pages are
+        planned from the totals of the first response (X-Total, Link or `total_pages`), so
+        neither duplicate nor empty pages are requested, and prefetched in parallel
+        (see `prefetch_pages`). The pages are still yielded in order.
+
+        Args:
+            endpoint (str):             Path of the endpoint, e.g. '/photos'
+            page_limit (int, optional): Maximum number of pages. Defaults to None (until the last page).
+            fields (list, optional):    Dotted paths the items are cut down to. Defaults to None.
+            seen (optional):            Set of seen IDs (`add` returns False for known IDs), e.g. a BloomFilter.
+                                        Items seen before are removed from the pages. Defaults to None.
+            **params:                   Query parameters
+
+        Returns:
+            Generator yielding the contents of each page.
+        """
+        if seen is not None and fields is not None:
+            fields = [*([fields] if isinstance(fields, str) else fields), 'id']
+        fields = compile_fields(fields)
+        pages = paginate_planned(lambda: self._first_page(endpoint, fields=fields, **params),
+                                 lambda page: self._get(endpoint, fields=fields, page=page, **params),
+                                 params.get('per_page', DEFAULT_PER_PAGE), page_limit, prefetch=self.prefetch_pages)
+
+        return pages if seen is None else skip_seen(pages, seen)
+
+    def _iter_items(self, endpoint: str, max_items: int = None, per_page: int = 30, page_limit: int = None,
+                    fields=None, **params):
+        """
+        Iterates over the single items of a paginated endpoint, starting at page 1. 
+        Only the pages needed for `max_items` are requested, and a page is never larger
+        than `max_items`.
+
+        Args:
+            endpoint (str):                 Path of the endpoint, e.g. '/photos'
+            max_items (int, optional):      Maximum number of items. Defaults to None (until the last page).
+            per_page (int, optional):       Items per page (max. 30). Defaults to 30.
+            page_limit (int, optional):     Maximum number of pages. Defaults to None.
+            fields (list, optional):        Dotted paths the items are cut down to. Defaults to None.
+            **params:                       Query parameters
+
+        Returns:
+            Generator yielding single items.
+        """
+        if max_items is not None:
+            per_page = max(min(per_page, max_items), 1)
+        pages = self._paginate(endpoint, pages_needed(max_items, per_page, page_limit), fields=fields,
+                               per_page=per_page, **params)
+
+        return iter_items(pages, max_items)
+
+    @property
+    def rate_limit(self):
+        """
+        Rate limit of the access key per window, as reported by the last response. 
+        None until the first response was received. Costs no request.
+        With a key pool, the limits of all keys are summed up.
+        """
+        if self.key_pool is not None:
+            return self.key_pool.limit
+
+        return self.rate_limiter.limit
+
+    @property
+    def rate_limit_remaining(self):
+        """
+        Remaining requests in the current window, as reported by the last response. 
+        None until the first response was received. Costs no request.
+        With a key pool, the remaining requests of all keys are summed up.
+        """
+        if self.key_pool is not None:
+            return self.key_pool.remaining
+
+        return self.rate_limiter.current_remaining()
 
     def get_current_rate_limit(self):
         """
-        Returns the current rate Limit
+        Returns the current rate Limit. This sends a request, use the property 
+        `rate_limit_remaining` to read the value recorded from earlier responses.
 
         Returns:
             Remaining Requests.
         """
-        response = requests.get(f'https://api.unsplash.com/users/{self.fixed_profile}', 
-                                params=dict(client_id=self.access_key))
-        response_headers = dict(response.headers)
+        response = self._request('GET', f'/users/{self.fixed_profile}', headers=NO_CACHE)
 
-        return response_headers.get('X-Ratelimit-Remaining')
+        return response.headers.get('X-Ratelimit-Remaining')
 
     def get_headers(self):
-        response = requests.get(f'https://api.unsplash.com/users/{self.fixed_profile}', 
-                                params=dict(client_id=self.access_key))
+        """
+        Returns the headers of the last response. Sends a request if none was made yet.
+        """
+        if self._last_headers is None:
+            self._request('GET', f'/users/{self.fixed_profile}', headers=NO_CACHE)
 
-        return response.headers
\ No newline at end of file
+        return self._last_headers
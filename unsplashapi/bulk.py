@@ -0,0 +1,108 @@
+import asyncio
+import itertools
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import AsyncIterator, Awaitable, Callable, Iterable, Iterator
+
+
+class SyncResult:
+    """
+    Result of synchronizing the photos of a collection.
+
+    Attributes:
+        collection_id (str):    ID of the collection
+        added (list):           IDs of the photos added
+        removed (list):         IDs of the photos removed
+        unchanged (int):        Number of photos which were already in the collection and stay
+        errors (dict):          Photo IDs mapped to the exception of their failed mutation
+    """
+
+    __slots__ = ('collection_id', 'added', 'removed', 'unchanged', 'errors')
+
+    def __init__(self, collection_id: str, unchanged: int = 0) -> None:
+        self.collection_id = collection_id
+        self.added = []
+        self.removed = []
+        self.unchanged = unchanged
+        self.errors = {}
+
+    @property
+    def ok(self) -> bool:
+        """
+        True if all mutations succeeded.
+        """
+        return not self.errors
+
+    def __repr__(self) -> str:
+        return (f'SyncResult(collection_id={self.collection_id!r}, added={len(self.added)}, '
+                f'removed={len(self.removed)}, unchanged={self.unchanged}, errors={len(self.errors)})')
+
+
+def membership_diff(current: Iterable, desired: Iterable) -> tuple:
+    """
+    Returns the minimal changes turning the IDs `current` into `desired`: (to_add, to_remove),
+    both lists without duplicates in the order of their input.
+    """
+    current = dict.fromkeys(current)
+    desired = dict.fromkeys(desired)
+
+    return [item for item in desired if item not in current], [item for item in current if item not in desired]
+
+
+def run_bulk(func: Callable, items: Iterable, max_workers: int = 8) -> Iterator[tuple]:
+    """
+    Calls `func` for every item in a thread pool and yields the results in completion order.
+    At most `max_workers` calls run at once and only a small window of items is submitted
+    ahead, so arbitrarily long iterables can be processed. An error of a single item does
+    not abort the others. Closing the generator cancels all outstanding calls.
+
+    Args:
+        func (callable):                Function called with a single item.
+        items (iterable):               Items to process.
+        max_workers (int, optional):    Maximum number of concurrent calls. Defaults to 8.
+
+    Yields:
+        (item, result, error):  `error` is the raised exception (result None) or None.
+    """
+    items = iter(items)
+    executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='unsplashapi-bulk')
+    pending = {}
+    try:
+        for item in itertools.islice(items, 2 * max_workers):
+            pending[executor.submit(func, item)] = item
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                item = pending.pop(future)
+                for next_item in itertools.islice(items, 1):
+                    pending[executor.submit(func, next_item)] = next_item
+                error = future.exception()
+                yield item, None if error is not None else future.result(), error
+    finally:
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+async def arun_bulk(func: Callable[..., Awaitable], items: Iterable, max_workers: int = 8) -> AsyncIterator[tuple]:
+    """
+    Asynchronous version of `run_bulk`, which runs the calls as asyncio tasks.
+
+    Yields:
+        (item, result, error):  `error` is the raised exception (result None) or None.
+    """
+    items = iter(items)
+    pending = {}
+    try:
+        for item in itertools.islice(items, max_workers):
+            pending[asyncio.ensure_future(func(item))] = item
+        while pending:
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                item = pending.pop(task)
+                for next_item in itertools.islice(items, 1):
+                    pending[asyncio.ensure_future(func(next_item))] = next_item
+                error = task.exception()
+                yield item, None if error is not None else task.result(), error
+    finally:
+        for task in pending:
+            task.cancel()
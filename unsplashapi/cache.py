@@ -0,0 +1,345 @@
+import fnmatch
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from urllib.parse import urlencode
+
+
+# Headers which describe the original transfer or the rate limit state, not the content
+_VOLATILE_HEADERS = frozenset(['connection', 'content-encoding', 'content-length', 'date', 'keep-alive',
+                               'set-cookie', 'transfer-encoding', 'x-ratelimit-limit', 'x-ratelimit-remaining'])
+
+
+def cacheable_headers(headers) -> dict:
+    """
+    Returns the response headers stored with a cache entry, e.g. X-Total and Link of a page.
+    """
+    return {name: value for name, value in headers.items() if name.lower() not in _VOLATILE_HEADERS}
+
+
+class CacheEntry:
+    """
+    A cached response: the decoded body, the raw body (for persistent backends),
+    the validators for conditional requests, the response headers and the expiry time.
+    """
+
+    __slots__ = ('_data', 'body', 'etag', 'last_modified', 'expires', 'headers')
+
+    def __init__(self, data=None, body: bytes = None, etag: str = None, last_modified: str = None,
+                 expires: float = 0.0, headers: dict = None) -> None:
+        self._data = data
+        self.body = body
+        self.etag = etag
+        self.last_modified = last_modified
+        self.expires = expires
+        self.headers = headers if headers is not None else {}
+
+    @property
+    def data(self):
+        """
+        Decoded JSON body. Persistent backends only store the raw body, which is decoded on first access.
+        """
+        if self._data is None and self.body is not None:
+            self._data = json.loads(self.body)
+
+        return self._data
+
+    @property
+    def fresh(self) -> bool:
+        return time.time() < self.expires
+
+    def validators(self) -> dict:
+        """
+        Returns the headers for a conditional request revalidating this entry.
+        """
+        headers = {}
+        if self.etag:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified:
+            headers['If-Modified-Since'] = self.last_modified
+
+        return headers
+
+
+class BaseCache:
+    """
+    Base class of the response caches. Subclasses implement the storage (`get`, `set`,
+    `delete`, `clear`), this class implements the time-to-live per endpoint and the
+    hit / miss counters.
+
+    Time-to-live values are configured per endpoint with glob patterns, e.g.
+    `{'/stats/*': 3600, '/photos/*': 600}`. The first matching pattern wins, endpoints
+    without a match use `ttl`. A time-to-live <= 0 disables caching for an endpoint.
+    Random photos and download tracking are never cached.
+    """
+
+    never_cache = ('/photos/random', '/photos/*/download')
+    # Whether the raw response body is passed to `set` (needed by persistent backends)
+    keep_body = False
+
+    def __init__(self, ttl: float = 300.0, ttls: dict = None) -> None:
+        """
+        Args:
+            ttl (float, optional):  Default time-to-live of an entry in seconds. Defaults to 300.
+            ttls (dict, optional):  Time-to-live per endpoint pattern, e.g. {'/stats/*': 3600}.
+        """
+        self.ttl = ttl
+        self.ttls = [(pattern, 0) for pattern in self.never_cache] + list((ttls or {}).items())
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+        self._stats_lock = threading.Lock()
+
+    @staticmethod
+    def make_key(endpoint: str, params: dict) -> str:
+        """
+        Builds the cache key of a request from its endpoint and query parameters. 
+        The access key is not part of the key.
+        """
+        params = sorted((name, value) for name, value in params.items() if name != 'client_id')
+
+        return f'{endpoint}?{urlencode(params)}'
+
+    def ttl_for(self, endpoint: str) -> float:
+        """
+        Returns the time-to-live for responses of an endpoint.
+        """
+        for pattern, ttl in self.ttls:
+            if fnmatch.fnmatchcase(endpoint, pattern):
+                return ttl
+
+        return self.ttl
+
+    def record(self, hit: bool = False, revalidated: bool = False) -> None:
+        """
+        Counts a lookup. A successful revalidation (304) is counted as hit.
+        """
+        with self._stats_lock:
+            if hit or revalidated:
+                self.hits += 1
+            else:
+                self.misses += 1
+            if revalidated:
+                self.revalidations += 1
+
+    def stats(self) -> dict:
+        """
+        Returns:
+            dict:   Counters of hits, misses and revalidations, and the number of stored entries.
+        """
+        return dict(hits=self.hits, misses=self.misses, revalidations=self.revalidations, size=len(self))
+
+    def __len__(self) -> int:
+        raise NotImplementedError
+
+    def get(self, key: str):
+        """
+        Returns the entry stored for `key` (fresh or expired) or None.
+        """
+        raise NotImplementedError
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        raise NotImplementedError
+
+    def delete(self, key: str) -> None:
+        raise NotImplementedError
+
+    def invalidate(self, endpoint: str) -> None:
+        """
+        Deletes the entries of an endpoint for all query parameters.
+        """
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        raise NotImplementedError
+
+
+class MemoryCache(BaseCache):
+    """
+    In-memory response cache with a bounded size. When full, the least recently
+    used entry is evicted. Cached results are shared between calls and must not be
+    modified by the caller.
+
+    Usage:
+        api = UnsplashAPI(access_key='<your key>', cache=MemoryCache(maxsize=1024, ttls={'/stats/*': 3600}))
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 300.0, ttls: dict = None) -> None:
+        """
+        Args:
+            maxsize (int, optional):    Maximum number of entries. Defaults to 1024.
+            ttl (float, optional):      Default time-to-live of an entry in seconds. Defaults to 300.
+            ttls (dict, optional):      Time-to-live per endpoint pattern, see BaseCache.
+        """
+        super().__init__(ttl=ttl, ttls=ttls)
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+
+        return entry
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def invalidate(self, endpoint: str) -> None:
+        prefix = f'{endpoint}?'
+        with self._lock:
+            for key in [key for key in self._entries if key.startswith(prefix)]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class SQLiteCache(BaseCache):
+    """
+    Persistent response cache in a SQLite database. The cache survives restarts and
+    can be shared by all processes on a host, so every object is only fetched once 
+    per time-to-live. The database runs in WAL mode, which allows concurrent readers
+    while one process writes. The total size of the stored bodies is kept up to date
+    with every write; when it exceeds `max_bytes`, the entries expiring first are evicted.
+
+    Usage:
+        api = UnsplashAPI(access_key='<your key>', cache=SQLiteCache('/var/cache/unsplash.sqlite'))
+    """
+
+    keep_body = True
+
+    def __init__(self, path: str, max_bytes: int = 256 * 1024 ** 2, ttl: float = 300.0, ttls: dict = None,
+                 timeout: float = 30.0) -> None:
+        """
+        Args:
+            path (str):                 Path of the database file.
+            max_bytes (int, optional):  Maximum total size of the stored bodies. Defaults to 256 MiB.
+            ttl (float, optional):      Default time-to-live of an entry in seconds. Defaults to 300.
+            ttls (dict, optional):      Time-to-live per endpoint pattern, see BaseCache.
+            timeout (float, optional):  Seconds to wait for a lock held by another process. Defaults to 30.
+        """
+        super().__init__(ttl=ttl, ttls=ttls)
+        self.path = path
+        self.max_bytes = max_bytes
+        self.timeout = timeout
+        self._local = threading.local()
+        with self._connection() as connection:
+            connection.execute('CREATE TABLE IF NOT EXISTS responses ('
+                               'key TEXT PRIMARY KEY, body BLOB NOT NULL, etag TEXT, last_modified TEXT, '
+                               'expires REAL NOT NULL, size INTEGER NOT NULL, headers TEXT)')
+            connection.execute('CREATE INDEX IF NOT EXISTS responses_expires ON responses (expires)')
+            columns = [row[1] for row in connection.execute('PRAGMA table_info(responses)')]
+            if 'headers' not in columns:
+                connection.execute('ALTER TABLE responses ADD COLUMN headers TEXT')
+            # Running total of the body sizes, initialized from the entries of an existing database
+            connection.execute('CREATE TABLE IF NOT EXISTS totals (size INTEGER NOT NULL)')
+            connection.execute('INSERT INTO totals SELECT COALESCE(SUM(size), 0) FROM responses '
+                               'WHERE NOT EXISTS (SELECT 1 FROM totals)')
+
+    def _connection(self) -> sqlite3.Connection:
+        """
+        Returns the connection of the current thread. Connections are not shared
+        between threads or forked processes.
+        """
+        connection = getattr(self._local, 'connection', None)
+        if connection is None or self._local.pid != os.getpid():
+            connection = sqlite3.connect(self.path, timeout=self.timeout)
+            connection.execute('PRAGMA journal_mode=WAL')
+            connection.execute('PRAGMA synchronous=NORMAL')
+            self._local.connection = connection
+            self._local.pid = os.getpid()
+
+        return connection
+
+    def __len__(self) -> int:
+        return self._connection().execute('SELECT COUNT(*) FROM responses').fetchone()[0]
+
+    @property
+    def size(self) -> int:
+        """
+        Total size of the stored bodies in bytes.
+        """
+        return self._connection().execute('SELECT size FROM totals').fetchone()[0]
+
+    def get(self, key: str):
+        row = self._connection().execute('SELECT body, etag, last_modified, expires, headers FROM responses '
+                                         'WHERE key = ?', (key,)).fetchone()
+        if row is None:
+            return None
+
+        body, etag, last_modified, expires, headers = row
+        return CacheEntry(body=body, etag=etag, last_modified=last_modified, expires=expires,
+                          headers=json.loads(headers) if headers else None)
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        body = entry.body if entry.body is not None else json.dumps(entry.data).encode()
+        with self._connection() as connection:
+            # The first statement writes, so the transaction holds the write lock from the start
+            connection.execute('UPDATE totals SET size = size + ? - '
+                               'COALESCE((SELECT size FROM responses WHERE key = ?), 0)', (len(body), key))
+            connection.execute('INSERT OR REPLACE INTO responses (key, body, etag, last_modified, expires, size, '
+                               'headers) VALUES (?, ?, ?, ?, ?, ?, ?)',
+                               (key, body, entry.etag, entry.last_modified, entry.expires, len(body),
+                                json.dumps(entry.headers) if entry.headers else None))
+            excess = connection.execute('SELECT size FROM totals').fetchone()[0] - self.max_bytes
+            if excess > 0:
+                self._evict(connection, excess)
+
+    @staticmethod
+    def _evict(connection: sqlite3.Connection, excess: int) -> None:
+        """
+        Deletes the entries expiring first until at least `excess` bytes are freed.
+        """
+        keys, freed = [], 0
+        for key, size in connection.execute('SELECT key, size FROM responses ORDER BY expires, key'):
+            keys.append((key,))
+            freed += size
+            if freed >= excess:
+                break
+        connection.executemany('DELETE FROM responses WHERE key = ?', keys)
+        connection.execute('UPDATE totals SET size = size - ?', (freed,))
+
+    def delete(self, key: str) -> None:
+        with self._connection() as connection:
+            connection.execute('UPDATE totals SET size = size - '
+                               'COALESCE((SELECT size FROM responses WHERE key = ?), 0)', (key,))
+            connection.execute('DELETE FROM responses WHERE key = ?', (key,))
+
+    def invalidate(self, endpoint: str) -> None:
+        prefix = f'{endpoint}?'
+        with self._connection() as connection:
+            connection.execute('UPDATE totals SET size = size - (SELECT COALESCE(SUM(size), 0) FROM responses '
+                               'WHERE substr(key, 1, ?) = ?)', (len(prefix), prefix))
+            connection.execute('DELETE FROM responses WHERE substr(key, 1, ?) = ?', (len(prefix), prefix))
+
+    def clear(self) -> None:
+        with self._connection() as connection:
+            connection.execute('DELETE FROM responses')
+            connection.execute('UPDATE totals SET size = 0')
+
+    def close(self) -> None:
+        """
+        Closes the connection of the current thread.
+        """
+        connection = getattr(self._local, 'connection', None)
+        if connection is not None:
+            connection.close()
+            self._local.connection = None
@@ -1,5 +1,5 @@
-import requests
-from .base import UnsplashBase
+from .base import NO_CACHE, UnsplashBase
+from .bulk import SyncResult, membership_diff, run_bulk
 
 
 class UnsplashCollections(UnsplashBase):
@@ -9,18 +9,22 @@ class UnsplashCollections(UnsplashBase):
     API-Doc: https://unsplash.com/documentation#list-collections
     """
 
-    def __init__(self, access_key: str):
+    def __init__(self, access_key: str, **kwargs):
         """
 
 
         Args:
             access_key (str):       Access Key of the API
         """ 
-        super().__init__(access_key=access_key)
-        self.access_key = access_key
+        super().__init__(access_key=access_key, **kwargs)
 
+    def _invalidate_collection(self, collections_id) -> None:
+        """
+        Drops the cached responses of a collection and its photos after a mutation.
+        """
+        self._invalidate(f'/collections/{collections_id}', f'/collections/{collections_id}/photos')
 
-    def list_collections_paginate(self, page_limit: int = 10, items_per_page: int = 10):
+    def list_collections_paginate(self, page_limit: int = 10, items_per_page: int = 10, fields: list = None):
         """
         Get a mulitple pages from collections.
         see here: https://unsplash.com/documentation#list-collections
@@ -29,23 +33,32 @@ class UnsplashCollections(UnsplashBase):
         ----------
         page_limit:             Defines Iteration Limit, when iterating over multiple pages.
         items_per_page:         Defines how many items per page if multiple pages should be extracted
+        fields:                 Dotted paths each record is cut down to, e.g. ['id', 'urls.small']
 
         Returns
         -------
         Iterator
         """
-        endpoint = self.base_url + '/collections'
-        for i in range(page_limit):
-            response = self.session.get(endpoint,
-                                        params=dict(client_id=self.access_key,
-                                                    page=i,
-                                                    per_page=items_per_page))
-            if not response.status_code == 200:
-                raise Exception(f'Not able to extract content. Code - {response.status_code}')
-
-            yield response.json()
-
-    def list_collection(self, page: int = 1, items_per_page: int = 10):
+        return self._paginate('/collections', page_limit, per_page=items_per_page, fields=fields)
+
+    def iter_collections(self, max_items: int = None, items_per_page: int = 30, fields: list = None):
+        """
+        Iterates over single collections. Stops requesting pages as soon as `max_items`
+        collections were produced.
+        see here: https://unsplash.com/documentation#list-collections
+
+        Args:
+            max_items (int, optional):      Maximum number of collections. Defaults to None (all collections).
+            items_per_page (int, optional): Number of items per request (max. 30). Defaults to 30.
+            fields (list, optional):        Dotted paths each record is cut down to, e.g. ['id', 'urls.small'].
+                                            Defaults to None (whole records).
+
+        Yields:
+            Dictionary of a single collection.
+        """
+        return self._iter_items('/collections', max_items=max_items, per_page=items_per_page, fields=fields)
+
+    def list_collection(self, page: int = 1, items_per_page: int = 10, fields: list = None):
         """
         Get a single page from the Editorial feed.
         see here: https://unsplash.com/documentation#list-collections
@@ -54,22 +67,15 @@ class UnsplashCollections(UnsplashBase):
         ----------
         page:                Page to extract data from 
         items_per_page:      Defines how many items per page should be extracted
+        fields:              Dotted paths each record is cut down to, e.g. ['id', 'urls.small']
 
         Returns
         -------
         Dictionary of Items
         """
-        endpoint = self.base_url + '/collections'
-        response = self.session.get(endpoint,
-                                    params=dict(client_id=self.access_key,
-                                                page=page,
-                                                per_page=items_per_page))
-        if not response.status_code == 200:
-            raise Exception(f'Not able to extract content. Code - {response.status_code}')
+        return self._get('/collections', page=page, per_page=items_per_page, fields=fields)
 
-        return response.json()
-
-    def get_collection_by_id(self, collection_id):
+    def get_collection_by_id(self, collection_id, fields: list = None):
         """
         Retrieve a collection by its ID.
         see here: https://unsplash.com/documentation#get-a-collection
@@ -77,21 +83,16 @@ class UnsplashCollections(UnsplashBase):
         Parameters
         ----------
         collection_id:   ID of the photo
+        fields:          Dotted paths each record is cut down to, e.g. ['id', 'urls.small']
 
         Returns
         -------
         Dictionary of Items
         """
-        endpoint = self.base_url + f'/collections/{collection_id}'
-        response = self.session.get(endpoint,
-                                    params=dict(client_id=self.access_key))
-        if not response.status_code == 200:
-            raise Exception(f'Not able to extract content. Code - {response.status_code}')
-
-        return response.json()
+        return self._get(f'/collections/{collection_id}', fields=fields)
 
     def get_collection_photos(self, collection_id, page_limit: int = 10, per_page: int = 10,
-                               **kwargs):
+                              fields: list = None, seen=None, **kwargs):
         """
         Returns pageable object. More infos: https://unsplash.com/documentation#get-a-collections-photos
 
@@ -102,27 +103,42 @@ class UnsplashCollections(UnsplashBase):
             per_page (int, optional):           Number of Elements per page
                                                 Defaults to 10.
             **kwargs:                           see here https://unsplash.com/documentation#get-a-collections-photos
+            fields (list, optional):            Dotted paths each record is cut down to, e.g. ['id', 'urls.small'].
+                                                Defaults to None (whole records).
+            seen (optional):                    Set of seen IDs, e.g. a persistent BloomFilter. Photos seen
+                                                before are removed from the pages. Defaults to None.
 
         Raises:
-            Exception: Response Status
+            UnsplashHTTPError: If the response status is not 2xx.
 
         Yields:
             Dictionary with Elements
         """
-        endpoint = self.base_url + f'/collections/{collection_id}/photos'
+        return self._paginate(f'/collections/{collection_id}/photos', page_limit, per_page=per_page,
+                              fields=fields, seen=seen, **kwargs)
 
-        for i in range(page_limit):
-            response = self.session.get(endpoint,
-                                        params=dict(client_id=self.access_key,
-                                                    page=i,
-                                                    per_page=per_page, 
-                                                    **kwargs))
-            if not response.status_code == 200:
-                raise Exception(f'Not able to extract content. Code - {response.status_code}')
+    def iter_collection_photos(self, collection_id, max_items: int = None, per_page: int = 30,
+                               fields: list = None, **kwargs):
+        """
+        Iterates over single photos of a collection. Stops requesting pages as soon as 
+        `max_items` photos were produced.
+        see here: https://unsplash.com/documentation#get-a-collections-photos
+
+        Args:
+            collection_id:                  ID of the collection
+            max_items (int, optional):      Maximum number of photos. Defaults to None (all photos).
+            per_page (int, optional):       Number of items per request (max. 30). Defaults to 30.
+            **kwargs:                       see here https://unsplash.com/documentation#get-a-collections-photos
+            fields (list, optional):        Dotted paths each record is cut down to, e.g. ['id', 'urls.small'].
+                                            Defaults to None (whole records).
 
-            yield response.json()
+        Yields:
+            Dictionary of a single photo.
+        """
+        return self._iter_items(f'/collections/{collection_id}/photos', max_items=max_items, per_page=per_page,
+                                fields=fields, **kwargs)
 
-    def get_related_collections(self, collections_id):
+    def get_related_collections(self, collections_id, fields: list = None):
         """
         Retrieve a list of collections related to this one.
         see here: https://unsplash.com/documentation#list-a-collections-related-collections
@@ -130,22 +146,16 @@ class UnsplashCollections(UnsplashBase):
 
         Args:
             collections_id (_type_):       ID of the collection
+            fields (list, optional):       Dotted paths each record is cut down to, e.g. ['id', 'urls.small'].
+                                           Defaults to None (whole records).
 
         Raises:
-            Exception: Exception
+            UnsplashHTTPError: If the response status is not 2xx.
 
         Returns:
             _type_: _description_
         """
-        endpoint = self.base_url + f'/collections/{collections_id}/related'
-
-        response = self.session.get(endpoint,
-                                    params=dict(client_id=self.access_key))
-
-        if not response.status_code == 200:
-            raise Exception(f'Not able to extract content. Code - {response.status_code}')
-
-        return response.json()
+        return self._get(f'/collections/{collections_id}/related', fields=fields)
 
     def create_new_collection(self, title: str, **kwargs):
         """
@@ -157,28 +167,16 @@ class UnsplashCollections(UnsplashBase):
             kwargs;             see here: https://unsplash.com/documentation#create-a-new-collection
 
         Raises:
-            Exception: Exception
+            UnsplashHTTPError: If the response status is not 2xx.
 
         Returns:
             response: Responds with the new collection:
         """
 
-        endpoint = self.base_url + f'/collections'
-        response = self.session.post(endpoint,
-                                     params=dict(client_id=self.access_key, 
-                                                 title=title, **kwargs))
-        if not response.status_code == 200:
-            raise Exception(f'Not able to extract content. Code - {response.status_code}')
-
-        return response.json()
+        return self._decode(self._request('POST', '/collections', title=title, **kwargs))
 
     def update_photo(self, photo_id, **kwargs):
-        endpoint = self.base_url + f'/photos/{photo_id}'
-        response = self.session.put(endpoint,
-                                    params=dict(client_id=self.access_key,
-                                                **kwargs))
-
-        return response.json()
+        return self._decode(self._request('PUT', f'/photos/{photo_id}', **kwargs))
 
     def update_collection(self, collections_id, **kwargs):
         """
@@ -193,12 +191,10 @@ class UnsplashCollections(UnsplashBase):
             response: Responds with the new collection:
         """
 
-        endpoint = self.base_url + f'/collections/{collections_id}'
-        response = self.session.put(endpoint,
-                                     params=dict(client_id=self.access_key, 
-                                                **kwargs))
-
-        return response.json()
+        try:
+            return self._decode(self._request('PUT', f'/collections/{collections_id}', **kwargs))
+        finally:
+            self._invalidate_collection(collections_id)
 
     def delete_collection(self, collections_id):
         """
@@ -211,11 +207,10 @@ class UnsplashCollections(UnsplashBase):
         Returns:
             response: Responds with a 204 status and an empty body.
         """
-        endpoint = self.base_url + f'/collections/{collections_id}'
-        response = self.session.delete(endpoint,
-                                       params=dict(client_id=self.access_key))
-
-        return response.json()
+        try:
+            return self._decode(self._request('DELETE', f'/collections/{collections_id}'))
+        finally:
+            self._invalidate_collection(collections_id)
 
     def add_photo_to_collection(self, collections_id, photo_id):
         """
@@ -229,12 +224,10 @@ class UnsplashCollections(UnsplashBase):
             collections_id (_type_):        ID of the collection
             photo_id (_type_):              Id of the image to add to the collection
         """
-        endpoint = self.base_url + f'/collections/{collections_id}/add'
-        response = self.session.post(endpoint,
-                                       params=dict(client_id=self.access_key, 
-                                                   photo_id=photo_id))
-
-        return response.json()
+        try:
+            return self._decode(self._request('POST', f'/collections/{collections_id}/add', photo_id=photo_id))
+        finally:
+            self._invalidate_collection(collections_id)
 
     def remove_photo_from_collection(self, collections_id, photo_id):
         """
@@ -246,16 +239,49 @@ class UnsplashCollections(UnsplashBase):
             collections_id (_type_):        ID of the collection
             photo_id (_type_):              ID of the photo to remove from collection.
         """
-        endpoint = self.base_url + f'/collections/{collections_id}/remove'
-        response = self.session.delete(endpoint,
-                                       params=dict(client_id=self.access_key, 
-                                                   photo_id=photo_id))
-
-        return response.json()
-
-    
-
+        try:
+            return self._decode(self._request('DELETE', f'/collections/{collections_id}/remove', photo_id=photo_id))
+        finally:
+            self._invalidate_collection(collections_id)
 
+    def sync_collection(self, collection_id, desired_photo_ids, max_workers: int = 8) -> SyncResult:
+        """
+        Makes the photos of a collection equal to `desired_photo_ids` with the minimal number of
+        requests: the current photos are listed (IDs only, bypassing the cache), then only the missing
+        photos are added and the surplus photos removed, concurrently. Cached responses of the
+        collection are dropped afterwards. Requires the write_collections scope.
 
+        Args:
+            collection_id:                  ID of the collection
+            desired_photo_ids (iterable):   IDs of the photos the collection should contain
+            max_workers (int, optional):    Maximum number of concurrent mutations. Defaults to 8.
 
+        Raises:
+            UnsplashHTTPError: If the photos of the collection can not be listed.
 
+        Returns:
+            SyncResult:     Added and removed photos; failed mutations are reported in `errors`
+                            without aborting the others.
+        """
+        current = [photo['id'] for photo in self.iter_collection_photos(collection_id, fields=['id'],
+                                                                        headers=NO_CACHE)]
+        to_add, to_remove = membership_diff(current, desired_photo_ids)
+        result = SyncResult(collection_id, unchanged=len(set(current)) - len(to_remove))
+
+        def mutate(change):
+            action, photo_id = change
+            self._check_budget(f'/collections/{collection_id}/{action}')
+            if action == 'add':
+                return self.add_photo_to_collection(collection_id, photo_id)
+            return self.remove_photo_from_collection(collection_id, photo_id)
+
+        changes = [('remove', photo_id) for photo_id in to_remove] + [('add', photo_id) for photo_id in to_add]
+        for (action, photo_id), _, error in run_bulk(mutate, changes, max_workers=max_workers):
+            if error is not None:
+                result.errors[photo_id] = error
+            else:
+                (result.added if action == 'add' else result.removed).append(photo_id)
+        if result.added or result.removed:
+            self._invalidate_collection(collection_id)
+
+        return result
@@ -0,0 +1,116 @@
+import json
+import os
+import tempfile
+from datetime import datetime
+from typing import Callable, Iterator
+
+
+class Checkpoint:
+    """
+    Small JSON file with the state of an incremental crawl:
+
+        watermark:  `id` and `created_at` of the newest item of the last finished crawl.
+        crawl:      State of an unfinished crawl (last completed page, newest and oldest
+                    item yielded so far and the watermark it stops at), or missing.
+
+    The file is replaced atomically, so an interrupted process never leaves a torn checkpoint.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.state = self.load()
+
+    def load(self) -> dict:
+        try:
+            with open(self.path, encoding='utf-8') as file:
+                return json.load(file)
+        except FileNotFoundError:
+            return {}
+
+    def save(self) -> None:
+        directory = os.path.dirname(os.path.abspath(self.path))
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.checkpoint-', suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as file:
+                json.dump(self.state, file)
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    @property
+    def watermark(self) -> dict:
+        return self.state.get('watermark')
+
+
+def _created(item: dict) -> datetime:
+    return datetime.fromisoformat(item['created_at'].replace('Z', '+00:00'))
+
+
+def _marker(item: dict) -> dict:
+    return {'id': item['id'], 'created_at': item['created_at']}
+
+
+def crawl_latest(fetch_page: Callable[[int], list], checkpoint: Checkpoint, page_limit: int = None) -> Iterator[dict]:
+    """
+    Yields the items of a feed ordered by `created_at` (newest first), which are newer
+    than the watermark of `checkpoint`. Pagination stops at the first known item, so a
+    poll without new items costs a single request. Items sharing a `created_at` are told
+    apart by their `id`.
+
+    After every completed page the progress is saved. An interrupted crawl (exception,
+    closed generator or `page_limit` reached) continues after the last completed page on
+    the next call; items shifted onto later pages by new uploads are not yielded twice.
+    The watermark moves to the newest item once the crawl reached known items or the end
+    of the feed.
+
+    Args:
+        fetch_page (callable):          Function returning the items of a page number (starting at 1).
+        checkpoint (Checkpoint):        Checkpoint of the crawl.
+        page_limit (int, optional):     Maximum number of pages per call. Defaults to None.
+
+    Yields:
+        New items, newest first.
+    """
+    crawl = checkpoint.state.get('crawl') or {'page': 0, 'stop_at': checkpoint.watermark,
+                                               'newest': None, 'oldest': None, 'oldest_ids': []}
+    stop_at = _created(crawl['stop_at']) if crawl['stop_at'] else None
+    stop_id = crawl['stop_at']['id'] if crawl['stop_at'] else None
+    oldest = _created(crawl['oldest']) if crawl['oldest'] else None
+    # IDs yielded with the `created_at` of the oldest item, photos may share a timestamp
+    oldest_ids = crawl.setdefault('oldest_ids', [crawl['oldest']['id']] if crawl['oldest'] else [])
+
+    fetched = 0
+    while page_limit is None or fetched < page_limit:
+        page = crawl['page'] + 1
+        items = fetch_page(page)
+        fetched += 1
+        for item in items:
+            created = _created(item)
+            if item['id'] == stop_id or (stop_at is not None and created < stop_at):
+                break
+            if oldest is not None and (created > oldest or (created == oldest and item['id'] in oldest_ids)):
+                continue
+            yield item
+            if crawl['newest'] is None:
+                crawl['newest'] = _marker(item)
+            if created != oldest:
+                oldest_ids.clear()
+            oldest_ids.append(item['id'])
+            crawl['oldest'] = _marker(item)
+            oldest = created
+        else:
+            if items:
+                crawl['page'] = page
+                checkpoint.state['crawl'] = crawl
+                checkpoint.save()
+                continue
+
+        break
+    else:
+        return
+
+    if crawl['newest'] is not None:
+        checkpoint.state['watermark'] = crawl['newest']
+    checkpoint.state.pop('crawl', None)
+    checkpoint.save()
@@ -0,0 +1,159 @@
+import os
+import time
+
+import requests
+
+from .exceptions import UnsplashConnectionError, UnsplashHTTPError
+
+
+class DownloadResult:
+    """
+    Result of a single image download.
+
+    Attributes:
+        photo_id (str):     ID of the photo
+        path (str):         Path of the downloaded file
+        bytes (int):        Number of bytes transferred by this download (without resumed bytes)
+        seconds (float):    Duration of the transfer
+        resumed (bool):     True if an existing partial file was continued
+        skipped (bool):     True if the file existed already and nothing was downloaded
+    """
+
+    __slots__ = ('photo_id', 'path', 'bytes', 'seconds', 'resumed', 'skipped')
+
+    def __init__(self, photo_id: str, path: str, bytes: int = 0, seconds: float = 0.0, resumed: bool = False,
+                 skipped: bool = False) -> None:
+        self.photo_id = photo_id
+        self.path = path
+        self.bytes = bytes
+        self.seconds = seconds
+        self.resumed = resumed
+        self.skipped = skipped
+
+    @property
+    def throughput(self) -> float:
+        """
+        Transfer rate in bytes per second.
+        """
+        return self.bytes / self.seconds if self.seconds > 0 else 0.0
+
+    def __repr__(self) -> str:
+        return (f'DownloadResult(photo_id={self.photo_id!r}, path={self.path!r}, bytes={self.bytes}, '
+                f'seconds={self.seconds:.3f}, resumed={self.resumed}, skipped={self.skipped})')
+
+
+def _expected_size(response) -> int:
+    """
+    Returns the size of the complete file announced by a response: the total of Content-Range
+    (206, 416) or Content-Length (200). None if unknown or the body is encoded.
+    """
+    if response.status_code in (206, 416):
+        total = response.headers.get('Content-Range', '').rpartition('/')[2]
+        return int(total) if total.isdigit() else None
+    if response.headers.get('Content-Encoding', 'identity') != 'identity':
+        return None
+    length = response.headers.get('Content-Length')
+
+    return int(length) if length is not None and length.isdigit() else None
+
+
+def _range_start(response) -> int:
+    """
+    Returns the first byte of a 206 response, None if Content-Range is missing.
+    """
+    unit, _, spec = response.headers.get('Content-Range', '').partition(' ')
+    first = spec.partition('-')[0]
+
+    return int(first) if unit == 'bytes' and first.isdigit() else None
+
+
+def _discard(*paths) -> None:
+    for path in paths:
+        if os.path.exists(path):
+            os.remove(path)
+
+
+def download_file(session: requests.Session, url: str, path: str, policy, chunk_size: int = 64 * 1024) -> tuple:
+    """
+    Streams `url` into `path` in chunks, without holding the file in memory.
+
+    The data is written to `path + '.part'` and renamed once its size matches the size
+    announced by the server (Content-Length or Content-Range), so a body cut short is never
+    taken as the final file. An existing partial file is continued with an HTTP Range request,
+    also when the connection breaks during the transfer (up to `policy.retries` times).
+    The validator (ETag or Last-Modified) of the file is kept in `path + '.part.validator'`
+    and sent as If-Range, so a partial file of an older version is downloaded anew;
+    a partial file without validator is not continued.
+
+    Args:
+        session (requests.Session):     Session to download with.
+        url (str):                      URL of the image.
+        path (str):                     Target path.
+        policy (RequestPolicy):         Timeouts and retries.
+        chunk_size (int, optional):     Size of the chunks written to disk. Defaults to 64 KiB.
+
+    Returns:
+        (bytes, seconds, resumed):      Transferred bytes, duration and whether a partial file was continued.
+
+    Raises:
+        UnsplashHTTPError:          If the server answers with an unexpected status.
+        UnsplashConnectionError:    If the transfer fails or stays incomplete, also after retrying.
+    """
+    part_path = path + '.part'
+    validator_path = part_path + '.validator'
+    started = time.monotonic()
+    transferred = 0
+    resumed = False
+    attempt = 0
+    while True:
+        validator = None
+        if os.path.exists(part_path) and os.path.exists(validator_path):
+            with open(validator_path) as file:
+                validator = file.read()
+        offset = os.path.getsize(part_path) if validator else 0
+        headers = {'Range': f'bytes={offset}-', 'If-Range': validator} if offset else None
+        try:
+            with session.get(url, headers=headers, stream=True, timeout=policy.timeout(started)) as response:
+                expected = _expected_size(response)
+                if response.status_code == 416:
+                    # Nothing left to send: the partial file is complete if it has the size of the file
+                    if expected == offset:
+                        break
+                    _discard(part_path, validator_path)
+                    error = UnsplashConnectionError(f'Partial file of {url} does not match the size of the file')
+                elif response.status_code == 206 and _range_start(response) != offset:
+                    _discard(part_path, validator_path)
+                    error = UnsplashConnectionError(f'Server sent another range of {url} than requested')
+                elif response.status_code not in (200, 206):
+                    raise UnsplashHTTPError(response.status_code, response=response)
+                else:
+                    partial = response.status_code == 206
+                    resumed = resumed or partial
+                    if not partial:
+                        validator = response.headers.get('ETag') or response.headers.get('Last-Modified')
+                        _discard(validator_path)
+                        if validator:
+                            with open(validator_path, 'w') as file:
+                                file.write(validator)
+                    with open(part_path, 'ab' if partial else 'wb') as file:
+                        for chunk in response.iter_content(chunk_size=chunk_size):
+                            file.write(chunk)
+                            transferred += len(chunk)
+                    size = os.path.getsize(part_path)
+                    if expected is None or size == expected:
+                        break
+                    if size > expected:
+                        _discard(part_path, validator_path)
+                    error = UnsplashConnectionError(f'Download of {url} ended after {size} of {expected} bytes')
+        except (requests.ConnectionError, requests.Timeout, requests.exceptions.ChunkedEncodingError) as exception:
+            error = UnsplashConnectionError(str(exception))
+            error.__cause__ = exception
+        delay = policy.retry_delay('GET', attempt, started)
+        if delay is None:
+            raise error
+        time.sleep(delay)
+        attempt += 1
+    os.replace(part_path, path)
+    _discard(validator_path)
+
+    return transferred, time.monotonic() - started, resumed
@@ -0,0 +1,39 @@
+class UnsplashError(Exception):
+    """
+    Base class of all errors raised by the client.
+    """
+
+
+class UnsplashHTTPError(UnsplashError):
+    """
+    The API answered with an unexpected status code.
+
+    Attributes:
+        status_code (int):              HTTP status code of the response.
+        rate_limit_remaining (int):     Remaining requests of the access key, None if unknown.
+        response:                       The response object.
+    """
+
+    def __init__(self, status_code: int, rate_limit_remaining: int = None, response=None) -> None:
+        super().__init__(f'Not able to extract content. Code - {status_code}')
+        self.status_code = status_code
+        self.rate_limit_remaining = rate_limit_remaining
+        self.response = response
+
+
+class RateLimitExceeded(UnsplashHTTPError):
+    """
+    The rate limit of the access key is used up.
+    """
+
+
+class UnsplashConnectionError(UnsplashError):
+    """
+    The request failed without a response (connection error or timeout), also after retrying.
+    """
+
+
+class DeadlineExceeded(UnsplashConnectionError):
+    """
+    The deadline of a call passed before a response was received.
+    """
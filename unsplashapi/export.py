@@ -0,0 +1,316 @@
+"""
+Streaming exporters, which write records to disk as they arrive.
+
+Only the current batch is held in memory, so the writers can consume paginated
+generators of any length:
+
+    with NDJSONWriter('photos.ndjson.gz') as writer:
+        writer.write_all(api.list_photos_paginate(page_limit=100))
+
+Compression of text files is inferred from the file suffix (`.gz`, `.zst`) or given
+explicitly. Parquet files compress their columns instead (`compression` of ParquetWriter).
+zstd requires the package zstandard, Parquet files require pyarrow.
+"""
+import csv
+import gzip
+import json
+import os
+import tempfile
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - optional dependency
+    zstandard = None
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:  # pragma: no cover - optional dependency
+    pyarrow = None
+
+from .pagination import page_items
+
+
+SUFFIXES = {'.gz': 'gzip', '.zst': 'zstd'}
+
+
+def compression_for(path: str, compression: str = None) -> str:
+    """
+    Returns the compression of `path` (gzip, zstd or None), inferred from the suffix if not given.
+    """
+    if compression is not None:
+        return compression
+
+    return SUFFIXES.get(os.path.splitext(path)[1])
+
+
+def open_text(path: str, compression: str = None):
+    """
+    Opens `path` for writing text, compressed with gzip or zstd.
+    """
+    compression = compression_for(path, compression)
+    if compression is None:
+        return open(path, 'w', encoding='utf-8', newline='')
+    if compression == 'gzip':
+        return gzip.open(path, 'wt', encoding='utf-8', newline='')
+    if compression == 'zstd':
+        if zstandard is None:
+            raise ImportError('zstd compression requires zstandard. Install it with: pip install unsplashapi[zstd]')
+        return zstandard.open(path, 'w', encoding='utf-8', newline='')
+
+    raise ValueError(f'Unknown compression: {compression}')
+
+
+def flatten(record: dict, prefix: str = '') -> dict:
+    """
+    Flattens nested dictionaries into dotted keys, e.g. {'urls': {'small': ...}} into
+    {'urls.small': ...}. Lists are kept as JSON strings.
+    """
+    flat = {}
+    for name, value in record.items():
+        key = prefix + name
+        if isinstance(value, dict):
+            flat.update(flatten(value, key + '.'))
+        elif isinstance(value, list):
+            flat[key] = json.dumps(value, ensure_ascii=False)
+        else:
+            flat[key] = value
+
+    return flat
+
+
+class BaseWriter:
+    """
+    Base class of the writers. Records are buffered and written in batches of
+    `batch_size`, every batch is flushed to disk.
+    """
+
+    def __init__(self, path: str, compression: str = None, batch_size: int = 1000) -> None:
+        self.path = path
+        self.compression = compression_for(path, compression)
+        self.batch_size = batch_size
+        self.count = 0
+        self._batch = []
+        self._closed = False
+
+    def write(self, record: dict) -> None:
+        self._batch.append(record)
+        if len(self._batch) >= self.batch_size:
+            self.flush()
+
+    def write_all(self, records) -> int:
+        """
+        Writes all records of an iterable of records or of pages (as yielded by the
+        paginated generators). Returns the number of written records.
+        """
+        count = 0
+        for record in records:
+            items = page_items(record) if isinstance(record, list) or 'results' in record else (record,)
+            for item in items:
+                self.write(item)
+                count += 1
+
+        return count
+
+    def flush(self) -> None:
+        if self._batch:
+            self._write_batch(self._batch)
+            self.count += len(self._batch)
+            self._batch = []
+
+    def close(self) -> None:
+        if not self._closed:
+            self._closed = True
+            self.flush()
+            self._close()
+
+    def _write_batch(self, batch: list) -> None:
+        raise NotImplementedError
+
+    def _close(self) -> None:
+        raise NotImplementedError
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class NDJSONWriter(BaseWriter):
+    """
+    Writes one JSON document per line.
+    """
+
+    def __init__(self, path: str, compression: str = None, batch_size: int = 1000) -> None:
+        super().__init__(path, compression=compression, batch_size=batch_size)
+        self._file = open_text(path, self.compression)
+
+    def _write_batch(self, batch: list) -> None:
+        self._file.write(''.join(json.dumps(record, ensure_ascii=False) + '\n' for record in batch))
+        self._file.flush()
+
+    def _close(self) -> None:
+        self._file.close()
+
+
+class CSVWriter(BaseWriter):
+    """
+    Writes flattened records (see flatten) as CSV. Without `columns`, the columns are
+    the keys of the first batch; keys first appearing in later batches are dropped.
+    """
+
+    def __init__(self, path: str, columns: list = None, compression: str = None, batch_size: int = 1000) -> None:
+        super().__init__(path, compression=compression, batch_size=batch_size)
+        self.columns = columns
+        self._file = open_text(path, self.compression)
+        self._writer = None
+
+    def _write_batch(self, batch: list) -> None:
+        rows = [flatten(record) for record in batch]
+        if self._writer is None:
+            if self.columns is None:
+                self.columns = list(dict.fromkeys(key for row in rows for key in row))
+            self._writer = csv.DictWriter(self._file, self.columns, extrasaction='ignore')
+            self._writer.writeheader()
+        self._writer.writerows(rows)
+        self._file.flush()
+
+    def _close(self) -> None:
+        if self._writer is None and self.columns is not None:
+            csv.DictWriter(self._file, self.columns).writeheader()
+        self._file.close()
+
+
+def _value_type(value):
+    """
+    Returns the Parquet type of a flattened value, None for None.
+    """
+    if value is None:
+        return None
+    if isinstance(value, bool):
+        return pyarrow.bool_()
+    if isinstance(value, int):
+        return pyarrow.int64()
+    if isinstance(value, float):
+        return pyarrow.float64()
+
+    return pyarrow.string()
+
+
+def _promote(current, new):
+    """
+    Returns the type of a column holding values of both types: integers and floats
+    become floats, other mixed types strings.
+    """
+    if current is None or current == new:
+        return new
+    if new is None:
+        return current
+    if all(pyarrow.types.is_integer(type_) or pyarrow.types.is_floating(type_) for type_ in (current, new)):
+        return pyarrow.float64()
+
+    return pyarrow.string()
+
+
+class ParquetWriter(BaseWriter):
+    """
+    Writes flattened records (see flatten) as Parquet file, one row group per batch.
+    Without `schema`, the column types are unified over all batches: the flattened batches
+    are spooled to a temporary file and the Parquet file is written on close (integers mixed
+    with floats become floats, other mixed types and columns without any value strings).
+    With `schema`, every batch is written right away and keys not in the schema are dropped.
+    `compression` is the codec of the column chunks (e.g. zstd, gzip, snappy).
+    """
+
+    def __init__(self, path: str, schema=None, compression: str = 'zstd', batch_size: int = 10000) -> None:
+        if pyarrow is None:
+            raise ImportError('ParquetWriter requires pyarrow. Install it with: pip install unsplashapi[parquet]')
+        super().__init__(path, compression=compression, batch_size=batch_size)
+        self.schema = schema
+        self._writer = None
+        self._types = {}
+        self._batch_sizes = []
+        self._spool = tempfile.TemporaryFile('w+', encoding='utf-8') if schema is None else None
+
+    def _open_writer(self) -> None:
+        self._writer = pyarrow.parquet.ParquetWriter(self.path, self.schema, compression=self.compression)
+
+    def _write_batch(self, batch: list) -> None:
+        rows = [flatten(record) for record in batch]
+        if self._spool is None:
+            if self._writer is None:
+                self._open_writer()
+            self._writer.write_table(pyarrow.Table.from_pylist(rows, schema=self.schema))
+            return
+
+        for row in rows:
+            for name, value in row.items():
+                self._types[name] = _promote(self._types.get(name), _value_type(value))
+        self._spool.write(''.join(json.dumps(row, ensure_ascii=False) + '\n' for row in rows))
+        self._batch_sizes.append(len(rows))
+
+    def _write_spool(self) -> None:
+        """
+        Writes the spooled batches with the unified schema.
+        """
+        self.schema = pyarrow.schema([(name, type_ if type_ is not None else pyarrow.string())
+                                      for name, type_ in self._types.items()])
+        strings = [field.name for field in self.schema if field.type == pyarrow.string()]
+        self._open_writer()
+        self._spool.seek(0)
+        for size in self._batch_sizes:
+            rows = [json.loads(self._spool.readline()) for _ in range(size)]
+            for row in rows:
+                for name in strings:
+                    value = row.get(name)
+                    if value is not None and not isinstance(value, str):
+                        row[name] = json.dumps(value)
+            self._writer.write_table(pyarrow.Table.from_pylist(rows, schema=self.schema))
+
+    def _close(self) -> None:
+        if self._spool is not None:
+            try:
+                if self._batch_sizes:
+                    self._write_spool()
+            finally:
+                self._spool.close()
+        elif self._writer is None:
+            self._open_writer()
+        if self._writer is not None:
+            self._writer.close()
+
+
+WRITERS = {'.ndjson': NDJSONWriter, '.jsonl': NDJSONWriter, '.csv': CSVWriter, '.parquet': ParquetWriter}
+
+
+def export(records, path: str, **kwargs) -> int:
+    """
+    Streams records or pages (e.g. from a paginated generator) into `path`. The format is
+    chosen by the suffix: .ndjson/.jsonl or .csv, optionally followed by .gz or .zst, or .parquet
+    (compressed by column, see ParquetWriter).
+
+    Args:
+        records (iterable):     Records or pages
+        path (str):             Target file
+        **kwargs:               Arguments of the writer, e.g. batch_size or columns.
+
+    Returns:
+        int:                    Number of written records.
+
+    Raises:
+        ValueError:             If the format is unknown or a Parquet file has a .gz or .zst suffix,
+                                which gzip and zstd readers could not read.
+    """
+    root, suffix = os.path.splitext(path)
+    if suffix in SUFFIXES:
+        kwargs.setdefault('compression', SUFFIXES[suffix])
+        suffix = os.path.splitext(root)[1]
+        if WRITERS.get(suffix) is ParquetWriter:
+            raise ValueError(f'Parquet files are compressed by column, use a .parquet path and the compression '
+                             f'argument instead: {path}')
+    if suffix not in WRITERS:
+        raise ValueError(f'Unknown export format: {path}')
+
+    with WRITERS[suffix](path, **kwargs) as writer:
+        return writer.write_all(records)
@@ -0,0 +1,210 @@
+from collections import OrderedDict
+from typing import AsyncIterator, Awaitable, Callable, Iterable, Iterator
+
+from .bulk import arun_bulk, run_bulk
+from .pagination import page_items
+
+# Offset of the rank in the score weight / (RANK_OFFSET + rank), as in reciprocal rank fusion
+RANK_OFFSET = 60
+
+
+class SeenSet:
+    """
+    Set of the most recently added `maxsize` keys. Used to drop duplicates from a stream
+    in bounded memory: a key is only reported again after `maxsize` newer keys were added.
+    """
+
+    __slots__ = ('maxsize', '_keys')
+
+    def __init__(self, maxsize: int = 100_000) -> None:
+        self.maxsize = maxsize
+        self._keys = OrderedDict()
+
+    def add(self, key) -> bool:
+        """
+        Adds `key`, returns False if it was already in the set.
+        """
+        if key in self._keys:
+            self._keys.move_to_end(key)
+            return False
+        self._keys[key] = None
+        if len(self._keys) > self.maxsize:
+            self._keys.popitem(last=False)
+
+        return True
+
+    def __contains__(self, key) -> bool:
+        return key in self._keys
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+
+def expand_searches(queries: Iterable, filters: Iterable[dict] = None) -> list:
+    """
+    Returns the query parameters of every search: each query (a string or a dict of
+    parameters, optionally with a `weight`) combined with each filter combination.
+
+    >>> expand_searches(['ocean', 'beach'], [{'color': 'blue'}, {'color': 'teal'}])
+    [{'query': 'ocean', 'color': 'blue'}, {'query': 'ocean', 'color': 'teal'}, ...]
+    """
+    searches = [dict(query=query) if isinstance(query, str) else dict(query) for query in queries]
+    if filters:
+        filters = list(filters)
+        searches = [{**search, **combination} for search in searches for combination in filters]
+
+    return searches
+
+
+class _Stream:
+    """
+    Pagination state of a single search.
+    """
+
+    __slots__ = ('search', 'params', 'weight', 'page', 'rank', 'last', 'done')
+
+    def __init__(self, search: dict) -> None:
+        self.search = search
+        self.params = {name: value for name, value in search.items() if name != 'weight'}
+        self.weight = search.get('weight', 1.0)
+        self.page = 0
+        self.rank = 0
+        self.last = None
+        self.done = False
+
+
+def _next_round(streams: list) -> list:
+    return [(stream, stream.page + 1) for stream in streams if not stream.done]
+
+
+def _merge_round(results: list, per_page: int, page_limit: int) -> list:
+    """
+    Advances the streams by their fetched page and returns the hits of the round
+    as (search, item, score), highest score first. Duplicates are dropped when the
+    hits are produced, so items not produced (e.g. after `max_items`) stay unseen.
+    """
+    hits = []
+    for stream, (contents, last) in results:
+        stream.page += 1
+        if last is not None:
+            stream.last = last
+        items = page_items(contents)
+        for item in items:
+            stream.rank += 1
+            hits.append((stream.weight / (RANK_OFFSET + stream.rank), stream.search, item))
+        limits = [limit for limit in (stream.last, page_limit) if limit is not None]
+        stream.done = (not items or (stream.last is None and len(items) < per_page)
+                       or (bool(limits) and stream.page >= min(limits)))
+    hits.sort(key=lambda hit: hit[0], reverse=True)
+
+    return [(search, item, score) for score, search, item in hits]
+
+
+def _record_error(stream: _Stream, error: Exception, errors) -> None:
+    """
+    Stops a search whose page failed and records (search, exception) in `errors`,
+    or raises the exception if errors are not collected.
+    """
+    if errors is None:
+        raise error
+    errors.append((stream.search, error))
+    stream.done = True
+
+
+def fan_out(fetch_page: Callable[[dict, int], tuple], searches: Iterable[dict], per_page: int,
+            page_limit: int = None, max_items: int = None, seen=None, max_workers: int = 8,
+            errors: list = None) -> Iterator[tuple]:
+    """
+    Runs several paginated searches concurrently and merges their results into one stream
+    without duplicates.
+
+    The searches advance in rounds: page n of every unfinished search is fetched at once
+    (at most `max_workers` requests in flight), so the whole fan-out takes about as long as
+    its longest search. The hits of a round are ordered by the score weight / (60 + rank),
+    with `rank` the position of the item in the results of its search, and an item already
+    produced (by ID) is dropped. Only the pages of one round are held in memory.
+
+    By default, a failing request aborts the whole fan-out with its exception. With an
+    `errors` list, the failed search is stopped and recorded while the others go on.
+
+    Args:
+        fetch_page (callable):          Function returning (contents, last page or None) for the query
+                                        parameters of a search (without `weight`) and a page number.
+        searches (iterable):            Query parameters of the searches, optionally with a `weight` (default 1).
+        per_page (int):                 Items per page
+        page_limit (int, optional):     Maximum number of pages per search. Defaults to None (all pages).
+        max_items (int, optional):      Maximum number of items in total. Defaults to None.
+        seen (optional):                Set of the IDs produced so far, e.g. a SeenSet. An ID is added once the
+                                        consumer requests the next hit, so a persistent BloomFilter does not
+                                        keep the hit a consumer stopped at. Defaults to a new SeenSet.
+        max_workers (int, optional):    Maximum number of concurrent requests. Defaults to 8.
+        errors (list, optional):        Receives (search, exception) of every failed search. Defaults to None
+                                        (the first error is raised).
+
+    Yields:
+        (search, item, score):  The search which found the item first and its score.
+    """
+    streams = [_Stream(search) for search in searches]
+    seen = SeenSet() if seen is None else seen
+    if max_items is not None and max_items <= 0:
+        return
+    count = 0
+    while True:
+        jobs = _next_round(streams)
+        if not jobs:
+            return
+        results = {}
+        fetches = run_bulk(lambda job: fetch_page(job[0].params, job[1]), jobs, max_workers=max_workers)
+        try:
+            for (stream, _), result, error in fetches:
+                if error is not None:
+                    _record_error(stream, error, errors)
+                else:
+                    results[stream] = result
+        finally:
+            fetches.close()
+        for search, item, score in _merge_round([(stream, results[stream]) for stream, _ in jobs
+                                                 if stream in results], per_page, page_limit):
+            if item['id'] in seen:
+                continue
+            yield search, item, score
+            seen.add(item['id'])
+            count += 1
+            if max_items is not None and count >= max_items:
+                return
+
+
+async def afan_out(fetch_page: Callable[[dict, int], Awaitable], searches: Iterable[dict], per_page: int,
+                   page_limit: int = None, max_items: int = None, seen=None,
+                   max_workers: int = 8, errors: list = None) -> AsyncIterator[tuple]:
+    """
+    Asynchronous version of `fan_out`, which runs the requests of a round as asyncio tasks.
+    """
+    streams = [_Stream(search) for search in searches]
+    seen = SeenSet() if seen is None else seen
+    if max_items is not None and max_items <= 0:
+        return
+    count = 0
+    while True:
+        jobs = _next_round(streams)
+        if not jobs:
+            return
+        results = {}
+        fetches = arun_bulk(lambda job: fetch_page(job[0].params, job[1]), jobs, max_workers=max_workers)
+        try:
+            async for (stream, _), result, error in fetches:
+                if error is not None:
+                    _record_error(stream, error, errors)
+                else:
+                    results[stream] = result
+        finally:
+            await fetches.aclose()
+        for search, item, score in _merge_round([(stream, results[stream]) for stream, _ in jobs
+                                                 if stream in results], per_page, page_limit):
+            if item['id'] in seen:
+                continue
+            yield search, item, score
+            seen.add(item['id'])
+            count += 1
+            if max_items is not None and count >= max_items:
+                return
@@ -0,0 +1,103 @@
+import math
+import threading
+from typing import Iterable
+
+from .ratelimit import RateLimiter
+
+
+class AccessKeyPool:
+    """
+    Pool of access keys which spreads requests over the keys.
+
+    The remaining quota of every key is tracked from the rate limit headers of
+    its responses. Each request is sent with the key with the most headroom
+    (remaining quota minus requests currently in flight), keys whose quota is
+    unknown are preferred. An exhausted key is used again once its rate limit
+    window has passed.
+
+    Usage:
+        api = UnsplashAPI(access_key=AccessKeyPool(['<key 1>', '<key 2>', '<key 3>']))
+        # or simply
+        api = UnsplashAPI(access_key=['<key 1>', '<key 2>', '<key 3>'])
+    """
+
+    def __init__(self, access_keys: Iterable[str], pace: bool = False, burst: int = 10,
+                 period: float = 3600.0) -> None:
+        """
+        Args:
+            access_keys (iterable):     Access keys of the API.
+            pace (bool, optional):      Pace the requests of every key with a token bucket, see RateLimiter.
+                                        Defaults to False.
+            burst (int, optional):      Token bucket size per key. Defaults to 10.
+            period (float, optional):   Length of the rate limit window in seconds. Defaults to 3600.
+        """
+        self.access_keys = list(dict.fromkeys(access_keys))
+        if not self.access_keys:
+            raise ValueError('AccessKeyPool needs at least one access key.')
+        self.limiters = {key: RateLimiter(pace=pace, burst=burst, period=period) for key in self.access_keys}
+        self._in_flight = dict.fromkeys(self.access_keys, 0)
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.access_keys)
+
+    def headroom(self, access_key: str) -> float:
+        """
+        Remaining quota of a key minus its requests in flight. Infinite if the quota is unknown.
+        """
+        remaining = self.limiters[access_key].current_remaining()
+        if remaining is None:
+            remaining = math.inf
+
+        return remaining - self._in_flight[access_key]
+
+    def acquire(self, exclude: Iterable[str] = ()) -> str:
+        """
+        Selects the key with the most headroom for the next request. 
+        Every acquired key has to be released with `release`.
+
+        Args:
+            exclude (iterable, optional):   Keys which must not be selected.
+
+        Returns:
+            str:    Access key
+        """
+        exclude = set(exclude)
+        with self._lock:
+            candidates = [key for key in self.access_keys if key not in exclude] or self.access_keys
+            access_key = max(candidates, key=self.headroom)
+            self._in_flight[access_key] += 1
+
+        return access_key
+
+    def release(self, access_key: str) -> None:
+        """
+        Marks a request sent with `access_key` as finished.
+        """
+        with self._lock:
+            self._in_flight[access_key] -= 1
+
+    def is_exhausted(self, access_key: str) -> bool:
+        """
+        Returns True if the quota of a key is used up in the current window.
+        """
+        return self.limiters[access_key].current_remaining() == 0
+
+    @property
+    def limit(self):
+        """
+        Combined rate limit of all keys with a known limit, None if no limit is known yet.
+        """
+        limits = [limiter.limit for limiter in self.limiters.values() if limiter.limit is not None]
+
+        return sum(limits) if limits else None
+
+    @property
+    def remaining(self):
+        """
+        Combined remaining requests of all keys with a known quota, None if no quota is known yet.
+        """
+        remaining = [limiter.current_remaining() for limiter in self.limiters.values()]
+        remaining = [value for value in remaining if value is not None]
+
+        return sum(remaining) if remaining else None
@@ -0,0 +1,303 @@
+"""
+Instrumentation of the HTTP calls of the clients.
+
+Every HTTP call (every attempt, including retries) creates a RequestEvent, which is
+passed to the hooks of the client:
+
+    metrics = Metrics()
+    api = UnsplashAPI(access_key='<your key>', hooks=[metrics, print])
+    ...
+    print(metrics.prometheus())
+"""
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+
+# Path segments following these collections are IDs, except for the listed static names.
+_DYNAMIC = {'photos': ('random',), 'collections': (), 'users': (), 'topics': ()}
+_PLACEHOLDERS = {'photos': '{id}', 'collections': '{id}', 'users': '{username}', 'topics': '{id_or_slug}'}
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# (sent, timings) of the call the current thread is sending with the synchronous transport
+_sync_trace = threading.local()
+
+
+def endpoint_template(endpoint: str) -> str:
+    """
+    Returns the template of an endpoint with placeholders for IDs, e.g. '/photos/{id}/statistics'
+    for '/photos/ieic5Tq8YMk/statistics', which keeps the number of metric labels bounded.
+    """
+    parts = endpoint.split('/')
+    if len(parts) > 2 and parts[1] in _DYNAMIC and parts[2] not in _DYNAMIC[parts[1]]:
+        parts[2] = _PLACEHOLDERS[parts[1]]
+
+    return '/'.join(parts)
+
+
+class RequestEvent:
+    """
+    Measurements of a single HTTP call.
+
+    Attributes:
+        method (str):                   HTTP method
+        endpoint (str):                 Endpoint template, e.g. '/photos/{id}'
+        status (int):                   Status code, None if no response was received.
+        attempt (int):                  Number of the attempt, 0 for the first try.
+        error (Exception):              Exception if no response was received, else None.
+        connect (float):                Seconds to resolve and connect (incl. TLS), None if a pooled
+                                        connection was reused or the transport does not report it.
+                                        Name resolution is part of it, neither requests nor httpx
+                                        report it separately.
+        ttfb (float):                   Seconds until the response headers were received (incl. connect).
+        total (float):                  Seconds until the response body was received.
+        decode (float):                 Seconds to decode the JSON body, None if not decoded.
+        bytes (int):                    Size of the response body.
+        rate_limit (int):               Value of X-Ratelimit-Limit, None if missing.
+        rate_limit_remaining (int):     Value of X-Ratelimit-Remaining, None if missing.
+        timestamp (float):              Time of the request (time.time()).
+    """
+
+    __slots__ = ('method', 'endpoint', 'status', 'attempt', 'error', 'connect', 'ttfb', 'total', 'decode',
+                 'bytes', 'rate_limit', 'rate_limit_remaining', 'timestamp')
+
+    def __init__(self, method: str, endpoint: str, status: int = None, attempt: int = 0, error: Exception = None,
+                 connect: float = None, ttfb: float = None, total: float = None, decode: float = None,
+                 bytes: int = 0, rate_limit: int = None, rate_limit_remaining: int = None,
+                 timestamp: float = None) -> None:
+        self.method = method
+        self.endpoint = endpoint
+        self.status = status
+        self.attempt = attempt
+        self.error = error
+        self.connect = connect
+        self.ttfb = ttfb
+        self.total = total
+        self.decode = decode
+        self.bytes = bytes
+        self.rate_limit = rate_limit
+        self.rate_limit_remaining = rate_limit_remaining
+        self.timestamp = timestamp if timestamp is not None else time.time()
+
+    @classmethod
+    def from_response(cls, method: str, endpoint: str, response, attempt: int, total: float, **timings):
+        headers = response.headers
+        limit, remaining = headers.get('X-Ratelimit-Limit'), headers.get('X-Ratelimit-Remaining')
+
+        return cls(method, endpoint_template(endpoint), status=response.status_code, attempt=attempt, total=total,
+                   bytes=len(response.content), rate_limit=int(limit) if limit is not None else None,
+                   rate_limit_remaining=int(remaining) if remaining is not None else None, **timings)
+
+    def __repr__(self) -> str:
+        total = f'{self.total * 1e3:.1f}ms' if self.total is not None else None
+        return (f'RequestEvent({self.method} {self.endpoint} status={self.status} attempt={self.attempt} '
+                f'total={total} bytes={self.bytes})')
+
+
+def fire(hooks, event: RequestEvent) -> None:
+    for hook in hooks:
+        hook(event)
+
+
+@contextmanager
+def sync_trace(sent: float, timings: dict):
+    """
+    Records the connect time and the time to first byte (relative to `sent`, a time.perf_counter()
+    value) of the calls the current thread sends within the block into `timings`. Reported by the
+    connections of a session configured by a TransportConfig (see transport.TransportAdapter).
+    """
+    _sync_trace.current = (sent, timings)
+    try:
+        yield timings
+    finally:
+        _sync_trace.current = None
+
+
+def record_timing(name: str, started: float = None) -> None:
+    """
+    Records the time since `started` (default: since the call was sent) as `name` into the
+    timings of the current `sync_trace`, if any.
+    """
+    trace = getattr(_sync_trace, 'current', None)
+    if trace is not None:
+        sent, timings = trace
+        timings[name] = time.perf_counter() - (started if started is not None else sent)
+
+
+def httpx_trace(sent: float, timings: dict):
+    """
+    Returns an httpx trace extension, which records the connect time and the time to
+    first byte (relative to `sent`, a time.perf_counter() value) into `timings`.
+    """
+    async def trace(name: str, info: dict) -> None:
+        if name == 'connection.connect_tcp.started':
+            timings['connect_started'] = time.perf_counter()
+        elif name in ('connection.connect_tcp.complete', 'connection.start_tls.complete'):
+            timings['connect'] = time.perf_counter() - timings.get('connect_started', sent)
+        elif name.endswith('.receive_response_headers.complete'):
+            timings['ttfb'] = time.perf_counter() - sent
+
+    return trace
+
+
+class Histogram:
+    """
+    Cumulative histogram with fixed bucket bounds (Prometheus style).
+    """
+
+    __slots__ = ('bounds', 'counts', 'sum', 'count')
+
+    def __init__(self, bounds=DEFAULT_BUCKETS) -> None:
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def quantile(self, q: float) -> float:
+        """
+        Estimates a quantile by linear interpolation within the bucket.
+        """
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for index, count in enumerate(self.counts):
+            if seen + count >= rank and count:
+                lower = self.bounds[index - 1] if index > 0 else 0.0
+                upper = self.bounds[index] if index < len(self.bounds) else self.bounds[-1]
+                return lower + (upper - lower) * (rank - seen) / count
+            seen += count
+
+        return self.bounds[-1]
+
+
+def _labels(**labels) -> str:
+    return '{' + ','.join(f'{name}="{value}"' for name, value in labels.items()) + '}'
+
+
+class Metrics:
+    """
+    Hook aggregating the events into counters and latency histograms per method and
+    endpoint template. Thread-safe, so one instance can be shared by several clients.
+
+    Args:
+        buckets (tuple, optional):  Upper bounds of the latency buckets in seconds.
+    """
+
+    def __init__(self, buckets: tuple = DEFAULT_BUCKETS) -> None:
+        self.buckets = buckets
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        self.requests = {}
+        self.retries = {}
+        self.bytes = {}
+        self.latency = {}
+        self.ttfb = {}
+        self.decode = {}
+        self.rate_limit_remaining = None
+
+    def __call__(self, event: RequestEvent) -> None:
+        key = (event.method, event.endpoint)
+        status = str(event.status) if event.status is not None else 'error'
+        with self.lock:
+            self.requests[key + (status,)] = self.requests.get(key + (status,), 0) + 1
+            if event.attempt:
+                self.retries[key] = self.retries.get(key, 0) + 1
+            self.bytes[key] = self.bytes.get(key, 0) + event.bytes
+            for histograms, value in ((self.latency, event.total), (self.ttfb, event.ttfb),
+                                      (self.decode, event.decode)):
+                if value is not None:
+                    if key not in histograms:
+                        histograms[key] = Histogram(self.buckets)
+                    histograms[key].observe(value)
+            if event.rate_limit_remaining is not None:
+                self.rate_limit_remaining = event.rate_limit_remaining
+
+    def summary(self) -> dict:
+        """
+        Returns per endpoint ('GET /photos/{id}') the number of requests, errors (no response
+        or status >= 400), retries, bytes and the estimated p50/p99 latency in seconds.
+        """
+        with self.lock:
+            summary = {}
+            for (method, endpoint, status), count in self.requests.items():
+                entry = summary.setdefault(f'{method} {endpoint}', dict(requests=0, errors=0))
+                entry['requests'] += count
+                if status == 'error' or int(status) >= 400:
+                    entry['errors'] += count
+            for (method, endpoint), histogram in self.latency.items():
+                entry = summary[f'{method} {endpoint}']
+                entry.update(retries=self.retries.get((method, endpoint), 0),
+                             bytes=self.bytes.get((method, endpoint), 0),
+                             p50=histogram.quantile(0.5), p99=histogram.quantile(0.99))
+
+        return summary
+
+    def prometheus(self, prefix: str = 'unsplash') -> str:
+        """
+        Returns the metrics in the Prometheus text exposition format.
+        """
+        lines = []
+        with self.lock:
+            lines += [f'# HELP {prefix}_requests_total HTTP calls by method, endpoint and status.',
+                      f'# TYPE {prefix}_requests_total counter']
+            lines += [f'{prefix}_requests_total{_labels(method=method, endpoint=endpoint, status=status)} {count}'
+                      for (method, endpoint, status), count in sorted(self.requests.items())]
+            lines += [f'# HELP {prefix}_retries_total Retried HTTP calls.', f'# TYPE {prefix}_retries_total counter']
+            lines += [f'{prefix}_retries_total{_labels(method=method, endpoint=endpoint)} {count}'
+                      for (method, endpoint), count in sorted(self.retries.items())]
+            lines += [f'# HELP {prefix}_response_bytes_total Size of the response bodies.',
+                      f'# TYPE {prefix}_response_bytes_total counter']
+            lines += [f'{prefix}_response_bytes_total{_labels(method=method, endpoint=endpoint)} {count}'
+                      for (method, endpoint), count in sorted(self.bytes.items())]
+            for name, histograms, description in (
+                    ('request_duration_seconds', self.latency, 'Duration of the HTTP calls.'),
+                    ('time_to_first_byte_seconds', self.ttfb, 'Time until the response headers were received.'),
+                    ('decode_duration_seconds', self.decode, 'Duration of decoding the JSON bodies.')):
+                lines += [f'# HELP {prefix}_{name} {description}', f'# TYPE {prefix}_{name} histogram']
+                for (method, endpoint), histogram in sorted(histograms.items()):
+                    cumulative = 0
+                    for bound, count in zip(histogram.bounds + ('+Inf',), histogram.counts):
+                        cumulative += count
+                        labels = _labels(method=method, endpoint=endpoint, le=bound)
+                        lines.append(f'{prefix}_{name}_bucket{labels} {cumulative}')
+                    labels = _labels(method=method, endpoint=endpoint)
+                    lines.append(f'{prefix}_{name}_sum{labels} {histogram.sum}')
+                    lines.append(f'{prefix}_{name}_count{labels} {histogram.count}')
+            if self.rate_limit_remaining is not None:
+                lines += [f'# HELP {prefix}_rate_limit_remaining Remaining requests as reported by the last response.',
+                          f'# TYPE {prefix}_rate_limit_remaining gauge',
+                          f'{prefix}_rate_limit_remaining {self.rate_limit_remaining}']
+
+        return '\n'.join(lines) + '\n'
+
+
+class OpenTelemetryHook:
+    """
+    Hook recording the events with OpenTelemetry instruments created from `meter`
+    (e.g. opentelemetry.metrics.get_meter('unsplashapi')).
+    """
+
+    def __init__(self, meter, prefix: str = 'unsplash') -> None:
+        self.requests = meter.create_counter(f'{prefix}.requests', unit='1', description='HTTP calls')
+        self.duration = meter.create_histogram(f'{prefix}.request.duration', unit='s',
+                                               description='Duration of the HTTP calls')
+        self.size = meter.create_counter(f'{prefix}.response.size', unit='By',
+                                         description='Size of the response bodies')
+
+    def __call__(self, event: RequestEvent) -> None:
+        attributes = {'http.method': event.method, 'unsplash.endpoint': event.endpoint,
+                      'http.status_code': event.status if event.status is not None else 0,
+                      'unsplash.attempt': event.attempt}
+        self.requests.add(1, attributes)
+        if event.total is not None:
+            self.duration.record(event.total, attributes)
+        self.size.add(event.bytes, attributes)
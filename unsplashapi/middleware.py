@@ -0,0 +1,409 @@
+"""
+Request pipeline of the clients.
+
+Every request of a client is a Request passed through the ordered middleware chain
+of the client (`client.middleware`) down to the transport, which sends it with the
+session (or httpx client). A middleware receives the client, the request and the
+next step of the chain, and returns the response:
+
+    class Timing(Middleware):
+        def handle(self, client, request, call_next):
+            started = time.perf_counter()
+            response = call_next(request)
+            print(request.endpoint, time.perf_counter() - started)
+            return response
+
+    api = UnsplashAPI(access_key='<your key>')
+    api.middleware.insert(0, Timing())
+
+Middleware used by the asynchronous client implement `ahandle` as well. The default
+chain reads its configuration (cache, policy, key pool, rate limiter, hooks) from the
+client, so the features are switched on and off per client by its attributes.
+"""
+import asyncio
+import time
+
+from requests.structures import CaseInsensitiveDict
+
+from .cache import BaseCache, CacheEntry, cacheable_headers
+from .exceptions import DeadlineExceeded, UnsplashConnectionError
+from .metrics import RequestEvent, endpoint_template, fire, httpx_trace, sync_trace
+
+
+class Request:
+    """
+    A request travelling through the middleware chain.
+
+    Attributes:
+        method (str):           HTTP method
+        endpoint (str):         Path of the endpoint, e.g. '/photos'
+        params (dict):          Query parameters (without the access key)
+        headers (dict):         Additional request headers, or None
+        access_key (str):       Access key, the key of the client unless set by KeyPoolMiddleware.
+        rate_limiter:           RateLimiter of the access key, the one of the client unless set by
+                                KeyPoolMiddleware.
+        failover (bool):        True if KeyPoolMiddleware repeats the request with another key
+                                when the access key turns out to be exhausted.
+        attempt (int):          Number of the attempt, set by RetryMiddleware.
+        timeout (tuple):        (connect, read) timeout of the attempt, the one of the client policy unless
+                                set by RetryMiddleware.
+        extensions (dict):      Request extensions of httpx (e.g. trace), ignored by requests.
+    """
+
+    __slots__ = ('method', 'endpoint', 'params', 'headers', 'access_key', 'rate_limiter', 'failover', 'attempt',
+                 'timeout', 'extensions')
+
+    def __init__(self, method: str, endpoint: str, params: dict = None, headers: dict = None) -> None:
+        self.method = method
+        self.endpoint = endpoint
+        self.params = params if params is not None else {}
+        self.headers = headers
+        self.access_key = None
+        self.rate_limiter = None
+        self.failover = False
+        self.attempt = 0
+        self.timeout = None
+        self.extensions = None
+
+    def __repr__(self) -> str:
+        return f'Request({self.method} {self.endpoint} {self.params})'
+
+
+class CachedResponse:
+    """
+    Response answered from the cache. Only provides what the clients use of a response:
+    the decoded body and the stored headers, e.g. X-Total and Link for planning pages.
+    """
+
+    status_code = 200
+
+    def __init__(self, entry: CacheEntry) -> None:
+        self.entry = entry
+        self.headers = CaseInsensitiveDict(entry.headers)
+
+    @property
+    def _decoded(self):
+        return self.entry.data
+
+
+class Middleware:
+    """
+    Base class of the middleware, which passes requests on unchanged.
+    """
+
+    def handle(self, client, request: Request, call_next):
+        return call_next(request)
+
+    async def ahandle(self, client, request: Request, call_next):
+        return await call_next(request)
+
+
+class SingleFlightMiddleware(Middleware):
+    """
+    Concurrent identical GET requests share one call (see SingleFlight). Uses `client.single_flight`.
+    """
+
+    @staticmethod
+    def _applies(client, request: Request) -> bool:
+        return (client.single_flight is not None and request.method == 'GET' and not request.headers
+                and client.single_flight.applies(request.endpoint))
+
+    def handle(self, client, request: Request, call_next):
+        if not self._applies(client, request):
+            return call_next(request)
+
+        return client.single_flight.do(BaseCache.make_key(request.endpoint, request.params),
+                                       lambda: call_next(request))
+
+    async def ahandle(self, client, request: Request, call_next):
+        if not self._applies(client, request):
+            return await call_next(request)
+
+        return await client.single_flight.do(BaseCache.make_key(request.endpoint, request.params),
+                                             lambda: call_next(request))
+
+
+class CacheMiddleware(Middleware):
+    """
+    Answers GET requests from `client.cache`. Fresh entries are returned without a request,
+    expired entries are revalidated with a conditional request (a 304 reuses the entry).
+    A `Cache-Control: no-cache` request header skips the lookup.
+    """
+
+    @staticmethod
+    def _lookup(client, request: Request):
+        """
+        Returns (cache, ttl, key, entry); cache is None if the request is not cached.
+        """
+        cache = client.cache
+        if cache is None or request.method != 'GET':
+            return None, 0, None, None
+        ttl = cache.ttl_for(request.endpoint)
+        if ttl <= 0:
+            return None, 0, None, None
+        key = cache.make_key(request.endpoint, request.params)
+        no_cache = request.headers is not None and request.headers.get('Cache-Control') == 'no-cache'
+
+        return cache, ttl, key, cache.get(key) if not no_cache else None
+
+    @staticmethod
+    def _store(client, cache, ttl: float, key: str, entry: CacheEntry, response):
+        if response.status_code == 304 and entry is not None:
+            entry.expires = time.time() + ttl
+            cache.set(key, entry)
+            cache.record(revalidated=True)
+            return CachedResponse(entry)
+
+        cache.record()
+        if 200 <= response.status_code < 300:
+            cache.set(key, CacheEntry(data=client._decode(response),
+                                      body=response.content if cache.keep_body else None,
+                                      etag=response.headers.get('ETag'),
+                                      last_modified=response.headers.get('Last-Modified'),
+                                      expires=time.time() + ttl, headers=cacheable_headers(response.headers)))
+
+        return response
+
+    @staticmethod
+    def _conditional(request: Request, entry: CacheEntry) -> Request:
+        if entry is not None and entry.validators():
+            request.headers = dict(request.headers or {}, **entry.validators())
+
+        return request
+
+    def handle(self, client, request: Request, call_next):
+        cache, ttl, key, entry = self._lookup(client, request)
+        if cache is None:
+            return call_next(request)
+        if entry is not None and entry.fresh:
+            cache.record(hit=True)
+            return CachedResponse(entry)
+
+        response = call_next(self._conditional(request, entry))
+
+        return self._store(client, cache, ttl, key, entry, response)
+
+    async def ahandle(self, client, request: Request, call_next):
+        cache, ttl, key, entry = self._lookup(client, request)
+        if cache is None:
+            return await call_next(request)
+        if entry is not None and entry.fresh:
+            cache.record(hit=True)
+            return CachedResponse(entry)
+
+        response = await call_next(self._conditional(request, entry))
+
+        return self._store(client, cache, ttl, key, entry, response)
+
+
+class KeyPoolMiddleware(Middleware):
+    """
+    Chooses the access key. With a key pool (`client.key_pool`), the key with the most
+    headroom is used and the request is repeated with the next key if the key is exhausted.
+    """
+
+    @staticmethod
+    def _done(client, response, access_key: str, tried: list) -> bool:
+        tried.append(access_key)
+        return (response.status_code not in (403, 429) or not client.key_pool.is_exhausted(access_key)
+                or len(tried) == len(client.key_pool))
+
+    def handle(self, client, request: Request, call_next):
+        if client.key_pool is None:
+            request.access_key, request.rate_limiter = client.access_key, client.rate_limiter
+            return call_next(request)
+
+        tried = []
+        while True:
+            request.access_key = client.key_pool.acquire(exclude=tried)
+            request.rate_limiter = client.key_pool.limiters[request.access_key]
+            request.failover = len(tried) + 1 < len(client.key_pool)
+            try:
+                response = call_next(request)
+            finally:
+                client.key_pool.release(request.access_key)
+            if self._done(client, response, request.access_key, tried):
+                return response
+
+    async def ahandle(self, client, request: Request, call_next):
+        if client.key_pool is None:
+            request.access_key, request.rate_limiter = client.access_key, client.rate_limiter
+            return await call_next(request)
+
+        tried = []
+        while True:
+            request.access_key = client.key_pool.acquire(exclude=tried)
+            request.rate_limiter = client.key_pool.limiters[request.access_key]
+            request.failover = len(tried) + 1 < len(client.key_pool)
+            try:
+                response = await call_next(request)
+            finally:
+                client.key_pool.release(request.access_key)
+            if self._done(client, response, request.access_key, tried):
+                return response
+
+
+class RetryMiddleware(Middleware):
+    """
+    Applies the timeouts of `client.policy` and retries failed attempts with backoff.
+    A response of an exhausted access key is not retried if the key pool can fail over
+    to another key (see KeyPoolMiddleware).
+
+    Raises:
+        UnsplashConnectionError: If no response was received, also after retrying.
+        DeadlineExceeded: If the deadline of the policy passed.
+    """
+
+    @staticmethod
+    def _delay_after_error(policy, request: Request, started: float, error: UnsplashConnectionError) -> float:
+        delay = policy.retry_delay(request.method, request.attempt, started)
+        if delay is None:
+            remaining = policy.remaining_time(started)
+            if remaining is not None and remaining <= 0:
+                raise DeadlineExceeded(f'Deadline of {policy.deadline}s exceeded: {error}') from error.__cause__
+            raise error
+
+        return delay
+
+    @staticmethod
+    def _delay_after_response(policy, request: Request, started: float, response) -> float:
+        if response.status_code not in policy.retry_statuses:
+            return None
+        if request.failover and response.status_code in (403, 429) and request.rate_limiter.current_remaining() == 0:
+            return None
+
+        return policy.retry_delay(request.method, request.attempt, started, response.headers.get('Retry-After'))
+
+    def handle(self, client, request: Request, call_next):
+        policy = client.policy
+        started = time.monotonic()
+        request.attempt = 0
+        while True:
+            request.timeout = policy.timeout(started)
+            try:
+                response = call_next(request)
+            except UnsplashConnectionError as error:
+                delay = self._delay_after_error(policy, request, started, error)
+            else:
+                delay = self._delay_after_response(policy, request, started, response)
+                if delay is None:
+                    return response
+            time.sleep(delay)
+            request.attempt += 1
+
+    async def ahandle(self, client, request: Request, call_next):
+        policy = client.policy
+        started = time.monotonic()
+        request.attempt = 0
+        while True:
+            request.timeout = policy.timeout(started)
+            try:
+                response = await call_next(request)
+            except UnsplashConnectionError as error:
+                delay = self._delay_after_error(policy, request, started, error)
+            else:
+                delay = self._delay_after_response(policy, request, started, response)
+                if delay is None:
+                    return response
+            await asyncio.sleep(delay)
+            request.attempt += 1
+
+
+class PacingMiddleware(Middleware):
+    """
+    Waits for the rate limiter of the access key before every attempt and records the
+    rate limit headers of every response.
+    """
+
+    @staticmethod
+    def _record(client, request: Request, response) -> None:
+        request.rate_limiter.update(response.headers)
+        client._last_headers = response.headers
+
+    def handle(self, client, request: Request, call_next):
+        request.rate_limiter.acquire()
+        response = call_next(request)
+        self._record(client, request, response)
+
+        return response
+
+    async def ahandle(self, client, request: Request, call_next):
+        delay = request.rate_limiter.reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        response = await call_next(request)
+        self._record(client, request, response)
+
+        return response
+
+
+class InstrumentationMiddleware(Middleware):
+    """
+    Fires the hooks of the client (`client.hooks`) with a RequestEvent after every attempt.
+    The connect time and time to first byte are traced by the transport (see metrics.sync_trace
+    and metrics.httpx_trace). The JSON body of a 2xx response is decoded here to measure the decode time.
+    """
+
+    @staticmethod
+    def _decode_time(client, response) -> float:
+        if not 200 <= response.status_code < 300 or not response.content:
+            return None
+        started = time.perf_counter()
+        try:
+            client._decode(response)
+        except ValueError:
+            return None
+
+        return time.perf_counter() - started
+
+    def _error(self, client, request: Request, sent: float, error: Exception, timings: dict) -> None:
+        # The event carries the exception of the transport library
+        error = error.__cause__ or error
+        fire(client.hooks, RequestEvent(request.method, endpoint_template(request.endpoint), attempt=request.attempt,
+                                        error=error, connect=timings.get('connect'),
+                                        total=time.perf_counter() - sent))
+
+    def _response(self, client, request: Request, sent: float, response, **timings) -> None:
+        total = time.perf_counter() - sent
+        fire(client.hooks, RequestEvent.from_response(request.method, request.endpoint, response, request.attempt,
+                                                      total, decode=self._decode_time(client, response), **timings))
+
+    def handle(self, client, request: Request, call_next):
+        if not client.hooks:
+            return call_next(request)
+        sent = time.perf_counter()
+        timings = {}
+        try:
+            with sync_trace(sent, timings):
+                response = call_next(request)
+        except UnsplashConnectionError as error:
+            self._error(client, request, sent, error, timings)
+            raise
+        # Sessions without a TransportAdapter only report the time until the headers were parsed
+        self._response(client, request, sent, response, connect=timings.get('connect'),
+                       ttfb=timings.get('ttfb', response.elapsed.total_seconds()))
+
+        return response
+
+    async def ahandle(self, client, request: Request, call_next):
+        if not client.hooks:
+            return await call_next(request)
+        sent = time.perf_counter()
+        timings = {}
+        request.extensions = dict(request.extensions or {}, trace=httpx_trace(sent, timings))
+        try:
+            response = await call_next(request)
+        except UnsplashConnectionError as error:
+            self._error(client, request, sent, error, timings)
+            raise
+        self._response(client, request, sent, response, connect=timings.get('connect'), ttfb=timings.get('ttfb'))
+
+        return response
+
+
+def default_middleware() -> list:
+    """
+    Returns the default chain, from the outermost to the innermost step.
+    """
+    return [SingleFlightMiddleware(), CacheMiddleware(), KeyPoolMiddleware(), RetryMiddleware(),
+            PacingMiddleware(), InstrumentationMiddleware()]
@@ -0,0 +1,188 @@
+"""
+Compact typed result models.
+
+The models keep only the documented fields of a response in `__slots__`, unknown
+fields are dropped. Nested objects (e.g. `urls`, `user`, `exif`, `location`) are
+kept as received and only parsed into their model on first access.
+
+Usage:
+    from unsplashapi.models import Photo, parse_pages
+
+    photo = Photo.from_dict(api.get_photo_by_id('ieic5Tq8YMk'))
+    photo.user.username
+
+    for photos in parse_pages(api.list_photos_paginate(page_limit=5), Photo):
+        ...
+"""
+
+
+class Nested:
+    """
+    Descriptor of a nested object, which is parsed into `model` on first access.
+    The raw value is stored in the slot `_<name>`.
+    """
+
+    def __init__(self, model) -> None:
+        self.model = model
+
+    def __set_name__(self, owner, name) -> None:
+        self.name = name
+        self.slot = '_' + name
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        value = getattr(instance, self.slot)
+        if isinstance(value, dict):
+            value = self.model.from_dict(value)
+            setattr(instance, self.slot, value)
+
+        return value
+
+    def __set__(self, instance, value) -> None:
+        setattr(instance, self.slot, value)
+
+
+class Model:
+    """
+    Base class of the models. Subclasses list their scalar fields in `fields` and
+    their nested objects as Nested descriptors; `__slots__` has to contain both
+    (nested objects with a leading underscore).
+    """
+
+    __slots__ = ()
+    fields = ()
+    nested = ()
+
+    def __init__(self, **values) -> None:
+        for name in self.fields + self.nested:
+            setattr(self, name, values.get(name))
+
+    @classmethod
+    def from_dict(cls, data: dict):
+        """
+        Creates a model from a decoded response. Unknown fields are dropped.
+        """
+        instance = cls.__new__(cls)
+        for name in cls.fields:
+            setattr(instance, name, data.get(name))
+        for name in cls.nested:
+            setattr(instance, '_' + name, data.get(name))
+
+        return instance
+
+    @classmethod
+    def from_page(cls, page) -> list:
+        """
+        Creates models from all items of a page (a list, or a search result with `results`).
+        """
+        items = page.get('results', []) if isinstance(page, dict) else page
+
+        return [cls.from_dict(item) for item in items]
+
+    def to_dict(self) -> dict:
+        """
+        Returns the fields of the model as dictionary, nested models are converted as well.
+        """
+        data = {name: getattr(self, name) for name in self.fields}
+        for name in self.nested:
+            value = getattr(self, '_' + name)
+            data[name] = value.to_dict() if isinstance(value, Model) else value
+
+        return data
+
+    def __eq__(self, other) -> bool:
+        return type(self) is type(other) and self.to_dict() == other.to_dict()
+
+    def __repr__(self) -> str:
+        identity = getattr(self, 'id', None)
+        return f'{type(self).__name__}(id={identity!r})' if identity is not None else f'{type(self).__name__}()'
+
+
+class Urls(Model):
+    fields = ('raw', 'full', 'regular', 'small', 'thumb')
+    __slots__ = fields
+
+
+class Exif(Model):
+    fields = ('make', 'model', 'name', 'exposure_time', 'aperture', 'focal_length', 'iso')
+    __slots__ = fields
+
+
+class Location(Model):
+    fields = ('name', 'city', 'country', 'position')
+    __slots__ = fields
+
+
+class ProfileImage(Model):
+    fields = ('small', 'medium', 'large')
+    __slots__ = fields
+
+
+class User(Model):
+    fields = ('id', 'username', 'name', 'first_name', 'last_name', 'bio', 'location', 'portfolio_url',
+              'instagram_username', 'twitter_username', 'total_likes', 'total_photos', 'total_collections',
+              'updated_at')
+    nested = ('profile_image',)
+    __slots__ = fields + ('_profile_image',)
+    profile_image = Nested(ProfileImage)
+
+
+class Photo(Model):
+    fields = ('id', 'created_at', 'updated_at', 'promoted_at', 'width', 'height', 'color', 'blur_hash',
+              'description', 'alt_description', 'likes', 'downloads', 'views')
+    nested = ('urls', 'user', 'exif', 'location')
+    __slots__ = fields + ('_urls', '_user', '_exif', '_location')
+    urls = Nested(Urls)
+    user = Nested(User)
+    exif = Nested(Exif)
+    location = Nested(Location)
+
+
+class Collection(Model):
+    fields = ('id', 'title', 'description', 'published_at', 'last_collected_at', 'updated_at', 'total_photos',
+              'private', 'share_key')
+    nested = ('user', 'cover_photo')
+    __slots__ = fields + ('_user', '_cover_photo')
+    user = Nested(User)
+    cover_photo = Nested(Photo)
+
+
+class Topic(Model):
+    fields = ('id', 'slug', 'title', 'description', 'published_at', 'updated_at', 'starts_at', 'ends_at',
+              'featured', 'total_photos', 'status')
+    nested = ('cover_photo',)
+    __slots__ = fields + ('_cover_photo',)
+    cover_photo = Nested(Photo)
+
+
+class Stats(Model):
+    """
+    Totals (/stats/total) and monthly stats (/stats/month) of Unsplash.
+    """
+    fields = ('photos', 'downloads', 'views', 'likes', 'photographers', 'pixels', 'downloads_per_second',
+              'views_per_second', 'developers', 'applications', 'requests', 'new_photos', 'new_photographers',
+              'new_pixels', 'new_developers', 'new_applications', 'new_requests')
+    __slots__ = fields
+
+
+def parse_items(items, model):
+    """
+    Converts single items (e.g. from iter_photos) into models.
+
+    Yields:
+        Model instances
+    """
+    for item in items:
+        yield model.from_dict(item)
+
+
+def parse_pages(pages, model):
+    """
+    Converts the pages of a paginated generator (e.g. list_photos_paginate) into lists of models.
+
+    Yields:
+        List of model instances per page
+    """
+    for page in pages:
+        yield model.from_page(page)
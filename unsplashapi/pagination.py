@@ -0,0 +1,302 @@
+import asyncio
+import itertools
+import re
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import AsyncIterator, Awaitable, Callable, Iterable, Iterator
+from urllib.parse import parse_qs, urlsplit
+
+
+def paginate(fetch_page: Callable[[int], object], pages: Iterable[int], prefetch: int = 4) -> Iterator:
+    """
+    Fetches pages with a bounded window of concurrent requests and yields them in order.
+
+    While the caller consumes page i, up to `prefetch` following pages are already being
+    fetched in a thread pool. Closing the generator early (or an exception while fetching)
+    cancels all outstanding fetches.
+
+    Args:
+        fetch_page (callable):      Function returning the contents of a single page number.
+        pages (iterable):           Page numbers to fetch, in the order they are yielded.
+        prefetch (int, optional):   Maximum number of pages in flight. 
+                                    A value <= 1 fetches page by page without threads.
+                                    Defaults to 4.
+
+    Yields:
+        Page contents in the order of `pages`.
+    """
+    pages = iter(pages)
+    if prefetch <= 1:
+        for page in pages:
+            yield fetch_page(page)
+        return
+
+    executor = ThreadPoolExecutor(max_workers=prefetch, thread_name_prefix='unsplashapi-page')
+    in_flight = deque()
+    try:
+        for page in pages:
+            in_flight.append(executor.submit(fetch_page, page))
+            if len(in_flight) >= prefetch:
+                break
+        while in_flight:
+            result = in_flight.popleft().result()
+            for page in pages:
+                in_flight.append(executor.submit(fetch_page, page))
+                break
+            yield result
+    finally:
+        for future in in_flight:
+            future.cancel()
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+async def apaginate(fetch_page: Callable[[int], Awaitable], pages: Iterable[int], prefetch: int = 4) -> AsyncIterator:
+    """
+    Asynchronous version of `paginate`, which runs the fetches as asyncio tasks.
+
+    Args:
+        fetch_page (callable):      Coroutine function returning the contents of a single page number.
+        pages (iterable):           Page numbers to fetch, in the order they are yielded.
+        prefetch (int, optional):   Maximum number of pages in flight. Defaults to 4.
+
+    Yields:
+        Page contents in the order of `pages`.
+    """
+    pages = iter(pages)
+    prefetch = max(prefetch, 1)
+    in_flight = deque()
+    try:
+        for page in pages:
+            in_flight.append(asyncio.ensure_future(fetch_page(page)))
+            if len(in_flight) >= prefetch:
+                break
+        while in_flight:
+            result = await in_flight.popleft()
+            for page in pages:
+                in_flight.append(asyncio.ensure_future(fetch_page(page)))
+                break
+            yield result
+    finally:
+        for task in in_flight:
+            task.cancel()
+
+
+# Items per page of the API if `per_page` is not given
+DEFAULT_PER_PAGE = 10
+
+_LINK = re.compile(r'<([^>]*)>\s*;\s*rel="?([a-z]+)"?')
+
+
+def last_page(headers, data, per_page: int = DEFAULT_PER_PAGE, page: int = 1):
+    """
+    Returns the number of the last page as reported by the response of `page`: `total_pages`
+    or `total` of a search body, the X-Total (and X-Per-Page) headers or the rel="last" link
+    of the Link header. None if the response does not report it.
+    """
+    if isinstance(data, dict):
+        if data.get('total_pages') is not None:
+            return int(data['total_pages'])
+        if data.get('total') is not None:
+            return -(-int(data['total']) // per_page)
+    total = headers.get('X-Total')
+    if total is not None:
+        return -(-int(total) // int(headers.get('X-Per-Page') or per_page))
+    link = headers.get('Link')
+    if link:
+        relations = {name: url for url, name in _LINK.findall(link)}
+        if 'last' in relations:
+            return int(parse_qs(urlsplit(relations['last']).query).get('page', [page])[0])
+        if 'next' not in relations:
+            return page
+
+    return None
+
+
+def plan_pages(last: int = None, page_limit: int = None):
+    """
+    Returns the page numbers following page 1, up to the last page (if known) and `page_limit`.
+    """
+    limits = [limit for limit in (last, page_limit) if limit is not None]
+    if not limits:
+        return itertools.count(2)
+
+    return range(2, min(limits) + 1)
+
+
+def paginate_planned(fetch_first: Callable[[], tuple], fetch_page: Callable[[int], object], per_page: int,
+                     page_limit: int = None, prefetch: int = 4) -> Iterator:
+    """
+    Fetches page 1, plans the following pages from the last page it reports and fetches
+    them with `paginate`, so no page is requested twice or beyond the last page. If the
+    last page is not reported, pages are fetched one by one until a page has less than
+    `per_page` items, as prefetched pages could all lie beyond the end.
+
+    Args:
+        fetch_first (callable):         Function returning (contents, last page or None) of page 1.
+        fetch_page (callable):          Function returning the contents of a single page number.
+        per_page (int):                 Items per page
+        page_limit (int, optional):     Maximum number of pages. Defaults to None (all pages).
+        prefetch (int, optional):       Maximum number of pages in flight if the last page is known.
+                                        Defaults to 4.
+
+    Yields:
+        Page contents in order.
+    """
+    if page_limit is not None and page_limit < 1:
+        return
+    first, last = fetch_first()
+    yield first
+    if last is None and len(page_items(first)) < per_page:
+        return
+
+    pages = paginate(fetch_page, plan_pages(last, page_limit), prefetch=prefetch if last is not None else 1)
+    try:
+        for page in pages:
+            yield page
+            if last is None and len(page_items(page)) < per_page:
+                return
+    finally:
+        pages.close()
+
+
+async def apaginate_planned(fetch_first: Callable[[], Awaitable], fetch_page: Callable[[int], Awaitable],
+                            per_page: int, page_limit: int = None, prefetch: int = 4) -> AsyncIterator:
+    """
+    Asynchronous version of `paginate_planned`.
+    """
+    if page_limit is not None and page_limit < 1:
+        return
+    first, last = await fetch_first()
+    yield first
+    if last is None and len(page_items(first)) < per_page:
+        return
+
+    pages = apaginate(fetch_page, plan_pages(last, page_limit), prefetch=prefetch if last is not None else 1)
+    try:
+        async for page in pages:
+            yield page
+            if last is None and len(page_items(page)) < per_page:
+                return
+    finally:
+        await pages.aclose()
+
+
+def page_items(page) -> list:
+    """
+    Returns the items of a page. List endpoints return a list, search endpoints a dict 
+    with the items in `results`.
+    """
+    if isinstance(page, dict):
+        return page.get('results') or []
+
+    return page or []
+
+
+def unseen(page, seen):
+    """
+    Returns `page` without the items whose `id` is in `seen`. The IDs are not added (see `skip_seen`).
+    """
+    items = [item for item in page_items(page) if item['id'] not in seen]
+    if isinstance(page, dict):
+        return {**page, 'results': items}
+
+    return items
+
+
+def _mark_seen(page, seen) -> None:
+    for item in page_items(page):
+        seen.add(item['id'])
+
+
+def skip_seen(pages: Iterator, seen) -> Iterator:
+    """
+    Yields the pages of `pages` without the items seen before (see `unseen`), e.g. known
+    from an earlier run with a persistent BloomFilter. Pages are yielded even if empty.
+
+    The IDs of a page are added to `seen` when the next page is requested (or the pages are
+    exhausted), i.e. once the consumer processed it. The page a consumer stops at (break,
+    exception) is not marked, so it comes again in the next run instead of being lost.
+    """
+    try:
+        for page in pages:
+            page = unseen(page, seen)
+            yield page
+            _mark_seen(page, seen)
+    finally:
+        pages.close()
+
+
+async def askip_seen(pages: AsyncIterator, seen) -> AsyncIterator:
+    """
+    Asynchronous version of `skip_seen`.
+    """
+    try:
+        async for page in pages:
+            page = unseen(page, seen)
+            yield page
+            _mark_seen(page, seen)
+    finally:
+        await pages.aclose()
+
+
+def pages_needed(max_items: int, per_page: int, page_limit: int = None):
+    """
+    Returns the number of pages needed for `max_items` items, bounded by `page_limit`.
+    None if both are unbounded.
+    """
+    limits = [limit for limit in (page_limit, -(-max_items // per_page) if max_items is not None else None)
+              if limit is not None]
+
+    return min(limits) if limits else None
+
+
+def iter_items(pages: Iterator, max_items: int = None) -> Iterator:
+    """
+    Flattens a generator of pages into single items. Stops at the first empty page or after
+    `max_items` items, and closes the page generator, which cancels outstanding prefetches.
+
+    Args:
+        pages (generator):          Generator of pages, e.g. from `paginate`.
+        max_items (int, optional):  Maximum number of items. Defaults to None (all items).
+
+    Yields:
+        Single items
+    """
+    if max_items is not None and max_items <= 0:
+        pages.close()
+        return
+    count = 0
+    try:
+        for page in pages:
+            items = page_items(page)
+            if not items:
+                return
+            for item in items:
+                yield item
+                count += 1
+                if max_items is not None and count >= max_items:
+                    return
+    finally:
+        pages.close()
+
+
+async def aiter_items(pages: AsyncIterator, max_items: int = None) -> AsyncIterator:
+    """
+    Asynchronous version of `iter_items`.
+    """
+    if max_items is not None and max_items <= 0:
+        await pages.aclose()
+        return
+    count = 0
+    try:
+        async for page in pages:
+            items = page_items(page)
+            if not items:
+                return
+            for item in items:
+                yield item
+                count += 1
+                if max_items is not None and count >= max_items:
+                    return
+    finally:
+        await pages.aclose()
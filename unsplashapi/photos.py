@@ -1,5 +1,11 @@
-import requests
-from .base import UnsplashBase
+import os
+
+from .base import NO_CACHE, UnsplashBase
+from .bulk import run_bulk
+from .crawl import Checkpoint, crawl_latest
+from .download import DownloadResult, download_file
+from .fanout import SeenSet, expand_searches, fan_out
+from .projection import compile_fields
 
 
 class UnsplashPhotos(UnsplashBase):
@@ -9,17 +15,17 @@ class UnsplashPhotos(UnsplashBase):
     API-Doc: https://unsplash.com/documentation#list-photos
     """
 
-    def __init__(self, access_key: str):
+    def __init__(self, access_key: str, **kwargs):
         """
 
 
         Args:
             access_key (str):           Access Key given from the API
         """
-        super().__init__(access_key=access_key)
-        self.access_key = access_key
+        super().__init__(access_key=access_key, **kwargs)
 
-    def list_photos_paginate(self, page_limit: int = 10, items_per_page: int = 10, **kwargs):
+    def list_photos_paginate(self, page_limit: int = 10, items_per_page: int = 10, fields: list = None, seen=None,
+                             **kwargs):
         """
         Get a mulitple pages from the Editorial feed.
         see here: https://unsplash.com/documentation#list-photos
@@ -31,25 +37,74 @@ class UnsplashPhotos(UnsplashBase):
                                             Defaults to 10.
             **kwargs:
                     order_by: str = 'latest'
+            fields (list, optional):        Dotted paths each record is cut down to, e.g. ['id', 'urls.small'].
+                                            Defaults to None (whole records).
+            seen (optional):                Set of seen IDs, e.g. a persistent BloomFilter. Photos seen before
+                                            are removed from the pages. Defaults to None.
 
         Raises:
-            Exception: Exception
+            UnsplashHTTPError: If the response status is not 2xx.
 
         Yields:
             Dictionary with page contents: 
         """  
-        endpoint = self.base_url + '/photos'
-        for i in range(page_limit):
-            response = self.session.get(endpoint,
-                                        params=dict(client_id=self.access_key,
-                                                    page=i,
-                                                    per_page=items_per_page))
-            if not response.status_code == 200:
-                raise Exception(f'Not able to extract content. Code - {response.status_code}')
+        return self._paginate('/photos', page_limit, per_page=items_per_page, fields=fields, seen=seen, **kwargs)
+
+    def iter_photos(self, max_items: int = None, items_per_page: int = 30, fields: list = None, **kwargs):
+        """
+        Iterates over single photos of the Editorial feed. Stops requesting pages as soon 
+        as `max_items` photos were produced.
+        see here: https://unsplash.com/documentation#list-photos
+
+        Args:
+            max_items (int, optional):      Maximum number of photos. Defaults to None (all photos).
+            items_per_page (int, optional): Number of items per request (max. 30). Defaults to 30.
+            **kwargs:
+                    order_by: str = 'latest'
+            fields (list, optional):        Dotted paths each record is cut down to, e.g. ['id', 'urls.small'].
+                                            Defaults to None (whole records).
+
+        Raises:
+            UnsplashHTTPError: If the response status is not 2xx.
+
+        Yields:
+            Dictionary of a single photo.
+        """
+        return self._iter_items('/photos', max_items=max_items, per_page=items_per_page, fields=fields, **kwargs)
+
+    def crawl_latest_photos(self, checkpoint, items_per_page: int = 30, page_limit: int = None,
+                            fields: list = None):
+        """
+        Incrementally crawls the latest photos. Only photos uploaded after the watermark 
+        stored in `checkpoint` are yielded and pagination stops at the first known photo, 
+        so a frequent poll costs one or two requests. An interrupted crawl resumes after 
+        the last completed page (see crawl.crawl_latest).
+        see here: https://unsplash.com/documentation#list-photos
+
+        Args:
+            checkpoint:                     Path of the checkpoint file or a Checkpoint.
+            items_per_page (int, optional): Number of items per request (max. 30). Defaults to 30.
+            page_limit (int, optional):     Maximum number of pages per call. Defaults to None.
+            fields (list, optional):        Dotted paths each photo is cut down to, `id` and
+                                            `created_at` are always kept. Defaults to None.
 
-            yield response.json()
+        Raises:
+            UnsplashHTTPError: If the response status is not 2xx.
+
+        Yields:
+            Dictionary of a single new photo, newest first.
+        """
+        if not isinstance(checkpoint, Checkpoint):
+            checkpoint = Checkpoint(checkpoint)
+        if fields is not None:
+            fields = list(fields) + ['id', 'created_at']
+
+        # The feed is always requested from the API, a cached page would hide new uploads
+        return crawl_latest(lambda page: self._get('/photos', fields=fields, page=page, per_page=items_per_page,
+                                                   order_by='latest', headers=NO_CACHE),
+                            checkpoint, page_limit=page_limit)
 
-    def list_photos(self, items_per_page: int = 10, **kwargs):
+    def list_photos(self, items_per_page: int = 10, fields: list = None, **kwargs):
         """
         Get a single page from the Editorial feed.
         see here: https://unsplash.com/documentation#list-photos
@@ -59,22 +114,15 @@ class UnsplashPhotos(UnsplashBase):
         items_per_page:      Defines how many items per page if multiple pages should be extracted
         **kwargs:
                 order_by: str = 'latest'
+        fields:              Dotted paths each record is cut down to, e.g. ['id', 'urls.small']
 
         Returns
         -------
         Dictionary of Items
         """
-        endpoint = self.base_url + '/photos'
-        response = self.session.get(endpoint,
-                                    params=dict(client_id=self.access_key,
-                                                page=1,
-                                                per_page=items_per_page, **kwargs))
-        if not response.status_code == 200:
-            raise Exception(f'Not able to extract content. Code - {response.status_code}')
-
-        return response.json()
+        return self._get('/photos', page=1, per_page=items_per_page, fields=fields, **kwargs)
 
-    def get_photo_by_id(self, photo_id):
+    def get_photo_by_id(self, photo_id, fields: list = None):
         """
         Retrieve a single photo.
         see here: https://unsplash.com/documentation#get-a-photo
@@ -83,20 +131,58 @@ class UnsplashPhotos(UnsplashBase):
         ----------
         photo_id:       ID of the photo
                         (see @ end of url if photo openend in browser)
+        fields:         Dotted paths each record is cut down to, e.g. ['id', 'urls.small']
 
         Returns
         -------
         Dictionary of Items
         """
-        endpoint = self.base_url + f'/photos/{photo_id}'
-        response = self.session.get(endpoint,
-                                    params=dict(client_id=self.access_key))
-        if not response.status_code == 200:
-            raise Exception(f'Not able to extract content. Code - {response.status_code}')
+        return self._get(f'/photos/{photo_id}', fields=fields)
 
-        return response.json()
+    def iter_photos_by_ids(self, photo_ids, max_workers: int = 8, fields: list = None):
+        """
+        Retrieves many photos concurrently and yields them in completion order.
+        Duplicate IDs are fetched once, cached photos are served from the cache and
+        IDs are failed without a request once the rate limit is used up.
+
+        Args:
+            photo_ids (iterable):           IDs of the photos
+            max_workers (int, optional):    Maximum number of concurrent requests. Defaults to 8.
+            fields (list, optional):        Dotted paths each photo is cut down to, e.g. ['id', 'urls.small'].
+                                            Defaults to None (whole photos).
+
+        Yields:
+            (photo_id, photo, error):       `photo` is the photo dictionary, or None if the request
+                                            failed with the exception `error`.
+        """
+        def fetch(photo_id):
+            self._check_budget(f'/photos/{photo_id}')
+            return self.get_photo_by_id(photo_id, fields=fields)
 
-    def get_random_photo(self, **kwargs):
+        return run_bulk(fetch, dict.fromkeys(photo_ids), max_workers=max_workers)
+
+    def get_photos_by_ids(self, photo_ids, max_workers: int = 8, fields: list = None):
+        """
+        Retrieves many photos concurrently, see iter_photos_by_ids.
+
+        Args:
+            photo_ids (iterable):           IDs of the photos
+            max_workers (int, optional):    Maximum number of concurrent requests. Defaults to 8.
+            fields (list, optional):        Dotted paths each photo is cut down to. Defaults to None.
+
+        Returns:
+            (photos, errors):   Dictionaries mapping the photo IDs to the photo or to the raised exception.
+        """
+        photos, errors = {}, {}
+        for photo_id, photo, error in self.iter_photos_by_ids(photo_ids, max_workers=max_workers, fields=fields):
+            if error is not None:
+                errors[photo_id] = error
+            else:
+                photos[photo_id] = photo
+
+        return photos, errors
+
+    def get_random_photo(self, fields: list = None, **kwargs):
         """
         Returns a random photo.
         see here: https://unsplash.com/documentation#get-a-random-photo
@@ -112,20 +198,15 @@ class UnsplashPhotos(UnsplashBase):
             orientation:	Filter by photo orientation. (Valid values: landscape, portrait, squarish)
             content_filter:	Limit results by content safety. Default: low. Valid values are low and high.
             count:	        The number of photos to return. (Default: 1; max: 30)
+        fields:              Dotted paths each record is cut down to, e.g. ['id', 'urls.small']
 
         Returns
         -------
         Dictionary of Items
         """
-        endpoint = self.base_url + '/photos/random'
-        response = self.session.get(endpoint,
-                                    params=dict(client_id=self.access_key, **kwargs))
-        if not response.status_code == 200:
-            raise Exception(f'Not able to extract content. Code - {response.status_code}')
+        return self._get('/photos/random', fields=fields, **kwargs)
 
-        return response.json()
-
-    def get_photo_statistics(self, photo_id):
+    def get_photo_statistics(self, photo_id, fields: list = None):
         """
         Retrieves statistics of a single photo.
         see here: https://unsplash.com/documentation#get-a-photos-statistics
@@ -134,18 +215,13 @@ class UnsplashPhotos(UnsplashBase):
         ----------
         photo_id:       ID of the photo
                         (see @ end of url if photo openend in browser)
+        fields:         Dotted paths each record is cut down to, e.g. ['id', 'urls.small']
 
         Returns
         -------
         Dictionary of Items
         """
-        endpoint = self.base_url + f'/photos/{photo_id}/statistics'
-        response = self.session.get(endpoint,
-                                    params=dict(client_id=self.access_key))
-        if not response.status_code == 200:
-            raise Exception(f'Not able to extract content. Code - {response.status_code}')
-
-        return response.json()
+        return self._get(f'/photos/{photo_id}/statistics', fields=fields)
 
     def track_photo_download(self, photo_id):
         """
@@ -162,13 +238,64 @@ class UnsplashPhotos(UnsplashBase):
         -------
         Dictionary of Items
         """
-        endpoint = self.base_url + f'/photos/{photo_id}/download'
-        response = self.session.get(endpoint,
-                                    params=dict(client_id=self.access_key))
-        if not response.status_code == 200:
-            raise Exception(f'Not able to extract content. Code - {response.status_code}')
+        return self._get(f'/photos/{photo_id}/download')
+
+    def download_photo(self, photo, directory: str, size: str = None, chunk_size: int = 64 * 1024):
+        """
+        Downloads the image of a photo into `directory` as `<photo_id>.jpg`. The image is
+        streamed to disk in chunks and a partial file from an earlier attempt is resumed
+        with an HTTP Range request. The download is tracked with track_photo_download,
+        as required by the API guidelines. Existing files are skipped.
+
+        Args:
+            photo:                          ID of the photo or photo dictionary
+            directory (str):                Target directory, created if missing.
+            size (str, optional):           Key of the photo's `urls` (raw, full, regular, small, thumb).
+                                            Defaults to None, the URL returned by the download tracking.
+            chunk_size (int, optional):     Size of the chunks written to disk. Defaults to 64 KiB.
+
+        Returns:
+            DownloadResult:                 Path, transferred bytes, duration and throughput.
+        """
+        photo_id = photo['id'] if isinstance(photo, dict) else photo
+        path = os.path.join(directory, f'{photo_id}.jpg')
+        if os.path.exists(path):
+            return DownloadResult(photo_id, path, skipped=True)
+
+        url = self.track_photo_download(photo_id)['url']
+        if size is not None:
+            if not isinstance(photo, dict) or 'urls' not in photo:
+                photo = self.get_photo_by_id(photo_id)
+            url = photo['urls'][size]
+        os.makedirs(directory, exist_ok=True)
+        transferred, seconds, resumed = download_file(self.session, url, path, self.policy, chunk_size=chunk_size)
+
+        return DownloadResult(photo_id, path, bytes=transferred, seconds=seconds, resumed=resumed)
+
+    def download_photos(self, photos, directory: str, size: str = None, max_workers: int = 8,
+                        chunk_size: int = 64 * 1024):
+        """
+        Downloads the images of many photos concurrently over the shared connection pool,
+        see download_photo. Every photo is downloaded (and tracked) once.
+
+        Args:
+            photos (iterable):              IDs of the photos or photo dictionaries
+            directory (str):                Target directory
+            size (str, optional):           Key of the photo's `urls`, see download_photo.
+            max_workers (int, optional):    Maximum number of concurrent downloads. Defaults to 8.
+            chunk_size (int, optional):     Size of the chunks written to disk. Defaults to 64 KiB.
+
+        Yields:
+            (photo_id, result, error):      DownloadResult of the photo, or None if the download 
+                                            failed with the exception `error`.
+        """
+        unique = {}
+        for photo in photos:
+            unique.setdefault(photo['id'] if isinstance(photo, dict) else photo, photo)
 
-        return response.json()
+        return run_bulk(lambda photo_id: self.download_photo(unique[photo_id], directory, size=size,
+                                                             chunk_size=chunk_size),
+                        unique, max_workers=max_workers)
 
     def update_photo(self, photo_id, **kwargs):
         """
@@ -200,12 +327,7 @@ class UnsplashPhotos(UnsplashBase):
         -------
         Dictionary of Items
         """
-        endpoint = self.base_url + f'/photos/{photo_id}'
-        response = self.session.put(endpoint,
-                                    params=dict(client_id=self.access_key,
-                                                **kwargs))
-
-        return response.json()
+        return self._decode(self._request('PUT', f'/photos/{photo_id}', **kwargs))
 
     def like_photo(self, photo_id):
         """
@@ -221,11 +343,7 @@ class UnsplashPhotos(UnsplashBase):
         -------
         Dictionary of Items
         """
-        endpoint = self.base_url + f'/photos/{photo_id}/like'
-        response = self.session.post(endpoint,
-                                     params=dict(client_id=self.access_key))
-
-        return response.json()
+        return self._decode(self._request('POST', f'/photos/{photo_id}/like'))
 
     def unlike_photo(self, photo_id):
         """
@@ -241,11 +359,7 @@ class UnsplashPhotos(UnsplashBase):
         -------
         Dictionary of Items
         """
-        endpoint = self.base_url + f'/photos/{photo_id}/like'
-        response = self.session.delete(endpoint,
-                                       params=dict(client_id=self.access_key))
-
-        return response.json()
+        return self._decode(self._request('DELETE', f'/photos/{photo_id}/like'))
 
 
 class UnsplashSearch(UnsplashBase):
@@ -254,10 +368,11 @@ class UnsplashSearch(UnsplashBase):
     Docs: https://unsplash.com/documentation#search
     """
 
-    def __init__(self, access_key: str) -> None:
-        super().__init__(access_key=access_key)
+    def __init__(self, access_key: str, **kwargs) -> None:
+        super().__init__(access_key=access_key, **kwargs)
 
-    def search_photos(self, query: str, number_of_pages: int = 1, items_per_page: int = 10, **kwargs) -> iter:
+    def search_photos(self, query: str, number_of_pages: int = 1, items_per_page: int = 10,
+                      fields: list = None, seen=None, **kwargs) -> iter:
         """
         Get a single page of photo results for a query.
         see here: https://unsplash.com/documentation#search
@@ -275,24 +390,89 @@ class UnsplashSearch(UnsplashBase):
                     content_filter	Limit results by content safety. (Optional; default: low). Valid values are low and high.
                     color	Filter results by color. Optional. Valid values are: black_and_white, black, white, yellow, orange, red, purple, magenta, green, teal, and blue.
                     orientation	Filter by photo orientation. Optional. (Valid values: landscape, portrait, squarish)
+            fields (list, optional):   Dotted paths each record is cut down to, e.g. ['id', 'urls.small'].
+                                       Defaults to None (whole records).
+            seen (optional):           Set of seen IDs, e.g. a persistent BloomFilter. Photos seen before
+                                       are removed from the results. Defaults to None.
 
         Returns:
             iter:                      Generator containing all elements.
         """
-        endpoint = self.base_url + '/search/photos'
-        for i in range(number_of_pages):
-            response = self.session.get(endpoint,
-                                        params=dict(client_id=self.access_key,
-                                                    query=query,
-                                                    page=i, 
-                                                    per_page=items_per_page, 
-                                                    **kwargs))
-            if not response.status_code == 200:
-                raise Exception(f'Not able to extract content. Code - {response.status_code}')
+        return self._paginate('/search/photos', number_of_pages, query=query, per_page=items_per_page,
+                              fields=fields, seen=seen, **kwargs)
+
+    def iter_search_photos(self, query: str, max_items: int = None, items_per_page: int = 30,
+                           fields: list = None, **kwargs) -> iter:
+        """
+        Iterates over single photo results of a query. Stops requesting pages as soon 
+        as `max_items` photos were produced.
+        see here: https://unsplash.com/documentation#search-photos
 
-            yield response.json()
+        Args:
+            query (str):                    Search Query
+            max_items (int, optional):      Maximum number of photos. Defaults to None (all results).
+            items_per_page (int, optional): Number of items per request (max. 30). Defaults to 30.
+            **kwargs:                       Filters, see search_photos
+            fields (list, optional):        Dotted paths each record is cut down to, e.g. ['id', 'urls.small'].
+                                            Defaults to None (whole records).
+
+        Returns:
+            iter:                           Generator yielding single photos.
+        """
+        return self._iter_items('/search/photos', max_items=max_items, per_page=items_per_page, query=query,
+                                fields=fields, **kwargs)
+
+    def multi_search_photos(self, queries, filters: list = None, max_items: int = None, pages_per_search: int = None,
+                            items_per_page: int = 30, fields: list = None, max_workers: int = 8,
+                            seen_size: int = 100_000, seen=None, errors: list = None) -> iter:
+        """
+        Runs many photo searches concurrently and merges their results into one stream without
+        duplicate photos. The searches advance page by page in parallel, so the whole job takes
+        about as long as its longest search. Within each round of pages, photos are ordered by
+        their rank in their search, weighted by the `weight` of the search.
+        see here: https://unsplash.com/documentation#search-photos
 
-    def search_collections(self, query: str, number_of_pages: int = 1, items_per_page: int = 10) -> iter:
+        Args:
+            queries (iterable):                 Search queries, each a string or a dict of parameters
+                                                (query and filters, optionally a `weight`, default 1).
+            filters (list, optional):           Filter combinations, e.g. [{'color': 'blue'}, {'color': 'teal'}],
+                                                each query is searched with each of them. Defaults to None.
+            max_items (int, optional):          Maximum number of photos in total. Defaults to None (all results).
+            pages_per_search (int, optional):   Maximum number of pages per search. Defaults to None (all pages).
+            items_per_page (int, optional):     Number of items per request (max. 30). Defaults to 30.
+            fields (list, optional):            Dotted paths each record is cut down to, e.g. ['id', 'urls.small'].
+                                                `id` is always included. Defaults to None (whole records).
+            max_workers (int, optional):        Maximum number of concurrent requests. Defaults to 8.
+            seen_size (int, optional):          Number of recent photo IDs kept to drop duplicates.
+                                                Defaults to 100000.
+            seen (optional):                    Set of seen IDs used instead, e.g. a persistent BloomFilter
+                                                to skip photos found by earlier runs. Defaults to None.
+            errors (list, optional):            Receives (search, exception) of every failed search, which is
+                                                stopped while the others go on. Defaults to None.
+
+        Raises:
+            UnsplashHTTPError: If the response status of a search is not 2xx and `errors` is None,
+                               which aborts all searches.
+
+        Returns:
+            iter:       Generator yielding (search, photo, score), with the parameters of the search
+                        which found the photo first.
+        """
+        if fields is not None:
+            fields = [*([fields] if isinstance(fields, str) else fields), 'id']
+        fields = compile_fields(fields)
+
+        def fetch_page(params, page):
+            if page == 1:
+                return self._first_page('/search/photos', fields=fields, per_page=items_per_page, **params)
+            return self._get('/search/photos', fields=fields, page=page, per_page=items_per_page, **params), None
+
+        return fan_out(fetch_page, expand_searches(queries, filters), items_per_page, page_limit=pages_per_search,
+                       max_items=max_items, seen=SeenSet(seen_size) if seen is None else seen,
+                       max_workers=max_workers, errors=errors)
+
+    def search_collections(self, query: str, number_of_pages: int = 1, items_per_page: int = 10,
+                           fields: list = None) -> iter:
         """
         Get a single page of collection results for a query.
         see here:  https://unsplash.com/documentation#search-collections
@@ -304,24 +484,37 @@ class UnsplashSearch(UnsplashBase):
                                                 Defaults to 1.
             items_per_page (int, optional):     Number of items per page
                                                 Defaults to 10.                        
+            fields (list, optional):            Dotted paths each record is cut down to, e.g. ['id', 'urls.small'].
+                                                Defaults to None (whole records).
 
         Returns:
             iter:               Generator containing all elements
         """
-        endpoint = self.base_url + '/search/collections'
-        for i in range(number_of_pages):
-            response = self.session.get(endpoint,
-                                        params=dict(client_id=self.access_key,
-                                                    query=query,
-                                                    page=i, 
-                                                    per_page=items_per_page))
-            if not response.status_code == 200:
-                raise Exception(f'Not able to extract content. Code - {response.status_code}')
+        return self._paginate('/search/collections', number_of_pages, query=query, per_page=items_per_page,
+                              fields=fields)
+
+
+    def iter_search_collections(self, query: str, max_items: int = None, items_per_page: int = 30,
+                                fields: list = None) -> iter:
+        """
+        Iterates over single collection results of a query. Stops requesting pages as soon 
+        as `max_items` collections were produced.
+        see here:  https://unsplash.com/documentation#search-collections
 
-            yield response.json()
+        Args:
+            query (str):                    Search query
+            max_items (int, optional):      Maximum number of collections. Defaults to None (all results).
+            items_per_page (int, optional): Number of items per request (max. 30). Defaults to 30.
+            fields (list, optional):        Dotted paths each record is cut down to, e.g. ['id', 'urls.small'].
+                                            Defaults to None (whole records).
 
+        Returns:
+            iter:                           Generator yielding single collections.
+        """
+        return self._iter_items('/search/collections', max_items=max_items, per_page=items_per_page,
+                                query=query, fields=fields)
 
-    def search_users(self, query: str, number_of_pages: int = 1, items_per_page: int = 10) -> iter:
+    def search_users(self, query: str, number_of_pages: int = 1, items_per_page: int = 10, fields: list = None) -> iter:
         """
         Get a single page of user results for a query.
         see here:  https://unsplash.com/documentation#search-users
@@ -333,29 +526,30 @@ class UnsplashSearch(UnsplashBase):
                                                 Defaults to 1.
             items_per_page (int, optional):     Number of items per page
                                                 Defaults to 10.                        
+            fields (list, optional):            Dotted paths each record is cut down to, e.g. ['id', 'urls.small'].
+                                                Defaults to None (whole records).
 
         Returns:
             iter:               Generator containing all elements
         """
-        endpoint = self.base_url + '/search/users'
-        for i in range(number_of_pages):
-            response = self.session.get(endpoint,
-                                        params=dict(client_id=self.access_key,
-                                                    query=query,
-                                                    page=i, 
-                                                    per_page=items_per_page))
-            if not response.status_code == 200:
-                raise Exception(f'Not able to extract content. Code - {response.status_code}')
-
-            yield response.json()
-    
-
-
-
-
-
-
-
+        return self._paginate('/search/users', number_of_pages, query=query, per_page=items_per_page, fields=fields)
 
+    def iter_search_users(self, query: str, max_items: int = None, items_per_page: int = 30,
+                          fields: list = None) -> iter:
+        """
+        Iterates over single user results of a query. Stops requesting pages as soon 
+        as `max_items` users were produced.
+        see here:  https://unsplash.com/documentation#search-users
 
+        Args:
+            query (str):                    Search query
+            max_items (int, optional):      Maximum number of users. Defaults to None (all results).
+            items_per_page (int, optional): Number of items per request (max. 30). Defaults to 30.
+            fields (list, optional):        Dotted paths each record is cut down to, e.g. ['id', 'urls.small'].
+                                            Defaults to None (whole records).
 
+        Returns:
+            iter:                           Generator yielding single users.
+        """
+        return self._iter_items('/search/users', max_items=max_items, per_page=items_per_page, query=query,
+                                fields=fields)
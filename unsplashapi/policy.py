@@ -0,0 +1,84 @@
+import random
+import time
+
+
+class RequestPolicy:
+    """
+    Timeouts and retries of the requests of a client.
+
+    Failed requests are retried with exponential backoff and full jitter on connection
+    errors, timeouts and the status codes in `retry_statuses`. Only idempotent methods
+    are retried. A `Retry-After` header of the response is honored up to `max_backoff`.
+    No retry is started after the deadline of a call has passed.
+    """
+
+    idempotent_methods = frozenset(['GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE'])
+
+    def __init__(self, connect_timeout: float = 3.05, read_timeout: float = 30.0, retries: int = 3,
+                 backoff: float = 0.5, max_backoff: float = 30.0, deadline: float = None,
+                 retry_statuses=(429, 500, 502, 503, 504)) -> None:
+        """
+        Args:
+            connect_timeout (float, optional):  Seconds to wait for a connection. Defaults to 3.05.
+            read_timeout (float, optional):     Seconds to wait between bytes of the response. Defaults to 30.
+            retries (int, optional):            Maximum number of retries per call. Defaults to 3.
+            backoff (float, optional):          Base delay in seconds, doubled with every retry. Defaults to 0.5.
+            max_backoff (float, optional):      Maximum delay between two attempts. Defaults to 30.
+            deadline (float, optional):         Maximum seconds per call including all retries. 
+                                                Defaults to None (no deadline).
+            retry_statuses (tuple, optional):   Status codes which are retried. Defaults to 429 and 5xx.
+        """
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.deadline = deadline
+        self.retry_statuses = frozenset(retry_statuses)
+
+    def remaining_time(self, started: float):
+        """
+        Seconds left until the deadline of a call started at `started` (time.monotonic), None without deadline.
+        """
+        if self.deadline is None:
+            return None
+
+        return self.deadline - (time.monotonic() - started)
+
+    def timeout(self, started: float) -> tuple:
+        """
+        Returns the (connect, read) timeout of the next attempt, capped at the remaining time of the call.
+        """
+        remaining = self.remaining_time(started)
+        if remaining is None:
+            return self.connect_timeout, self.read_timeout
+        remaining = max(remaining, 0.001)
+
+        return min(self.connect_timeout, remaining), min(self.read_timeout, remaining)
+
+    def retry_delay(self, method: str, attempt: int, started: float, retry_after: str = None):
+        """
+        Decides whether a failed attempt is retried.
+
+        Args:
+            method (str):               HTTP method of the request.
+            attempt (int):              Number of the failed attempt, starting at 0.
+            started (float):            Start of the call (time.monotonic).
+            retry_after (str):          Value of the Retry-After header, if any.
+
+        Returns:
+            Seconds to wait before the next attempt, or None if the call gives up.
+        """
+        if attempt >= self.retries or method.upper() not in self.idempotent_methods:
+            return None
+        delay = random.uniform(0, min(self.max_backoff, self.backoff * 2 ** attempt))
+        if retry_after is not None:
+            try:
+                delay = min(max(float(retry_after), 0.0), self.max_backoff)
+            except ValueError:
+                pass
+        remaining = self.remaining_time(started)
+        if remaining is not None and delay >= remaining:
+            return None
+
+        return delay
@@ -0,0 +1,74 @@
+"""
+Field projection of decoded responses.
+
+A projection is a list of dotted paths, e.g. ['id', 'urls.small', 'user.username'].
+Every record is cut down to these paths, fields missing in a record are left out.
+Lists along a path are projected element by element.
+"""
+from functools import lru_cache
+
+
+@lru_cache(maxsize=256)
+def _compile(fields: tuple) -> dict:
+    tree = {}
+    for path in fields:
+        node = tree
+        parts = path.split('.')
+        for part in parts[:-1]:
+            child = node.setdefault(part, {})
+            if child is None:
+                break
+            node = child
+        else:
+            # A shorter path selects the whole subtree.
+            node[parts[-1]] = None
+
+    return tree
+
+
+def compile_fields(fields) -> dict:
+    """
+    Compiles a list of dotted paths into a tree of nested dictionaries, where None
+    selects the whole value. Returns None if `fields` is None (no projection).
+    """
+    if fields is None:
+        return None
+    if isinstance(fields, str):
+        fields = [fields]
+
+    return _compile(tuple(fields))
+
+
+def _select(value, tree: dict):
+    if tree is None:
+        return value
+    if isinstance(value, list):
+        return [_select(item, tree) for item in value]
+    if not isinstance(value, dict):
+        return value
+
+    return {name: _select(value[name], subtree) for name, subtree in tree.items() if name in value}
+
+
+def project(data, fields):
+    """
+    Cuts a decoded response down to `fields`. Lists are projected item by item and
+    of search results (a dictionary with `results`) only the items are projected,
+    `total` and `total_pages` are kept.
+
+    Args:
+        data:               Decoded response
+        fields:             List of dotted paths, or a tree from compile_fields. None returns `data` unchanged.
+
+    Returns:
+        Projected copy of `data`.
+    """
+    if fields is None or data is None:
+        return data
+    tree = fields if isinstance(fields, dict) else compile_fields(fields)
+    if isinstance(data, dict) and isinstance(data.get('results'), list):
+        page = {name: value for name, value in data.items() if name != 'results'}
+        page['results'] = _select(data['results'], tree)
+        return page
+
+    return _select(data, tree)
@@ -0,0 +1,90 @@
+import threading
+import time
+
+
+class RateLimiter:
+    """
+    Tracks the rate limit of an access key from the `X-Ratelimit-Limit` and
+    `X-Ratelimit-Remaining` headers of every response and optionally paces
+    outgoing requests with a token bucket.
+
+    The bucket is refilled with `limit / period` tokens per second and holds at most
+    `burst` tokens, so a long crawl is spread evenly over the rate limit window
+    instead of exhausting the quota at the beginning. Pacing starts as soon as the
+    limit is known from the first response.
+    """
+
+    def __init__(self, pace: bool = True, burst: int = 10, period: float = 3600.0) -> None:
+        """
+        Args:
+            pace (bool, optional):      Pace outgoing requests. If False, the headers are only recorded.
+                                        Defaults to True.
+            burst (int, optional):      Maximum number of requests sent without delay.
+                                        Defaults to 10.
+            period (float, optional):   Length of the rate limit window in seconds.
+                                        Defaults to 3600 (Unsplash resets its limits hourly).
+        """
+        self.pace = pace
+        self.burst = burst
+        self.period = period
+        self.limit = None
+        self.remaining = None
+        self.updated_at = None
+        self._tokens = float(burst)
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def update(self, headers) -> None:
+        """
+        Records the rate limit state from response headers.
+
+        Args:
+            headers (Mapping):  Response headers (case-insensitive mapping).
+        """
+        limit = headers.get('X-Ratelimit-Limit')
+        remaining = headers.get('X-Ratelimit-Remaining')
+        with self._lock:
+            if limit is not None:
+                self.limit = int(limit)
+            if remaining is not None:
+                self.remaining = int(remaining)
+                self.updated_at = time.monotonic()
+                self._tokens = min(self._tokens, self.remaining)
+
+    def current_remaining(self):
+        """
+        Remaining requests, or None if unknown. A recorded value older than one 
+        window is treated as unknown, since the quota has been reset since.
+        """
+        if self.updated_at is None or time.monotonic() - self.updated_at > self.period:
+            return None
+
+        return self.remaining
+
+    def reserve(self) -> float:
+        """
+        Takes a token for one request.
+
+        Returns:
+            float:  Seconds the caller has to wait before sending the request.
+        """
+        if not self.pace or not self.limit:
+            return 0.0
+        with self._lock:
+            rate = self.limit / self.period
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._last_refill) * rate)
+            self._last_refill = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+
+            return -self._tokens / rate
+
+    def acquire(self) -> None:
+        """
+        Blocks until a request may be sent.
+        """
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
@@ -0,0 +1,115 @@
+import hashlib
+import math
+import mmap
+import os
+import struct
+import threading
+
+# File header: magic, number of bits, number of hash functions, number of added keys
+_HEADER = struct.Struct('<8sQQQ')
+_MAGIC = b'USBLOOM1'
+
+
+def bloom_size(capacity: int, error_rate: float) -> tuple:
+    """
+    Returns (number of bits, number of hash functions) of a Bloom filter holding
+    `capacity` keys with a false positive rate of `error_rate`.
+    """
+    if capacity <= 0 or not 0 < error_rate < 1:
+        raise ValueError('capacity must be positive and error_rate between 0 and 1')
+    bits = math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+    bits += -bits % 8
+
+    return bits, max(1, round(bits / capacity * math.log(2)))
+
+
+class BloomFilter:
+    """
+    Persistent set of seen IDs for deduplication across runs, a Bloom filter in a
+    memory-mapped file. Opening the file is instant, regardless of its size, and
+    additions are written to the file by the OS. Membership may be reported wrongly
+    for about `error_rate` of the unseen keys (e.g. 10 million IDs at 1% take 12 MB),
+    added keys are always reported.
+
+    Can be passed as `seen` to the paginated methods, which then skip known items and
+    add the IDs of a page once the next page is requested (see pagination.skip_seen).
+
+    Example:
+        with BloomFilter('seen.bloom', capacity=10_000_000, error_rate=0.01) as seen:
+            for page in api.list_photos_paginate(page_limit=100, seen=seen):
+                ...
+    """
+
+    def __init__(self, path: str, capacity: int = 10_000_000, error_rate: float = 0.01) -> None:
+        """
+        Args:
+            path (str):                     File of the filter, created if missing.
+            capacity (int, optional):       Expected number of IDs. Defaults to 10 million.
+            error_rate (float, optional):   False positive rate at `capacity`. Defaults to 0.01.
+                                            Both are ignored when opening an existing file.
+
+        Raises:
+            ValueError: If the file is not a Bloom filter.
+        """
+        self.path = path
+        if not os.path.exists(path):
+            bits, hashes = bloom_size(capacity, error_rate)
+            with open(path, 'wb') as file:
+                file.write(_HEADER.pack(_MAGIC, bits, hashes, 0))
+                file.truncate(_HEADER.size + bits // 8)
+        with open(path, 'r+b') as file:
+            self._map = mmap.mmap(file.fileno(), 0)
+        magic, self.bits, self.hashes, _ = _HEADER.unpack_from(self._map)
+        if magic != _MAGIC or len(self._map) != _HEADER.size + self.bits // 8:
+            self._map.close()
+            raise ValueError(f'{path} is not a Bloom filter')
+        self._lock = threading.Lock()
+
+    def _positions(self, key) -> list:
+        digest = hashlib.blake2b(str(key).encode(), digest_size=16).digest()
+        first, step = struct.unpack('<QQ', digest)
+
+        return [(first + i * step) % self.bits for i in range(self.hashes)]
+
+    def add(self, key) -> bool:
+        """
+        Adds `key`, returns False if it was (probably) already in the set.
+        """
+        new = False
+        with self._lock:
+            for position in self._positions(key):
+                index, mask = _HEADER.size + position // 8, 1 << position % 8
+                byte = self._map[index]
+                if not byte & mask:
+                    self._map[index] = byte | mask
+                    new = True
+            if new:
+                _HEADER.pack_into(self._map, 0, _MAGIC, self.bits, self.hashes, len(self) + 1)
+
+        return new
+
+    def __contains__(self, key) -> bool:
+        return all(self._map[_HEADER.size + position // 8] & 1 << position % 8 for position in self._positions(key))
+
+    def __len__(self) -> int:
+        """
+        Number of keys added (keys mistaken as seen are not counted).
+        """
+        return _HEADER.unpack_from(self._map)[3]
+
+    def flush(self) -> None:
+        """
+        Writes the changes to disk.
+        """
+        self._map.flush()
+
+    def close(self) -> None:
+        if not self._map.closed:
+            self._map.flush()
+            self._map.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
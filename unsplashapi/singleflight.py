@@ -0,0 +1,89 @@
+import asyncio
+import fnmatch
+import threading
+
+
+class _Call:
+
+    __slots__ = ('event', 'result', 'error')
+
+    def __init__(self) -> None:
+        self.event = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent identical calls: while a call for a key is in flight, further
+    calls for the same key wait for it and receive its result (or its exception)
+    instead of sending their own request. Results are shared and must not be modified.
+
+    Random photos and download tracking are never coalesced, because every call has
+    to reach the API.
+    """
+
+    never_coalesce = ('/photos/random', '/photos/*/download')
+
+    def __init__(self) -> None:
+        self._calls = {}
+        self._lock = threading.Lock()
+
+    def applies(self, endpoint: str) -> bool:
+        """
+        Returns True if calls to `endpoint` may be coalesced.
+        """
+        return not any(fnmatch.fnmatchcase(endpoint, pattern) for pattern in self.never_coalesce)
+
+    def do(self, key: str, func):
+        """
+        Runs `func` once for all concurrent callers with the same `key`.
+
+        Args:
+            key (str):          Identity of the call, e.g. endpoint and parameters.
+            func (callable):    Function without arguments performing the call.
+
+        Returns:
+            Result of `func`.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+
+        if not leader:
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = func()
+        except BaseException as error:
+            call.error = error
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.event.set()
+
+        return call.result
+
+
+class AsyncSingleFlight(SingleFlight):
+    """
+    Asynchronous version of SingleFlight. The shared call runs as a task, so a waiter
+    being cancelled does not cancel the call for the other waiters.
+    """
+
+    async def do(self, key: str, func):
+        """
+        Runs the coroutine function `func` once for all concurrent callers with the same `key`.
+        """
+        task = self._calls.get(key)
+        if task is None:
+            task = self._calls[key] = asyncio.ensure_future(func())
+            task.add_done_callback(lambda _: self._calls.pop(key, None))
+
+        return await asyncio.shield(task)
@@ -1,5 +1,4 @@
 from .base import UnsplashBase
-import requests
 
 
 class UnsplashTopics(UnsplashBase):
@@ -8,12 +7,12 @@ class UnsplashTopics(UnsplashBase):
     Doc: https://unsplash.com/documentation#topics
     """
 
-    def __init__(self, access_key: str) -> None:
+    def __init__(self, access_key: str, **kwargs) -> None:
         """
         Args:
             access_key (str):       Access Key for the API
         """
-        super().__init__(access_key)
+        super().__init__(access_key=access_key, **kwargs)
 
     def get_topics(self, ids: str, number_of_pages: int = 1, items_per_page: int = 10, order_by: str = 'position') -> iter:
         """
@@ -30,23 +29,13 @@ class UnsplashTopics(UnsplashBase):
              order_by (str. optional):          How to sort the topics. (Optional; Valid values: featured, latest, oldest, position
                                                 Defaults to position
          Raises:
-             Exception: Exception
+             UnsplashHTTPError: If the response status is not 2xx.
 
          Yields:
              Iterator[iter]:                    Iterator with list of all topics. 
         """
         
-        endpoint = self.base_url + '/topics'
-        for i in range(number_of_pages):
-            response = self.session.get(endpoint,
-                                        params=dict(client_id=self.access_key,
-                                                    ids=ids,
-                                                    page=i, 
-                                                    per_page=items_per_page))
-            if not response.status_code == 200:
-                raise Exception(f'Not able to extract content. Code - {response.status_code}')
-
-            yield response.json()
+        return self._paginate('/topics', number_of_pages, ids=ids, per_page=items_per_page, order_by=order_by)
 
     def get_single_topic(self, ids: str) -> dict:
         """
@@ -56,19 +45,12 @@ class UnsplashTopics(UnsplashBase):
          Args:
              ids (str):     Limit to only matching topic ids or slugs. (Optional; Comma separated string) 
          
-         Exception: Exception
+         UnsplashHTTPError: If the response status is not 2xx.
 
          Returns:
              Dict:          Dict with topic contents.
         """
-        endpoint = self.base_url + '/topics'
-        response = self.session.get(endpoint,
-                                    params=dict(client_id=self.access_key,
-                                                ids=ids))
-        if not response.status_code == 200:
-            raise Exception(f'Not able to extract content. Code - {response.status_code}')
-
-        return response.json()
+        return self._get('/topics', ids=ids)
 
     def get_topic_photos(self, ids: str, number_of_pages: int = 1, items_per_page: int = 10, order_by: str = 'latest', **kwargs) -> iter:
         """
@@ -77,34 +59,25 @@ class UnsplashTopics(UnsplashBase):
 
 
          Args:
-             ids (str):                         Limit to only matching topic ids or slugs. (Optional; Comma separated string) 
+             ids (str):                         The topic’s ID or slug.
              number_of_pages (int, optional):   Number of total pages to retrieve. 
                                                 Defaults to 1.
              items_per_page (int, optional):    Number of items per page. 
                                                 Defaults to 10.
-             order_by (str. optional):          How to sort the topics. (Optional; Valid values: featured, latest, oldest, position
+             order_by (str. optional):          How to sort the photos. (Optional; Valid values: latest, oldest, popular
                                                 Defaults to latest
              **kwargs:
                         orientation	Filter by photo orientation. (Optional; Valid values: landscape, portrait, squarish)
 
          Raises:
-             Exception: Exception
+             UnsplashHTTPError: If the response status is not 2xx.
 
          Yields:
-             Iterator[iter]:                    Iterator with list of all topics. 
+             Iterator[iter]:                    Iterator with list of the topic’s photos.
         """
         
-        endpoint = self.base_url + '/topics'
-        for i in range(number_of_pages):
-            response = self.session.get(endpoint,
-                                        params=dict(client_id=self.access_key,
-                                                    ids=ids,
-                                                    page=i, 
-                                                    per_page=items_per_page, **kwargs))
-            if not response.status_code == 200:
-                raise Exception(f'Not able to extract content. Code - {response.status_code}')
-
-            yield response.json()
+        return self._paginate(f'/topics/{ids}/photos', number_of_pages, per_page=items_per_page, order_by=order_by,
+                              **kwargs)
    
 
 class UnsplashStats(UnsplashBase):
@@ -112,13 +85,13 @@ class UnsplashStats(UnsplashBase):
     Wrapper for API endpoint stats. Docs: https://unsplash.com/documentation#stats
     """
 
-    def __init__(self, access_key: str) -> None:
+    def __init__(self, access_key: str, **kwargs) -> None:
         """_summary_
 
         Args:
             access_key (str): _description_
         """
-        super().__init__(access_key)
+        super().__init__(access_key=access_key, **kwargs)
 
     def get_stats_total(self) -> dict:
         """
@@ -126,18 +99,12 @@ class UnsplashStats(UnsplashBase):
         see here: https://unsplash.com/documentation#totals
 
         Raises:
-            Exception: _description_
+            UnsplashHTTPError: If the response status is not 2xx.
 
         Returns:
             dict:   Dictionary with total stats.
         """
-        endpoint = self.base_url + '/stats/total'
-        response = self.session.get(endpoint,
-                                    params=dict(client_id=self.access_key))
-        if not response.status_code == 200:
-            raise Exception(f'Not able to extract content. Code - {response.status_code}')
-
-        return response.json()
+        return self._get('/stats/total')
 
 
     def get_stats_month(self) -> dict:
@@ -146,15 +113,9 @@ class UnsplashStats(UnsplashBase):
         see here: https://unsplash.com/documentation#month
 
         Raises:
-            Exception: Exception
+            UnsplashHTTPError: If the response status is not 2xx.
 
         Returns:
             dict:   Dictionary with monthly stats. 
         """
-        endpoint = self.base_url + '/stats/month'
-        response = self.session.get(endpoint,
-                                    params=dict(client_id=self.access_key))
-        if not response.status_code == 200:
-            raise Exception(f'Not able to extract content. Code - {response.status_code}')
-
-        return response.json()
\ No newline at end of file
+        return self._get('/stats/month')
\ No newline at end of file
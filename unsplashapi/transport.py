@@ -0,0 +1,179 @@
+"""
+Connection settings of the clients: pool sizes, keep-alive, TCP options and HTTP/2.
+
+    api = UnsplashAPI(access_key='<your key>', transport=TransportConfig(pool_maxsize=64))
+    api = AsyncUnsplashAPI(access_key='<your key>', transport=TransportConfig(http2=True))
+
+HTTP/2 multiplexes concurrent requests over one connection. It is only available with
+the asynchronous client (httpx) and requires the package h2 (pip install unsplashapi[http2]).
+"""
+import socket
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+from .metrics import record_timing
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - optional dependency
+    httpx = None
+
+try:
+    import h2
+except ImportError:  # pragma: no cover - optional dependency
+    h2 = None
+
+
+class TransportConfig:
+    """
+    Connection pooling, keep-alive and TCP settings of a client.
+
+    The synchronous client keeps up to `pool_maxsize` connections per host, which should be
+    at least the number of threads sending requests concurrently (prefetching pages, bulk
+    methods). Connections beyond the pool are opened and closed per request, unless
+    `pool_block` makes the threads wait for a free connection instead.
+    """
+
+    def __init__(self, pool_connections: int = 4, pool_maxsize: int = 32, pool_block: bool = False,
+                 max_connections: int = 100, keepalive: bool = True, keepalive_expiry: float = 60.0,
+                 tcp_nodelay: bool = True, tcp_keepalive: float = None, http2: bool = False) -> None:
+        """
+        Args:
+            pool_connections (int, optional):   Number of hosts with a connection pool (sync). Defaults to 4.
+            pool_maxsize (int, optional):       Connections kept per host (sync). Defaults to 32,
+                                                requests defaults to 10.
+            pool_block (bool, optional):        Waits for a free connection instead of opening one beyond
+                                                the pool (sync). Defaults to False.
+            max_connections (int, optional):    Maximum number of connections (async). Defaults to 100.
+            keepalive (bool, optional):         Reuses connections between requests. Defaults to True.
+            keepalive_expiry (float, optional): Seconds an idle connection is kept (async). Defaults to 60.
+            tcp_nodelay (bool, optional):       Disables Nagle's algorithm. Defaults to True.
+            tcp_keepalive (float, optional):    Seconds of idleness until TCP keep-alive probes are sent,
+                                                detects dead pooled connections. Defaults to None (off).
+            http2 (bool, optional):             Uses HTTP/2 where the server supports it (async only).
+                                                Defaults to False.
+        """
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+        self.max_connections = max_connections
+        self.keepalive = keepalive
+        self.keepalive_expiry = keepalive_expiry
+        self.tcp_nodelay = tcp_nodelay
+        self.tcp_keepalive = tcp_keepalive
+        self.http2 = http2
+
+    def socket_options(self) -> list:
+        """
+        Returns the socket options of new connections as (level, option, value) tuples.
+        """
+        options = [(socket.IPPROTO_TCP, socket.TCP_NODELAY, int(self.tcp_nodelay))]
+        if self.tcp_keepalive is not None:
+            idle = max(int(self.tcp_keepalive), 1)
+            options.append((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1))
+            # Probing intervals are not configurable on every platform
+            for name, value in (('TCP_KEEPIDLE', idle), ('TCP_KEEPALIVE', idle), ('TCP_KEEPINTVL', idle)):
+                if hasattr(socket, name):
+                    options.append((socket.IPPROTO_TCP, getattr(socket, name), value))
+
+        return options
+
+    def mount(self, session: requests.Session) -> requests.Session:
+        """
+        Configures `session` with adapters using these settings.
+
+        Raises:
+            ValueError: If HTTP/2 is requested, which requests does not support.
+        """
+        if self.http2:
+            raise ValueError('HTTP/2 is only supported by AsyncUnsplashAPI (httpx)')
+        adapter = TransportAdapter(self)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        if not self.keepalive:
+            session.headers['Connection'] = 'close'
+
+        return session
+
+    def session(self) -> requests.Session:
+        """
+        Returns a new requests.Session using these settings.
+        """
+        return self.mount(requests.Session())
+
+    def async_client(self, **kwargs):
+        """
+        Returns a new httpx.AsyncClient using these settings. `kwargs` are passed to the client.
+        """
+        if httpx is None:
+            raise ImportError('AsyncUnsplashAPI requires httpx. Install it with: pip install unsplashapi[async]')
+        if self.http2 and h2 is None:
+            raise ImportError('HTTP/2 requires h2. Install it with: pip install unsplashapi[http2]')
+        limits = httpx.Limits(max_connections=self.max_connections,
+                              max_keepalive_connections=self.max_connections if self.keepalive else 0,
+                              keepalive_expiry=self.keepalive_expiry)
+        transport = httpx.AsyncHTTPTransport(limits=limits, http2=self.http2, socket_options=self.socket_options())
+
+        return httpx.AsyncClient(transport=transport, **kwargs)
+
+    def __repr__(self) -> str:
+        return (f'TransportConfig(pool_maxsize={self.pool_maxsize}, max_connections={self.max_connections}, '
+                f'keepalive={self.keepalive}, http2={self.http2})')
+
+
+class _TimedConnection:
+    """
+    Reports the connect time (incl. name resolution and TLS) and the time to first byte
+    of a connection to the current metrics.sync_trace.
+    """
+
+    def connect(self) -> None:
+        started = time.perf_counter()
+        super().connect()
+        record_timing('connect', started)
+
+    def getresponse(self, *args, **kwargs):
+        response = super().getresponse(*args, **kwargs)
+        record_timing('ttfb')
+
+        return response
+
+
+class _TimedHTTPConnection(_TimedConnection, HTTPConnection):
+    pass
+
+
+class _TimedHTTPSConnection(_TimedConnection, HTTPSConnection):
+    pass
+
+
+class _TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _TimedHTTPConnection
+
+
+class _TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = _TimedHTTPSConnection
+
+
+class TransportAdapter(HTTPAdapter):
+    """
+    HTTPAdapter with the pool sizes and socket options of a TransportConfig. Its connections
+    report their connect time and time to first byte to the instrumentation.
+    """
+
+    __attrs__ = HTTPAdapter.__attrs__ + ['transport']
+
+    def __init__(self, transport: TransportConfig) -> None:
+        self.transport = transport
+        super().__init__(pool_connections=transport.pool_connections, pool_maxsize=transport.pool_maxsize,
+                         pool_block=transport.pool_block)
+
+    def init_poolmanager(self, *args, **kwargs) -> None:
+        kwargs['socket_options'] = self.transport.socket_options()
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {'http': _TimedHTTPConnectionPool,
+                                                   'https': _TimedHTTPSConnectionPool}
@@ -1,4 +1,3 @@
-import requests
 from .base import UnsplashBase
 
 
@@ -7,143 +6,273 @@ class UnsplashUsers(UnsplashBase):
     Wraps the API methods of Users
     see here: https://unsplash.com/documentation#users
     """
-    def __init__(self, access_key: str):
+    def __init__(self, access_key: str, **kwargs):
         """
         Args:
             access_key (str):        Access key of the API.
         """
-        super().__init__(access_key=access_key)
-        self.access_key = access_key
+        super().__init__(access_key=access_key, **kwargs)
 
-    def get_current_user(self) -> dict:
+    def get_current_user(self, fields: list = None) -> dict:
         """
         Retrieve public details on a given user.
 
+        Args:
+            fields (list, optional): Dotted paths each record is cut down to, e.g. ['id', 'urls.small'].
+                                     Defaults to None (whole records).
+
         Raises:
-            Exception: Excepion
+            UnsplashHTTPError: If the response status is not 2xx.
 
         Returns:
             Dictionary:     Dict with profile contents.
         """
-        endpoint = self.base_url + '/me'
-        response = self.session.get(endpoint,
-                                    params=dict(client_id=self.access_key))
-        if not response.status_code == 200:
-            raise Exception(f'Not able to extract content. Code - {response.status_code}')
+        return self._get('/me', fields=fields)
 
-        return response.json()
-
-    def get_user_profile(self, username: str) -> dict:
+    def get_user_profile(self, username: str, fields: list = None) -> dict:
         """
         Retrieve public details on a given user.
 
         Args:
             username (str):   Username 
+            fields (list, optional): Dotted paths each record is cut down to, e.g. ['id', 'urls.small'].
+                                     Defaults to None (whole records).
 
         Raises:
-            Exception: Exception
+            UnsplashHTTPError: If the response status is not 2xx.
 
         Returns:
             Dict:  Dict containing profile elements
         """
-        endpoint = self.base_url + f'/users/{username}'
-        response = self.session.get(endpoint,
-                                    params=dict(client_id=self.access_key))
-        if not response.status_code == 200:
-            raise Exception(f'Not able to extract content. Code - {response.status_code}')
-
-        return response.json()
+        return self._get(f'/users/{username}', fields=fields)
 
-    def get_user_portfolio_link(self, username: str) -> dict:
+    def get_user_portfolio_link(self, username: str, fields: list = None) -> dict:
         """
         Retrieve a single user’s portfolio link.
         see here: https://unsplash.com/documentation#get-a-users-portfolio-link
 
         Args:
             username (str):  Name of the user
+            fields (list, optional): Dotted paths each record is cut down to, e.g. ['id', 'urls.small'].
+                                     Defaults to None (whole records).
 
         Raises:
-            Exception: Exception
+            UnsplashHTTPError: If the response status is not 2xx.
 
         Returns:
             dict:               dict containing portfolio link.
         """
-        endpoint = self.base_url + f'/users/{username}/portfolio'
-        response = self.session.get(endpoint,
-                                    params=dict(client_id=self.access_key))
-        if not response.status_code == 200:
-            raise Exception(f'Not able to extract content. Code - {response.status_code}')
+        return self._get(f'/users/{username}/portfolio', fields=fields)
 
-        return response.json()
-
-    def list_user_photos(self, username: str) -> dict:
+    def list_user_photos(self, username: str, page: int = 1, items_per_page: int = 10, fields: list = None,
+                         **kwargs) -> list:
         """
-        Get a list of photos uploaded by a user.
+        Get a page of the photos uploaded by a user.
         see here: https://unsplash.com/documentation#list-a-users-photos
 
         Args:
             username (str):     Name of the user
+            page (int, optional):           Page to retrieve. Defaults to 1.
+            items_per_page (int, optional): Number of items per page (max. 30). Defaults to 10.
+            fields (list, optional):        Dotted paths each record is cut down to, e.g. ['id', 'urls.small'].
+                                            Defaults to None (whole records).
+            **kwargs:
+                    order_by: How to sort the photos (latest, oldest, popular, views, downloads). Defaults to latest.
+                    stats: Show the stats for each photo. Defaults to False.
+                    resolution: Frequency of the stats (days). Defaults to days.
+                    quantity: Number of days of stats. Defaults to 30.
+                    orientation: Filter by photo orientation (landscape, portrait, squarish).
 
         Raises:
-            Exception: Exception
+            UnsplashHTTPError: If the response status is not 2xx.
 
         Returns:
-            dict:               dict containing all photos of a user.
+            list:               Photos of the user.
         """
-        endpoint = self.base_url + f'/users/{username}/photos'
-        response = self.session.get(endpoint,
-                                    params=dict(client_id=self.access_key))
-        if not response.status_code == 200:
-            raise Exception(f'Not able to extract content. Code - {response.status_code}')
-
-        return response.json()
+        return self._get(f'/users/{username}/photos', page=page, per_page=items_per_page, fields=fields, **kwargs)
 
-    def list_user_liked_photos(self, username: str) -> dict:
+    def list_user_liked_photos(self, username: str, page: int = 1, items_per_page: int = 10, fields: list = None,
+                               **kwargs) -> list:
         """
-        Get a list of photos liked by a user.
+        Get a page of the photos liked by a user.
         see here: https://unsplash.com/documentation#list-a-users-liked-photos
 
         Args:
             username (str):     Name of the user
+            page (int, optional):           Page to retrieve. Defaults to 1.
+            items_per_page (int, optional): Number of items per page (max. 30). Defaults to 10.
+            fields (list, optional):        Dotted paths each record is cut down to, e.g. ['id', 'urls.small'].
+                                            Defaults to None (whole records).
+            **kwargs:
+                    order_by: How to sort the photos (latest, oldest, popular). Defaults to latest.
+                    orientation: Filter by photo orientation (landscape, portrait, squarish).
 
         Raises:
-            Exception: Exception
+            UnsplashHTTPError: If the response status is not 2xx.
 
         Returns:
-            dict:               Liked photos of the user.
+            list:               Liked photos of the user.
         """
-        endpoint = self.base_url + f'/users/{username}/likes'
-        response = self.session.get(endpoint,
-                                    params=dict(client_id=self.access_key))
-        if not response.status_code == 200:
-            raise Exception(f'Not able to extract content. Code - {response.status_code}')
-
-        return response.json()
+        return self._get(f'/users/{username}/likes', page=page, per_page=items_per_page, fields=fields, **kwargs)
 
-    def list_user_liked_collections(self, username: str) -> dict:
+    def list_user_liked_collections(self, username: str, page: int = 1, items_per_page: int = 10,
+                                    fields: list = None) -> list:
         """
-        Get a list of collections created by the user.
-        see here; https://unsplash.com/documentation#list-a-users-collections
+        Get a page of the collections created by the user.
+        see here: https://unsplash.com/documentation#list-a-users-collections
 
         Args:
             username (str):     Name of the user
+            page (int, optional):           Page to retrieve. Defaults to 1.
+            items_per_page (int, optional): Number of items per page (max. 30). Defaults to 10.
+            fields (list, optional):        Dotted paths each record is cut down to, e.g. ['id', 'urls.small'].
+                                            Defaults to None (whole records).
 
         Raises:
-            Exception: Exceptino
+            UnsplashHTTPError: If the response status is not 2xx.
 
         Returns:
-            dict:               Liked collections
+            list:               Collections of the user.
         """
+        return self._get(f'/users/{username}/collections', page=page, per_page=items_per_page, fields=fields)
 
-        endpoint = self.base_url + f'/users/{username}/collections'
-        response = self.session.get(endpoint,
-                                    params=dict(client_id=self.access_key))
-        if not response.status_code == 200:
-            raise Exception(f'Not able to extract content. Code - {response.status_code}')
+    def list_user_photos_paginate(self, username: str, page_limit: int = 10, items_per_page: int = 30,
+                                  fields: list = None, **kwargs):
+        """
+        Get multiple pages of the photos uploaded by a user. Following pages are prefetched in parallel.
+        see here: https://unsplash.com/documentation#list-a-users-photos
+
+        Args:
+            username (str):                 Name of the user
+            page_limit (int, optional):     Maximum number of pages. Defaults to 10.
+            items_per_page (int, optional): Number of items per page (max. 30). Defaults to 30.
+            **kwargs:
+                    order_by: How to sort the photos (latest, oldest, popular, views, downloads). Defaults to latest.
+                    stats: Show the stats for each photo. Defaults to False.
+                    resolution: Frequency of the stats (days). Defaults to days.
+                    quantity: Number of days of stats. Defaults to 30.
+                    orientation: Filter by photo orientation (landscape, portrait, squarish).
+            fields (list, optional):        Dotted paths each record is cut down to, e.g. ['id', 'urls.small'].
+                                            Defaults to None (whole records).
 
-        return response.json()
+        Raises:
+            UnsplashHTTPError: If the response status is not 2xx.
 
-    def get_user_statistics(self, username: str) -> dict:
+        Yields:
+            List of the items of a page.
+        """
+        return self._paginate(f'/users/{username}/photos', page_limit, per_page=items_per_page, fields=fields,
+                              **kwargs)
+
+    def iter_user_photos(self, username: str, max_items: int = None, items_per_page: int = 30, fields: list = None,
+                         **kwargs):
+        """
+        Iterates over the single photos uploaded by a user. Stops requesting pages
+        as soon as `max_items` items were produced.
+        see here: https://unsplash.com/documentation#list-a-users-photos
+
+        Args:
+            username (str):                 Name of the user
+            max_items (int, optional):      Maximum number of items. Defaults to None (all items).
+            items_per_page (int, optional): Number of items per request (max. 30). Defaults to 30.
+            **kwargs:                       see list_user_photos_paginate
+            fields (list, optional):        Dotted paths each record is cut down to, e.g. ['id', 'urls.small'].
+                                            Defaults to None (whole records).
+
+        Yields:
+            Dictionary of a single item.
+        """
+        return self._iter_items(f'/users/{username}/photos', max_items=max_items, per_page=items_per_page,
+                                fields=fields, **kwargs)
+
+    def list_user_liked_photos_paginate(self, username: str, page_limit: int = 10, items_per_page: int = 30,
+                                        fields: list = None, **kwargs):
+        """
+        Get multiple pages of the photos liked by a user. Following pages are prefetched in parallel.
+        see here: https://unsplash.com/documentation#list-a-users-liked-photos
+
+        Args:
+            username (str):                 Name of the user
+            page_limit (int, optional):     Maximum number of pages. Defaults to 10.
+            items_per_page (int, optional): Number of items per page (max. 30). Defaults to 30.
+            **kwargs:
+                    order_by: How to sort the photos (latest, oldest, popular). Defaults to latest.
+                    orientation: Filter by photo orientation (landscape, portrait, squarish).
+            fields (list, optional):        Dotted paths each record is cut down to, e.g. ['id', 'urls.small'].
+                                            Defaults to None (whole records).
+
+        Raises:
+            UnsplashHTTPError: If the response status is not 2xx.
+
+        Yields:
+            List of the items of a page.
+        """
+        return self._paginate(f'/users/{username}/likes', page_limit, per_page=items_per_page, fields=fields,
+                              **kwargs)
+
+    def iter_user_liked_photos(self, username: str, max_items: int = None, items_per_page: int = 30,
+                               fields: list = None, **kwargs):
+        """
+        Iterates over the single photos liked by a user. Stops requesting pages
+        as soon as `max_items` items were produced.
+        see here: https://unsplash.com/documentation#list-a-users-liked-photos
+
+        Args:
+            username (str):                 Name of the user
+            max_items (int, optional):      Maximum number of items. Defaults to None (all items).
+            items_per_page (int, optional): Number of items per request (max. 30). Defaults to 30.
+            **kwargs:                       see list_user_liked_photos_paginate
+            fields (list, optional):        Dotted paths each record is cut down to, e.g. ['id', 'urls.small'].
+                                            Defaults to None (whole records).
+
+        Yields:
+            Dictionary of a single item.
+        """
+        return self._iter_items(f'/users/{username}/likes', max_items=max_items, per_page=items_per_page,
+                                fields=fields, **kwargs)
+
+    def list_user_liked_collections_paginate(self, username: str, page_limit: int = 10, items_per_page: int = 30,
+                                             fields: list = None):
+        """
+        Get multiple pages of the collections created by a user. Following pages are prefetched in parallel.
+        see here: https://unsplash.com/documentation#list-a-users-collections
+
+        Args:
+            username (str):                 Name of the user
+            page_limit (int, optional):     Maximum number of pages. Defaults to 10.
+            items_per_page (int, optional): Number of items per page (max. 30). Defaults to 30.
+            fields (list, optional):        Dotted paths each record is cut down to, e.g. ['id', 'urls.small'].
+                                            Defaults to None (whole records).
+
+        Raises:
+            UnsplashHTTPError: If the response status is not 2xx.
+
+        Yields:
+            List of the items of a page.
+        """
+        return self._paginate(f'/users/{username}/collections', page_limit, per_page=items_per_page, fields=fields)
+
+    def iter_user_liked_collections(self, username: str, max_items: int = None, items_per_page: int = 30,
+                                    fields: list = None):
+        """
+        Iterates over the single collections created by a user. Stops requesting pages
+        as soon as `max_items` items were produced.
+        see here: https://unsplash.com/documentation#list-a-users-collections
+
+        Args:
+            username (str):                 Name of the user
+            max_items (int, optional):      Maximum number of items. Defaults to None (all items).
+            items_per_page (int, optional): Number of items per request (max. 30). Defaults to 30.
+            fields (list, optional):        Dotted paths each record is cut down to, e.g. ['id', 'urls.small'].
+                                            Defaults to None (whole records).
+
+        Yields:
+            Dictionary of a single item.
+        """
+        return self._iter_items(f'/users/{username}/collections', max_items=max_items, per_page=items_per_page,
+                                fields=fields)
+
+    def get_user_statistics(self, username: str, fields: list = None) -> dict:
         """
         Retrieve the consolidated number of downloads, views and likes of all user’s photos, 
         as well as the historical breakdown and average of these stats in a specific timeframe (default is 30 days).
@@ -151,20 +280,16 @@ class UnsplashUsers(UnsplashBase):
 
         Args:
             username (str):         Name of user
+            fields (list, optional): Dotted paths each record is cut down to, e.g. ['id', 'urls.small'].
+                                     Defaults to None (whole records).
 
         Raises:
-            Exception: Exception
+            UnsplashHTTPError: If the response status is not 2xx.
 
         Returns:
             dict:                   User stats
         """
-        endpoint = self.base_url + f'/users/{username}/statistics'
-        response = self.session.get(endpoint,
-                                    params=dict(client_id=self.access_key))
-        if not response.status_code == 200:
-            raise Exception(f'Not able to extract content. Code - {response.status_code}')
-
-        return response.json()
+        return self._get(f'/users/{username}/statistics', fields=fields)
 
 
 